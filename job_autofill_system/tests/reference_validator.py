@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Reference Validator
+The interpreted section checks CompiledSchema replaced, kept to test that
+compiled validation still produces the same messages
+"""
+
+import os
+import re
+import sys
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from data_validator import ProfileDataValidator
+
+
+class ReferenceValidator(ProfileDataValidator):
+    """ProfileDataValidator with the original interpreted checks"""
+
+    def validate_interpreted(self, profile_data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+        """Walk required_fields on every call, as the validator did before compilation"""
+        self.errors.clear()
+        self.warnings.clear()
+        
+        if not isinstance(profile_data, dict):
+            self.errors.append("Profile data must be a dictionary")
+            return False, self.errors, self.warnings
+        
+        # Validate each section
+        self._validate_personal_info(profile_data.get('personalInfo', {}))
+        self._validate_work_experience(profile_data.get('workExperience', {}))
+        self._validate_education(profile_data.get('education', {}))
+        self._validate_skills(profile_data.get('skills', {}))
+        
+        # Check for unknown sections
+        known_sections = {'personalInfo', 'workExperience', 'education', 'skills', 'metadata'}
+        unknown_sections = set(profile_data.keys()) - known_sections
+        if unknown_sections:
+            self.warnings.append(f"Unknown sections found: {', '.join(unknown_sections)}")
+        
+        return len(self.errors) == 0, self.errors, self.warnings
+
+    def _validate_personal_info(self, personal_info: Dict[str, Any]):
+        """Validate personal information section"""
+        if not personal_info:
+            self.errors.append("Personal information section is required")
+            return
+        
+        # Check required fields
+        for field in self.required_fields['personalInfo']['required']:
+            if field not in personal_info or not personal_info[field]:
+                self.errors.append(f"Personal info: {field} is required")
+        
+        # Validate email format
+        email = personal_info.get('email', '')
+        if email and not self.patterns['email'].match(email):
+            self.errors.append(f"Personal info: Invalid email format: {email}")
+        
+        # Validate phone format
+        phone = personal_info.get('phone', '')
+        if phone:
+            # Clean phone number for validation
+            clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+            if not self.patterns['phone'].match(clean_phone):
+                self.warnings.append(f"Personal info: Phone number format may be invalid: {phone}")
+        
+        # Validate URLs
+        for url_field in ['linkedin', 'website']:
+            url = personal_info.get(url_field, '')
+            if url and not self.patterns['url'].match(url):
+                self.errors.append(f"Personal info: Invalid {url_field} URL format: {url}")
+        
+        # Validate address structure
+        address = personal_info.get('address', {})
+        if address and isinstance(address, dict):
+            if 'street' in address and not address['street']:
+                self.warnings.append("Personal info: Address street is empty")
+
+    def _validate_work_experience(self, work_experience: Dict[str, Any]):
+        """Validate work experience section"""
+        if not work_experience:
+            self.warnings.append("Work experience section is empty")
+            return
+        
+        positions = work_experience.get('positions', [])
+        if not positions:
+            self.warnings.append("No work positions found")
+            return
+        
+        if not isinstance(positions, list):
+            self.errors.append("Work experience positions must be a list")
+            return
+        
+        for i, position in enumerate(positions):
+            if not isinstance(position, dict):
+                self.errors.append(f"Position {i+1}: Must be a dictionary")
+                continue
+            
+            # Check required fields
+            for field in self.required_fields['workExperience']['position_required']:
+                if field not in position or not position[field]:
+                    self.errors.append(f"Position {i+1}: {field} is required")
+            
+            # Validate dates
+            start_date = position.get('startDate', '')
+            end_date = position.get('endDate', '')
+            
+            if start_date and not self.patterns['date'].match(start_date):
+                self.errors.append(f"Position {i+1}: Invalid start date format: {start_date}")
+            
+            if end_date and not self.patterns['date'].match(end_date):
+                self.errors.append(f"Position {i+1}: Invalid end date format: {end_date}")
+            
+            # Check date logic
+            if (start_date and end_date and 
+                not end_date.lower() in ['present', 'current'] and
+                start_date > end_date):
+                self.warnings.append(f"Position {i+1}: Start date is after end date")
+
+    def _validate_education(self, education: Dict[str, Any]):
+        """Validate education section"""
+        if not education:
+            self.warnings.append("Education section is empty")
+            return
+        
+        schools = education.get('schools', [])
+        if not schools:
+            self.warnings.append("No educational institutions found")
+            return
+        
+        if not isinstance(schools, list):
+            self.errors.append("Education schools must be a list")
+            return
+        
+        for i, school in enumerate(schools):
+            if not isinstance(school, dict):
+                self.errors.append(f"School {i+1}: Must be a dictionary")
+                continue
+            
+            # Check required fields
+            for field in self.required_fields['education']['school_required']:
+                if field not in school or not school[field]:
+                    self.errors.append(f"School {i+1}: {field} is required")
+            
+            # Validate graduation date
+            grad_date = school.get('graduationDate', '')
+            if grad_date and not self.patterns['date'].match(grad_date):
+                self.errors.append(f"School {i+1}: Invalid graduation date format: {grad_date}")
+            
+            # Validate GPA
+            gpa = school.get('gpa', '')
+            if gpa:
+                try:
+                    gpa_float = float(gpa)
+                    if gpa_float < 0 or gpa_float > 4.0:
+                        self.warnings.append(f"School {i+1}: GPA {gpa} seems unusual (expected 0-4.0)")
+                except ValueError:
+                    self.errors.append(f"School {i+1}: Invalid GPA format: {gpa}")
+
+    def _validate_skills(self, skills: Dict[str, Any]):
+        """Validate skills section"""
+        if not skills:
+            self.warnings.append("Skills section is empty")
+            return
+        
+        # Check that skills contain at least one category
+        skill_categories = ['technical', 'languages', 'certifications', 'softSkills']
+        has_skills = any(skills.get(cat) for cat in skill_categories)
+        
+        if not has_skills:
+            self.warnings.append("No skills found in any category")
+        
+        # Validate technical skills format
+        technical = skills.get('technical', [])
+        if technical and not isinstance(technical, list):
+            self.errors.append("Technical skills must be a list")
+        
+        # Validate languages format
+        languages = skills.get('languages', [])
+        if languages:
+            if not isinstance(languages, list):
+                self.errors.append("Languages must be a list")
+            else:
+                for lang in languages:
+                    if isinstance(lang, dict):
+                        if 'language' not in lang:
+                            self.warnings.append("Language entry missing 'language' field")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Benchmark Suite Tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from benchmark_suite import check_comparable, compare_results
+
+
+def run(results, filter=None, scale=1, seed=1, python='3.11.7'):
+    return {'scale': scale, 'seed': seed, 'python': python, 'platform': 'Linux', 'filter': filter,
+            'results': {name: {'bestUs': us} for name, us in results.items()}}
+
+
+class CompareResultsTest(unittest.TestCase):
+
+    BASELINE = run({'mapper.exact': 10.0, 'converter.load.json': 100.0, 'converter.load.json.gz': 150.0})
+
+    def test_missing_cases_are_reported(self):
+        _, regressions, missing = compare_results(self.BASELINE, run({'mapper.exact': 10.0}))
+        
+        self.assertEqual(regressions, [])
+        self.assertEqual(missing, ['converter.load.json', 'converter.load.json.gz'])
+
+    def test_filtered_out_cases_are_not_missing(self):
+        _, _, missing = compare_results(self.BASELINE, run({'converter.load.json': 100.0}, filter='converter'))
+        
+        self.assertEqual(missing, ['converter.load.json.gz'])
+
+    def test_different_scale_or_seed_is_refused(self):
+        with self.assertRaisesRegex(ValueError, 'scale'):
+            check_comparable(self.BASELINE, run({}, scale=4))
+        with self.assertRaisesRegex(ValueError, 'seed'):
+            check_comparable(self.BASELINE, run({}, seed=2))
+
+    def test_different_python_is_a_warning(self):
+        self.assertEqual(len(check_comparable(self.BASELINE, run({}, python='3.12.0'))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
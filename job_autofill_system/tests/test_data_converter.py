@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Data Converter Tests
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from data_converter import BinaryProfileStore, DateNormalizer, ProfileDataConverter
+
+
+class ConverterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.converter = ProfileDataConverter()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def write_jsonl(self, name, records):
+        with open(self.path(name), 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+        return self.path(name)
+
+
+class PackJsonlTest(ConverterTestCase):
+
+    def test_count_matches_readable_profiles(self):
+        source = self.write_jsonl('profiles.jsonl', [{'metadata': {'id': 'a'}}, {'metadata': {'id': 'b'}}, {}])
+        
+        count = self.converter.pack_jsonl(source, self.path('profiles.pbin'))
+        
+        with BinaryProfileStore(self.path('profiles.pbin')) as store:
+            self.assertEqual(count, len(store.ids()))
+
+    def test_duplicate_ids_are_rejected(self):
+        source = self.write_jsonl('profiles.jsonl', [{'metadata': {'id': 'a'}}, {'metadata': {'id': 'a'}}])
+        
+        with self.assertRaisesRegex(ValueError, "Duplicate record id 'a'"):
+            self.converter.pack_jsonl(source, self.path('profiles.pbin'))
+        self.assertFalse(os.path.exists(self.path('profiles.pbin')))
+
+
+
+class IngestedSourcesTest(ConverterTestCase):
+
+    def test_skips_records_without_profile_metadata(self):
+        dataset = self.write_jsonl('dataset.jsonl', [
+            {'metadata': {'sourceFile': 'a.txt'}}, [1, 2], 'text', {'metadata': 'x'},
+            {'metadata': {'sourceFile': ['b.txt']}}, {'metadata': {'sourceFile': 'c.txt'}}
+        ])
+        size = os.path.getsize(dataset)
+        
+        self.assertEqual(self.converter._ingested_sources(dataset), {'a.txt', 'c.txt'})
+        self.assertEqual(os.path.getsize(dataset), size)
+
+    def test_truncates_a_partial_last_line(self):
+        dataset = self.write_jsonl('dataset.jsonl', [{'metadata': {'sourceFile': 'a.txt'}}])
+        size = os.path.getsize(dataset)
+        with open(dataset, 'a', encoding='utf-8') as f:
+            f.write('{"metadata": {"sourc')
+        
+        self.assertEqual(self.converter._ingested_sources(dataset), {'a.txt'})
+        self.assertEqual(os.path.getsize(dataset), size)
+
+
+class ConvertDirectoryTest(ConverterTestCase):
+
+    def test_standardizes_dates_and_counts_failures(self):
+        os.mkdir(self.path('in'))
+        with open(self.path('in/a.json'), 'w', encoding='utf-8') as f:
+            json.dump({'workExperience': {'positions': [{'startDate': '01/02/2020'}]}}, f)
+        with open(self.path('in/b.json'), 'w', encoding='utf-8') as f:
+            f.write('{bad')
+        
+        report = self.converter.convert_directory(self.path('in'), self.path('out'), 'json',
+                                                  workers=1, threads=True, standardize_dates=True)
+        
+        self.assertEqual((report['succeeded'], report['failed']), (1, 1))
+        with open(self.path('out/a.json'), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['workExperience']['positions'][0]['startDate'], '2020-01-02')
+
+
+
+class DateNormalizerTest(unittest.TestCase):
+
+    FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y/%m/%d', '%B %Y', '%b %Y', '%Y']
+
+    def strptime_normalize(self, text):
+        for format_string in self.FORMATS:
+            try:
+                return datetime.strptime(text, format_string).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return text
+
+    def test_matches_strptime_on_padded_and_edge_values(self):
+        normalizer = DateNormalizer()
+        for text in ['2020-01- 5', '2020- 1-05', '2020-1-5', '2020-02-30', ' 1/ 5/2020', '13/01/2020',
+                     '2020/12/31', 'Sept 2020', 'May 2020', '2020', '20200', '2020-01-5 ']:
+            self.assertEqual(normalizer.normalize(text), self.strptime_normalize(text), repr(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
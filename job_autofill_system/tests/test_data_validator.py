@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Data Validator Tests
+"""
+
+import json
+import os
+import sys
+import unittest
+from datetime import date
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from data_validator import ProfileDataValidator, TimelineAnalyzer, ValidationSession, ValidationStats
+from reference_validator import ReferenceValidator
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates')
+
+
+class ValidationStatsPercentileTest(unittest.TestCase):
+
+    def stats(self, seconds):
+        stats = ValidationStats()
+        stats.seconds = list(seconds)
+        return stats
+
+    def test_nearest_rank_over_hundred_samples(self):
+        stats = self.stats(range(1, 101))
+        self.assertEqual(stats.percentile(0.50), 50)
+        self.assertEqual(stats.percentile(0.95), 95)
+        self.assertEqual(stats.percentile(0.99), 99)
+        self.assertEqual(stats.percentile(1.0), 100)
+
+    def test_median_of_two_samples_is_the_lower(self):
+        self.assertEqual(self.stats([2.0, 1.0]).percentile(0.50), 1.0)
+
+    def test_bounds(self):
+        stats = self.stats([3, 1, 2])
+        self.assertEqual(stats.percentile(0.0), 1)
+        self.assertEqual(stats.percentile(1.0), 3)
+        self.assertEqual(self.stats([]).percentile(0.5), 0.0)
+
+
+
+class ValidationSessionBudgetTest(unittest.TestCase):
+
+    # Errors and warnings interleave within personalInfo, workExperience and education
+    PROFILE = {
+        'personalInfo': {'firstName': 'Ada', 'email': 'not-an-email', 'phone': 'abc'},
+        'workExperience': {'positions': [
+            {'company': 'A', 'title': '', 'startDate': '2020-05-01', 'endDate': '2019-01-01'},
+            {'company': '', 'title': 'Eng', 'startDate': 'bad', 'endDate': 'present'},
+            {'title': 'X', 'startDate': '2021-01-01', 'endDate': '2020-01-01'}
+        ]},
+        'education': {'schools': [{'institution': '', 'graduationDate': 'soon'}, {'degree': 'BS'}]},
+        'skills': {},
+        'extra': 1
+    }
+
+    def test_cached_sections_honour_the_error_budget(self):
+        validator = ProfileDataValidator()
+        total = len(validator.check_profile(self.PROFILE).errors)
+        self.assertGreater(total, 3)
+        for max_errors in range(1, total + 2):
+            for skip_warnings in (False, True):
+                expected = validator.check_profile(self.PROFILE, max_errors=max_errors,
+                                                   skip_warnings=skip_warnings)
+                session = ValidationSession(validator, max_errors=max_errors, skip_warnings=skip_warnings)
+                # First call fills the section cache, the second is answered from it
+                for _ in range(2):
+                    self.assertEqual(session.check_profile(self.PROFILE), expected,
+                                     f"max_errors={max_errors} skip_warnings={skip_warnings}")
+        self.assertGreater(session.hits, 0)
+
+    def test_budget_below_one_is_rejected(self):
+        validator = ProfileDataValidator()
+        for max_errors in (0, -1):
+            with self.assertRaises(ValueError):
+                validator.check_profile(self.PROFILE, max_errors=max_errors)
+            with self.assertRaises(ValueError):
+                ValidationSession(validator, max_errors=max_errors)
+
+
+
+class CompiledSchemaTest(unittest.TestCase):
+
+    def profiles(self):
+        with open(os.path.join(TEMPLATES_DIR, 'profile_template.json'), 'r', encoding='utf-8') as f:
+            template = json.load(f)
+        return [
+            template,
+            ValidationSessionBudgetTest.PROFILE,
+            {},
+            'not a profile',
+            {'personalInfo': {'firstName': 'A', 'lastName': 'B', 'email': 'a@b.co', 'linkedin': 'x',
+                              'address': {'street': ''}},
+             'workExperience': {'positions': 'none'},
+             'education': {'schools': [{'institution': 'U', 'degree': 'BS', 'gpa': 'high'},
+                                       {'institution': 'V', 'degree': 'MS', 'gpa': 5}]},
+             'skills': {'technical': 'python', 'languages': [{'level': 'native'}]}}
+        ]
+
+    def test_messages_match_the_interpreted_checks(self):
+        validator = ProfileDataValidator()
+        reference = ReferenceValidator()
+        for profile in self.profiles():
+            expected = reference.validate_interpreted(profile)
+            is_valid, errors, warnings = validator.validate_profile(profile)
+            self.assertEqual((is_valid, list(errors), list(warnings)),
+                             (expected[0], list(expected[1]), list(expected[2])))
+
+
+class FakeDate(date):
+    current = date(2026, 10, 19)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class TimelineTodayTest(unittest.TestCase):
+
+    PROFILE = {'workExperience': {'positions': [{'startDate': '2026-11-01', 'endDate': 'present'}]}}
+
+    def test_present_follows_the_calendar(self):
+        with mock.patch('data_validator.date', FakeDate):
+            FakeDate.current = date(2026, 10, 19)
+            analyzer = TimelineAnalyzer()
+            self.assertEqual(analyzer.analyze(self.PROFILE)['impossiblePositions'], [0])
+            
+            FakeDate.current = date(2026, 11, 5)
+            self.assertEqual(analyzer.analyze(self.PROFILE)['impossiblePositions'], [])
+            self.assertEqual(analyzer.analyze_many([self.PROFILE])[0]['impossiblePositions'], [])
+
+    def test_explicit_today_stays_fixed(self):
+        analyzer = TimelineAnalyzer(today=date(2026, 10, 19))
+        
+        self.assertEqual(analyzer.analyze(self.PROFILE)['impossiblePositions'], [0])
+        self.assertEqual(analyzer.analyze_many([self.PROFILE])[0]['impossiblePositions'], [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
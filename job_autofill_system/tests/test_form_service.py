@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Form Service Tests
+"""
+
+import os
+import socket
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from form_service import FormServiceClient, start_background_server
+
+
+class FormServiceTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = start_background_server()
+
+    def raw_status(self, content_length):
+        with socket.create_connection(('127.0.0.1', self.server.port), timeout=5) as sock:
+            sock.sendall(f"POST /v1/forms/plan HTTP/1.1\r\nHost: localhost\r\n"
+                         f"Content-Length: {content_length}\r\n\r\n".encode('ascii'))
+            return sock.recv(4096).split(b' ', 2)[1]
+
+    def test_invalid_content_length_is_a_bad_request(self):
+        for content_length in ('abc', '-5', '1e3'):
+            self.assertEqual(self.raw_status(content_length), b'400', content_length)
+
+    def test_profile_sections_of_the_wrong_type_fill_nothing(self):
+        client = FormServiceClient(port=self.server.port)
+        try:
+            plan = client.plan([{'name': 'full_name'}, {'name': 'certifications'}],
+                               {'personalInfo': 'x', 'skills': {'certifications': {'name': 'AWS'}}})
+        finally:
+            client.close()
+        
+        self.assertEqual([field['value'] for field in plan['fields']], [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
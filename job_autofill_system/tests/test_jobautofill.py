@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Unified Command Line Tests
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools')
+sys.path.insert(0, TOOLS_DIR)
+
+from jobautofill import STARTUP_BUDGET_MS
+
+# Run in a fresh interpreter: prints the import time in ms, then any tool modules it loaded
+IMPORT_PROBE = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import jobautofill
+print((time.perf_counter() - start) * 1000)
+print(*[module for module, _ in jobautofill.COMMANDS.values() if module in sys.modules])
+"""
+
+
+def probe_import():
+    output = subprocess.run([sys.executable, '-c', IMPORT_PROBE, TOOLS_DIR], check=True,
+                            capture_output=True, text=True).stdout.splitlines()
+    return float(output[0]), output[1].split() if len(output) > 1 else []
+
+
+class StartupBudgetTest(unittest.TestCase):
+
+    def test_import_loads_no_tool_modules(self):
+        _, eager = probe_import()
+        
+        self.assertEqual(eager, [])
+
+    def test_import_within_startup_budget(self):
+        best = min(probe_import()[0] for _ in range(3))
+        
+        self.assertLess(best, STARTUP_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Mapping Evaluation Tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from field_mapper import CONFIDENCE_WEIGHTS
+from mapping_evaluation import EvaluationMapper, confidence_sweep, pareto_front
+
+
+def config(name, precision, recall, mean_us):
+    return {'backend': name, 'threshold': None, 'precision': precision, 'recall': recall, 'meanUs': mean_us}
+
+
+class ParetoFrontTest(unittest.TestCase):
+
+    def test_latencies_within_tolerance_tie(self):
+        slower_but_accurate = config('a', 1.0, 0.9, 105.0)
+        faster = config('b', 1.0, 0.8, 100.0)
+        
+        front = pareto_front([slower_but_accurate, faster], tolerance=0.1)
+        
+        self.assertEqual(front, [slower_but_accurate])
+
+    def test_clearly_faster_configuration_stays_on_front(self):
+        slower_but_accurate = config('a', 1.0, 0.9, 150.0)
+        faster = config('b', 1.0, 0.8, 100.0)
+        
+        front = pareto_front([slower_but_accurate, faster], tolerance=0.1)
+        
+        self.assertEqual(front, [faster, slower_but_accurate])
+
+
+class ConfidenceSweepTest(unittest.TestCase):
+
+    FIELDS = [
+        {'name': 'first_name', 'expected': 'firstName'},
+        {'name': 'frst_nme', 'expected': 'firstName'},
+        {'name': 'favourite_colour', 'expected': None}
+    ]
+
+    def test_rescoring_leaves_mapper_weights_unchanged(self):
+        mapper = EvaluationMapper()
+        
+        results = confidence_sweep(mapper, self.FIELDS, [tuple(CONFIDENCE_WEIGHTS.values())], [0.0])
+        
+        self.assertEqual(mapper.confidence_weights, CONFIDENCE_WEIGHTS)
+        self.assertEqual(results[0]['accepted'], 2)
+        self.assertEqual(results[0]['recall'], 1.0)
+
+    def test_cutoff_trades_recall_for_precision(self):
+        results = confidence_sweep(EvaluationMapper(), self.FIELDS, [(0.8, 0.6, 0.2)], [0.0, 0.8])
+        
+        self.assertEqual([result['accepted'] for result in results], [2, 1])
+        self.assertEqual([result['recall'] for result in results], [1.0, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Profile Pipeline Tests
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from profile_pipeline import ProfilePipeline
+
+
+class RunManyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.directory, 'profile.json')
+        with open(self.input_file, 'w', encoding='utf-8') as f:
+            json.dump({'personalInfo': {'firstName': 'Ada'}}, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_unwritable_output_counts_as_failed(self):
+        output_dir = os.path.join(self.directory, 'out')
+        # A directory where the csv output should go makes that save fail
+        os.makedirs(os.path.join(output_dir, 'profile.csv'))
+        
+        summary = ProfilePipeline(output_formats=['json', 'csv']).run_many([self.input_file], output_dir)
+        
+        result = summary['results'][0]
+        self.assertIsNone(result['error'])
+        self.assertIsNone(result['outputs']['csv'])
+        self.assertEqual(summary['failed'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
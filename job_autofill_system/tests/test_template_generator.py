@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Template Generator Tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+from template_generator import ProfileTemplateGenerator
+
+
+def without_created_date(template):
+    template['metadata'].pop('createdDate', None)
+    return template
+
+
+class TemplateCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.generator = ProfileTemplateGenerator()
+        self.generator.clear_cache()
+
+    def test_returned_copies_do_not_share_cached_state(self):
+        first = self.generator.generate_template('comprehensive', 'software_engineering', True)
+        expected = without_created_date(
+            self.generator.generate_template('comprehensive', 'software_engineering', True))
+        
+        first['personalInfo']['firstName'] = 'changed'
+        first['skills']['technical'].append('changed')
+        first['workExperience']['positions'].clear()
+        first.clear()
+        
+        again = without_created_date(
+            self.generator.generate_template('comprehensive', 'software_engineering', True))
+        self.assertEqual(again, expected)
+        self.assertIsNot(again, expected)
+        self.assertIsNot(again['skills']['technical'], expected['skills']['technical'])
+
+    def test_cached_copy_matches_an_uncached_build(self):
+        cached = self.generator.generate_template('standard', 'finance', False)
+        built = self.generator._build_template('standard', 'finance', False)
+        self.assertEqual(without_created_date(cached), without_created_date(built))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Archive I/O
+Transparent streaming access to gzip, bz2 and lzma compressed files
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from typing import Iterator, Optional, Tuple
+
+from mapped_file import MappedFile
+
+
+# Extension and magic-byte signatures for supported compression formats
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'lzma',
+    '.lzma': 'lzma'
+}
+
+COMPRESSION_MAGIC = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'lzma')
+]
+
+OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'lzma': lzma.open
+}
+
+# Decompressed bytes buffered per read from a compressed stream
+CHUNK_SIZE = 1 << 20
+
+
+def strip_compression_extension(filename: str) -> str:
+    """Return filename without a trailing compression extension"""
+    root, extension = os.path.splitext(filename)
+    if extension.lower() in COMPRESSION_EXTENSIONS:
+        return root
+    return filename
+
+
+def detect_compression(filename: str, mode: str = 'r') -> Optional[str]:
+    """
+    Detect the compression format of a file
+    
+    Existing files opened for reading are identified by their magic bytes,
+    so misnamed archives still work; otherwise the extension decides.
+    
+    Returns:
+        'gzip', 'bz2', 'lzma' or None for uncompressed files
+    """
+    if 'r' in mode and os.path.isfile(filename):
+        with open(filename, 'rb') as f:
+            head = f.read(6)
+        for magic, compression in COMPRESSION_MAGIC:
+            if head.startswith(magic):
+                return compression
+        return None
+    
+    extension = os.path.splitext(filename)[1].lower()
+    return COMPRESSION_EXTENSIONS.get(extension)
+
+
+def open_text(filename: str, mode: str = 'r', encoding: str = 'utf-8', newline: str = None):
+    """Open a possibly compressed file as a text stream
+    
+    Compressed data is decompressed or compressed incrementally as the
+    stream is read or written; nothing is expanded on disk.
+    """
+    compression = detect_compression(filename, mode)
+    if compression is None:
+        return open(filename, mode, encoding=encoding, newline=newline)
+    
+    binary = OPENERS[compression](filename, mode.replace('t', '') + 'b')
+    if 'r' in mode:
+        binary = io.BufferedReader(binary, buffer_size=CHUNK_SIZE)
+    else:
+        binary = io.BufferedWriter(binary, buffer_size=CHUNK_SIZE)
+    return io.TextIOWrapper(binary, encoding=encoding, newline=newline)
+
+
+def open_binary(filename: str, mode: str = 'rb'):
+    """Open a possibly compressed file for buffered reading or writing of its uncompressed bytes"""
+    compression = detect_compression(filename, mode)
+    if compression is None:
+        return open(filename, mode, buffering=CHUNK_SIZE)
+    
+    binary = OPENERS[compression](filename, mode)
+    if 'r' in mode:
+        return io.BufferedReader(binary, buffer_size=CHUNK_SIZE)
+    return io.BufferedWriter(binary, buffer_size=CHUNK_SIZE)
+
+
+def iter_records(filename: str, encoding: str = 'utf-8') -> Iterator[Tuple[int, str]]:
+    """
+    Yield (byte_offset, text) for each non-blank line of a dataset file
+    
+    Plain files are memory-mapped; compressed files are decompressed as a
+    stream. Offsets always refer to the uncompressed data.
+    """
+    compression = detect_compression(filename)
+    if compression is None:
+        with MappedFile(filename) as mapped:
+            yield from mapped.iter_records(encoding)
+        return
+    
+    with OPENERS[compression](filename, 'rb') as raw:
+        stream = io.BufferedReader(raw, buffer_size=CHUNK_SIZE)
+        offset = 0
+        for line in stream:
+            if line.strip():
+                yield offset, line.decode(encoding).rstrip('\r\n')
+            offset += len(line)
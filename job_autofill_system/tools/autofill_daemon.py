@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Autofill Daemon
+Long-running local service keeping warm tool instances behind a Unix socket
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import selectors
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from data_converter import ProfileDataConverter
+from data_validator import ProfileDataValidator
+from field_mapper import FormFieldMapper
+from latency_stats import LatencyStats
+from template_generator import ProfileTemplateGenerator
+
+# Longest request or response line accepted (profiles and templates can be large)
+MAX_LINE_BYTES = 64 << 20
+
+# Bytes a client sends or receives per socket call
+CLIENT_CHUNK_BYTES = 1 << 20
+
+
+def default_socket_path() -> str:
+    """
+    Per-user socket path, overridable with JOBAUTOFILL_SOCKET
+    
+    The socket lives in $XDG_RUNTIME_DIR, or else in a jobautofill-<uid>
+    directory under the temp dir. Either directory must belong to this user
+    and be closed to everyone else, so no other user can plant a socket there.
+    """
+    path = os.environ.get('JOBAUTOFILL_SOCKET')
+    if path:
+        return path
+    
+    directory = os.environ.get('XDG_RUNTIME_DIR')
+    if not directory or not os.path.isdir(directory):
+        directory = os.path.join(tempfile.gettempdir(), f"jobautofill-{os.getuid()}")
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+    check_private_directory(directory)
+    return os.path.join(directory, 'jobautofill.sock')
+
+
+def check_private_directory(directory: str):
+    """Raise PermissionError unless directory is a real directory only this user can use"""
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory owned by uid {os.getuid()} "
+                              "with no group or other permissions")
+
+
+class AutofillService:
+    """
+    Warm mapper, validator, converter and generator instances behind named endpoints
+    
+    Each endpoint takes the keyword arguments of the method it wraps, so a
+    request's params mirror the Python API (e.g. map.field takes field_name
+    and field_attributes).
+    """
+
+    def __init__(self):
+        self.mapper = FormFieldMapper()
+        self.validator = ProfileDataValidator()
+        self.converter = ProfileDataConverter()
+        self.generator = ProfileTemplateGenerator()
+        self.started = time.time()
+        self.stats = {}
+        self.endpoints = {
+            'map.field': self.mapper.map_field_to_profile,
+            'map.analyze': self.mapper.analyze_form_fields,
+            'map.validate_value': self.validate_value,
+            'validate.profile': self.validate_profile,
+            'validate.file': self.validate_file,
+            'validate.timeline': self.validator.analyze_timeline,
+            'convert.file': self.converter.convert_format,
+            'convert.standardize_dates': self.converter.standardize_dates,
+            'template.generate': self.generator.generate_template,
+            'template.options': self.generator.list_available_options,
+            'daemon.ping': self.ping,
+            'daemon.stats': self.summary
+        }
+
+    def call(self, method: str, params: Dict[str, Any] = None) -> Any:
+        """
+        Run one endpoint, recording its latency
+        
+        Raises:
+            KeyError: Unknown method
+            Exception: Whatever the endpoint raised
+        """
+        handler = self.endpoints.get(method)
+        if handler is None:
+            raise KeyError(f"Unknown method: {method}")
+        
+        stats = self.stats.get(method)
+        if stats is None:
+            stats = self.stats[method] = LatencyStats()
+        
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = handler(**(params or {}))
+            failed = False
+            return result
+        finally:
+            stats.record(time.perf_counter() - start, failed)
+
+    def handle(self, request: Any) -> Dict[str, Any]:
+        """Turn one request object into a response object, never raising"""
+        if not isinstance(request, dict):
+            return self.error_response(None, TypeError("Request must be a JSON object"))
+        
+        request_id = request.get('id')
+        params = request.get('params') or {}
+        if not isinstance(params, dict):
+            return self.error_response(request_id, TypeError("params must be a JSON object"))
+        try:
+            return {'id': request_id, 'result': self.call(request.get('method'), params)}
+        except Exception as e:
+            return self.error_response(request_id, e)
+
+    @staticmethod
+    def error_response(request_id: Any, error: Exception) -> Dict[str, Any]:
+        message = error.args[0] if isinstance(error, KeyError) and error.args else str(error)
+        return {'id': request_id, 'error': {'type': type(error).__name__, 'message': message}}
+
+    def validate_value(self, field_name: str, value: str) -> Dict[str, Any]:
+        is_valid, error = self.mapper.validate_field_value(field_name, value)
+        return {'valid': is_valid, 'error': error}
+
+    def validate_profile(self, profile_data: Dict[str, Any], timeline: bool = False,
+                         **options) -> Dict[str, Any]:
+        result = self.validator.check_profile(profile_data, **options)
+        warnings = list(result.warnings)
+        if timeline:
+            warnings.extend(self.validator.analyze_timeline(profile_data)['warnings'])
+        return {'isValid': result.is_valid, 'errors': list(result.errors), 'warnings': warnings}
+
+    def validate_file(self, file_path: str, timeline: bool = False, **options) -> Dict[str, Any]:
+        is_valid, errors, warnings = self.validator.validate_file(file_path, timeline, **options)
+        return {'isValid': is_valid, 'errors': list(errors), 'warnings': list(warnings)}
+
+    def ping(self) -> Dict[str, Any]:
+        return {'pid': os.getpid(), 'uptimeSeconds': round(time.time() - self.started, 3)}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint latency statistics"""
+        return {method: stats.summary() for method, stats in sorted(self.stats.items())}
+
+
+class AutofillDaemon:
+    """
+    asyncio server speaking line-delimited JSON over a Unix domain socket
+    
+    Each line holds one request {"id", "method", "params"} or a JSON array
+    of them (a batch), and gets exactly one response line back: a response
+    {"id", "result"} / {"id", "error"}, or an array of responses in request
+    order. Clients may pipeline any number of lines without waiting;
+    responses on a connection always come back in order.
+    
+    Endpoints run on the event loop, so one long conversion delays the
+    requests queued behind it.
+    """
+
+    def __init__(self, socket_path: str = None, service: AutofillService = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.service = service or AutofillService()
+        self.service.endpoints['daemon.shutdown'] = self.shutdown
+        self.connections = 0
+        self._stopping = None
+
+    async def serve(self):
+        """Listen until a daemon.shutdown request arrives"""
+        self._claim_socket()
+        self._stopping = asyncio.Event()
+        # Create the socket owner-only from the start rather than chmod it after bind
+        previous_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path,
+                                                     limit=MAX_LINE_BYTES)
+        finally:
+            os.umask(previous_umask)
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self) -> bool:
+        """Stop serving once the current responses are written"""
+        self._stopping.set()
+        return True
+
+    def _claim_socket(self):
+        """Remove a stale socket file, refusing to replace a live daemon or any other file"""
+        try:
+            info = os.lstat(self.socket_path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(info.st_mode):
+            raise RuntimeError(f"{self.socket_path} exists and is not a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.remove(self.socket_path)
+                return
+        raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_LINE_BYTES; the stream cannot be resynchronized
+                    writer.write(self._encode(self.service.error_response(
+                        None, ValueError(f"Request line exceeds {MAX_LINE_BYTES} bytes"))))
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self.respond(line))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def respond(self, line: bytes) -> bytes:
+        """Answer one request line with one encoded response line"""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return self._encode(self.service.error_response(None, e))
+        
+        if isinstance(request, list):
+            return self._encode([self.service.handle(item) for item in request])
+        return self._encode(self.service.handle(request))
+
+    @staticmethod
+    def _encode(response: Any) -> bytes:
+        try:
+            text = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+        except (TypeError, ValueError) as e:
+            text = json.dumps({'id': None, 'error': {'type': type(e).__name__, 'message': str(e)}})
+        return text.encode('utf-8') + b'\n'
+
+
+class DaemonError(Exception):
+    """Error response returned by the daemon"""
+
+    def __init__(self, error: Dict[str, Any]):
+        super().__init__(f"{error.get('type')}: {error.get('message')}")
+        self.type = error.get('type')
+        self.message = error.get('message')
+
+
+class AutofillClient:
+    """Thin blocking client for AutofillDaemon"""
+
+    def __init__(self, socket_path: str = None, timeout: float = 30.0):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(self.socket_path)
+            self._check_peer()
+        except BaseException:
+            self.sock.close()
+            raise
+        self._buffer = bytearray()
+        self._next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.sock.close()
+
+    def call(self, method: str, **params) -> Any:
+        """Run one request and return its result, raising DaemonError on failure"""
+        return self._result(self._exchange([self._request(method, params)])[0])
+
+    def batch(self, calls: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run (method, params) calls as one batch line in a single round trip
+        
+        Returns:
+            Results in call order; failed calls are returned as DaemonError instances
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        self.sock.sendall(json.dumps(requests).encode('utf-8') + b'\n')
+        return [self._outcome(response) for response in self._read_line()]
+
+    def pipeline(self, calls: Iterable[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Send (method, params) calls as separate lines without waiting for each reply
+        
+        Returns:
+            Results in call order; failed calls are returned as DaemonError instances
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        return [self._outcome(response) for response in self._exchange(requests)]
+
+    def _request(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        self._next_id += 1
+        return {'id': self._next_id, 'method': method, 'params': params or {}}
+
+    def _check_peer(self):
+        """Refuse to talk to a daemon run by another user; requests carry full profiles"""
+        if hasattr(socket, 'SO_PEERCRED'):
+            credentials = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+            _, uid, _ = struct.unpack('3i', credentials)
+        else:
+            uid = os.stat(self.socket_path).st_uid
+        if uid != os.getuid():
+            raise PermissionError(f"{self.socket_path} is served by uid {uid}, not uid {os.getuid()}")
+
+    def _exchange(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Write request lines while reading replies as they arrive
+        
+        Reading and writing are interleaved, so large responses can never
+        fill the socket buffers while this side is still stuck sending.
+        """
+        pending = memoryview(b''.join(json.dumps(request).encode('utf-8') + b'\n'
+                                      for request in requests))
+        if len(requests) == 1:
+            # The daemon reads a whole line before answering it, so a single
+            # request cannot deadlock and skips the selector setup
+            self.sock.sendall(pending)
+            return [self._read_line()]
+        
+        responses = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+            while len(responses) < len(requests):
+                line = self._pop_line()
+                if line is not None:
+                    responses.append(json.loads(line))
+                    continue
+                
+                events = selector.select(self.timeout)
+                if not events:
+                    raise TimeoutError("Timed out waiting for the daemon")
+                mask = events[0][1]
+                if mask & selectors.EVENT_READ:
+                    self._receive()
+                if mask & selectors.EVENT_WRITE and pending:
+                    pending = pending[self.sock.send(pending[:CLIENT_CHUNK_BYTES]):]
+                    if not pending:
+                        selector.modify(self.sock, selectors.EVENT_READ)
+        return responses
+
+    def _read_line(self) -> Any:
+        line = self._pop_line()
+        while line is None:
+            self._receive()
+            line = self._pop_line()
+        return json.loads(line)
+
+    def _pop_line(self) -> Optional[bytes]:
+        """Remove and return the first complete line in the buffer, if any"""
+        end = self._buffer.find(b'\n')
+        if end == -1:
+            return None
+        line = bytes(self._buffer[:end])
+        del self._buffer[:end + 1]
+        return line
+
+    def _receive(self):
+        data = self.sock.recv(CLIENT_CHUNK_BYTES)
+        if not data:
+            raise ConnectionError("Daemon closed the connection")
+        self._buffer += data
+
+    @staticmethod
+    def _outcome(response: Dict[str, Any]) -> Any:
+        if 'error' in response:
+            return DaemonError(response['error'])
+        return response.get('result')
+
+    @classmethod
+    def _result(cls, response: Dict[str, Any]) -> Any:
+        outcome = cls._outcome(response)
+        if isinstance(outcome, DaemonError):
+            raise outcome
+        return outcome
+
+
+def main():
+    """Command-line interface for the autofill daemon"""
+    parser = argparse.ArgumentParser(description='Serve warm autofill tools over a Unix socket')
+    parser.add_argument('action', choices=['serve', 'call', 'stats', 'ping', 'stop'],
+                       help='Run the daemon, or talk to a running one')
+    parser.add_argument('method', nargs='?', help='Endpoint for call (e.g. map.field)')
+    parser.add_argument('--params', '-p', default='{}',
+                       help='JSON object of keyword arguments for call')
+    parser.add_argument('--socket', '-s', help='Socket path (default: $JOBAUTOFILL_SOCKET, else a private per-user directory)')
+
+    args = parser.parse_args()
+
+    if args.action == 'serve':
+        try:
+            daemon = AutofillDaemon(args.socket)
+            print(f"🚀 Serving {len(daemon.service.endpoints)} endpoints on {daemon.socket_path}")
+            asyncio.run(daemon.serve())
+        except KeyboardInterrupt:
+            pass
+        except (OSError, RuntimeError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print("👋 Daemon stopped")
+        return
+
+    method = {'stats': 'daemon.stats', 'ping': 'daemon.ping', 'stop': 'daemon.shutdown'}.get(args.action, args.method)
+    if not method:
+        parser.error("call needs a method")
+
+    try:
+        with AutofillClient(args.socket) as client:
+            result = client.call(method, **json.loads(args.params))
+    except (OSError, DaemonError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Benchmark Suite
+Times the core tool operations on synthetic data and catches regressions against a baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
+
+from data_converter import ProfileDataConverter
+from data_validator import ProfileDataValidator
+from field_mapper import FormFieldMapper
+from template_generator import ProfileTemplateGenerator
+
+BASELINE_VERSION = 1
+
+# Slowdown (percent of baseline time) tolerated by compare
+DEFAULT_THRESHOLD = 10.0
+
+# Converter formats benchmarked for both loading and saving
+FORMATS = ['json', 'csv', 'xml', 'yaml', 'txt', 'pbin']
+
+# Compressed variants benchmarked the same way: every codec on JSON, and
+# gzip on each other format's text or binary stream (pbin cannot be compressed)
+COMPRESSED_FORMATS = ['json.gz', 'json.bz2', 'json.xz', 'csv.gz', 'xml.gz', 'yaml.gz', 'txt.gz']
+
+# Run settings that change what is timed; results are only comparable when they match
+COMPARABLE_SETTINGS = ('scale', 'seed')
+
+FIRST_NAMES = ['Ada', 'Grace', 'Alan', 'Katherine', 'Linus', 'Margaret', 'Dennis', 'Barbara']
+LAST_NAMES = ['Lovelace', 'Hopper', 'Turing', 'Johnson', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Enterprises']
+TITLES = ['Software Engineer', 'Data Analyst', 'Product Manager', 'Designer', 'Account Executive']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'Polytechnic University']
+SKILLS = ['Python', 'SQL', 'JavaScript', 'Excel', 'Project Management', 'Docker', 'Figma', 'Salesforce',
+          'Kubernetes', 'Tableau', 'Go', 'React']
+DATE_STYLES = ['%Y-%m-%d', '%m/%d/%Y', '%B %Y', '%b %Y', '%Y']
+NOISE_FIELDS = ['captcha_token', 'utm_source', 'referral_code', 'honeypot', 'consent_marketing',
+                'session_nonce', 'eeo_disclaimer', 'how_did_you_hear']
+
+
+class SyntheticData:
+    """
+    Reproducible profiles, forms, resumes and mapping files at a configurable scale
+    
+    Scale 1 is a typical profile (3 positions, 1 school, 10 skills) and a
+    25-field form; sizes grow linearly with scale.
+    """
+
+    def __init__(self, scale: int = 1, seed: int = 1):
+        self.scale = max(1, scale)
+        self.random = random.Random(seed)
+
+    def _date(self, year: int) -> str:
+        return datetime(year, self.random.randint(1, 12), self.random.randint(1, 28)).strftime(
+            self.random.choice(DATE_STYLES))
+
+    def profile(self) -> Dict[str, Any]:
+        """One profile with free-form dates, as users write them"""
+        pick = self.random.choice
+        first, last = pick(FIRST_NAMES), pick(LAST_NAMES)
+        year = 2024
+        positions = []
+        for index in range(3 * self.scale):
+            start = year - self.random.randint(1, 4)
+            positions.append({
+                'company': pick(COMPANIES),
+                'title': pick(TITLES),
+                'startDate': self._date(start),
+                'endDate': 'present' if index == 0 else self._date(year),
+                'description': f"Worked on {pick(SKILLS)} and {pick(SKILLS)} projects",
+                'location': 'Remote',
+                'achievements': [f"Improved {pick(SKILLS)} throughput by {self.random.randint(5, 60)}%"]
+            })
+            year = start
+        
+        schools = [{
+            'institution': pick(SCHOOLS),
+            'degree': 'Bachelor of Science',
+            'fieldOfStudy': 'Computer Science',
+            'graduationDate': self._date(year - index * 4),
+            'gpa': f"{self.random.uniform(2.5, 4.0):.2f}"
+        } for index in range(self.scale)]
+        
+        return {
+            'personalInfo': {
+                'firstName': first,
+                'lastName': last,
+                'email': f"{first}.{last}@example.com".lower(),
+                'phone': f"+1 (555) {self.random.randint(100, 999)}-{self.random.randint(1000, 9999)}",
+                'address': {'street': '1 Main St', 'city': 'Springfield', 'state': 'IL',
+                            'zipCode': f"{self.random.randint(10000, 99999)}", 'country': 'United States'},
+                'linkedin': f"https://linkedin.com/in/{first.lower()}{last.lower()}",
+                'summary': 'Experienced professional.'
+            },
+            'workExperience': {'positions': positions},
+            'education': {'schools': schools},
+            'skills': {
+                'technical': [pick(SKILLS) for _ in range(10 * self.scale)],
+                'certifications': [{'name': 'Certified Cloud Practitioner', 'issuer': 'AWS',
+                                    'date': self._date(2022)}]
+            }
+        }
+
+    def form(self, mapper: FormFieldMapper) -> List[Dict[str, Any]]:
+        """Form fields mixing exact, decorated, misspelled and unknown names"""
+        variations = [(profile_field, variation)
+                      for profile_field, names in mapper.field_mappings.items() for variation in names]
+        fields = []
+        for _ in range(25 * self.scale):
+            roll = self.random.random()
+            if roll < 0.15:
+                name = self.random.choice(NOISE_FIELDS)
+            else:
+                _, name = self.random.choice(variations)
+                if roll < 0.45:
+                    name = self.random.choice(['input_', 'applicant_', '']) + name.replace('_', '-')
+                elif roll < 0.6 and len(name) > 4:
+                    cut = self.random.randrange(1, len(name) - 1)
+                    name = name[:cut] + name[cut + 1:]
+            fields.append({'name': name, 'type': 'text', 'label': name.replace('_', ' ').title(),
+                           'placeholder': ''})
+        return fields
+
+    def mappings(self) -> Dict[str, List[str]]:
+        """Custom mapping file content for import_mappings"""
+        return {
+            f"custom{index}": [f"custom_field_{index}_{variant}" for variant in range(5)]
+            for index in range(20 * self.scale)
+        }
+
+    def write(self, directory: str, converter: ProfileDataConverter, mapper: FormFieldMapper) -> Dict[str, str]:
+        """
+        Write one profile in every format and compressed variant, plus a form and a mapping file
+        
+        The txt file is the converter's own text rendering, so loading it
+        exercises the resume parser.
+        
+        Returns:
+            Paths keyed by format (e.g. 'json', 'json.gz'), 'form' and 'mappings'
+        """
+        os.makedirs(directory, exist_ok=True)
+        profile = self.profile()
+        paths = {}
+        for format_type in FORMATS + COMPRESSED_FORMATS:
+            path = os.path.join(directory, f"profile.{format_type}")
+            if not converter._save_data(profile, path, format_type.split('.')[0]):
+                raise RuntimeError(f"Could not write synthetic {format_type} profile")
+            paths[format_type] = path
+        
+        for name, content in (('form', self.form(mapper)), ('mappings', self.mappings())):
+            path = os.path.join(directory, f"{name}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2)
+            paths[name] = path
+        return paths
+
+
+def build_cases(data: SyntheticData, directory: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """Return (name, zero-argument callable) for every benchmarked operation"""
+    mapper = FormFieldMapper()
+    converter = ProfileDataConverter()
+    validator = ProfileDataValidator()
+    generator = ProfileTemplateGenerator()
+    paths = data.write(os.path.join(directory, 'inputs'), converter, mapper)
+    profile = data.profile()
+    standardized = converter.standardize_dates(profile)
+    with open(paths['form'], 'r', encoding='utf-8') as f:
+        form = json.load(f)
+
+    def import_mappings():
+        FormFieldMapper().import_mappings(paths['mappings'])
+    
+    cases = [
+        ('mapper.map_field.exact', lambda: mapper.map_field_to_profile('first_name')),
+        ('mapper.map_field.decorated', lambda: mapper.map_field_to_profile('input_Email-Address')),
+        ('mapper.map_field.fuzzy', lambda: mapper.map_field_to_profile('phon_numbr')),
+        ('mapper.map_field.unmapped', lambda: mapper.map_field_to_profile('captcha_token')),
+        ('mapper.analyze_form_fields', lambda: mapper.analyze_form_fields(form)),
+        ('mapper.import_mappings', import_mappings)
+    ]
+    
+    for name in FORMATS + COMPRESSED_FORMATS:
+        path, format_type = paths[name], name.split('.')[0]
+        cases.append((f"converter.load.{name}",
+                      lambda path=path, format_type=format_type: converter._load_data(path, format_type)))
+    for name in FORMATS + COMPRESSED_FORMATS:
+        path, format_type = os.path.join(directory, f"out.{name}"), name.split('.')[0]
+        cases.append((f"converter.save.{name}",
+                      lambda path=path, format_type=format_type: converter._save_data(standardized, path, format_type)))
+    
+    cases += [
+        ('converter.standardize_dates', lambda: converter.standardize_dates(profile)),
+        ('validator.validate_profile', lambda: validator.validate_profile(standardized)),
+        ('generator.generate_template.cached',
+         lambda: generator.generate_template('comprehensive', 'software_engineering', True)),
+        ('generator.generate_template.uncached',
+         lambda: generator._build_template('comprehensive', 'software_engineering', True))
+    ]
+    return cases
+
+
+def time_case(func: Callable[[], Any], repeat: int, min_seconds: float) -> Dict[str, Any]:
+    """
+    Time func with timeit, picking a loop count that runs for at least min_seconds
+    
+    Returns:
+        Best and median microseconds per call over the repeats, with the loop count
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_seconds:
+            break
+        number *= 2
+    
+    per_call = sorted(total / number * 1e6 for total in timer.repeat(repeat, number))
+    return {
+        'bestUs': round(per_call[0], 3),
+        'medianUs': round(per_call[len(per_call) // 2], 3),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def run_suite(scale: int = 1, seed: int = 1, repeat: int = 5, min_seconds: float = 0.05,
+              only: str = None, progress: bool = True) -> Dict[str, Any]:
+    """
+    Run every benchmark case and return a baseline document
+    
+    Args:
+        scale: Synthetic data size multiplier
+        seed: Random seed for the synthetic data
+        repeat: Timing repeats per case (the best is compared)
+        min_seconds: Minimum duration of one timing repeat
+        only: Run only cases whose name contains this text
+        progress: Print each result as it finishes
+    """
+    directory = tempfile.mkdtemp(prefix='jobautofill-bench-')
+    try:
+        cases = build_cases(SyntheticData(scale, seed), directory)
+        results = {}
+        for name, func in cases:
+            if only and only not in name:
+                continue
+            results[name] = time_case(func, repeat, min_seconds)
+            if progress:
+                print(f"  {name:<40} {results[name]['bestUs']:12.2f} µs", file=sys.stderr)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    
+    return {
+        'baselineVersion': BASELINE_VERSION,
+        'created': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': scale,
+        'seed': seed,
+        'filter': only,
+        'results': results
+    }
+
+
+def check_comparable(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Refuse to compare runs over different synthetic data
+    
+    Returns:
+        Warnings for environment differences (Python version, platform)
+        that make timings less comparable without invalidating them
+    
+    Raises:
+        ValueError: The runs used a different scale or seed
+    """
+    for setting in COMPARABLE_SETTINGS:
+        if baseline.get(setting) != current.get(setting):
+            raise ValueError(f"Runs used different {setting}: baseline {baseline.get(setting)}, "
+                             f"current {current.get(setting)}")
+    return [f"Runs used different {setting}: baseline {baseline.get(setting)}, current {current.get(setting)}"
+            for setting in ('python', 'platform') if baseline.get(setting) != current.get(setting)]
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> Tuple[List[Dict[str, Any]], List[str], List[str]]:
+    """
+    Compare best per-call times case by case
+    
+    A baseline case the current run should have timed but did not (renamed,
+    removed or crashed) is missing and fails the comparison like a
+    regression. Cases excluded by the current run's filter are not missing.
+    
+    Returns:
+        (rows, regressions, missing): one row per case present in both runs
+        with the change in percent, the names of cases slower than threshold
+        percent, and the names of missing baseline cases
+    """
+    only = current.get('filter')
+    missing = [name for name in baseline['results']
+               if name not in current['results'] and (not only or only in name)]
+    rows = []
+    regressions = []
+    for name, result in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None:
+            continue
+        change = (result['bestUs'] - before['bestUs']) / before['bestUs'] * 100 if before['bestUs'] else 0.0
+        rows.append({'name': name, 'baselineUs': before['bestUs'], 'currentUs': result['bestUs'],
+                     'changePercent': round(change, 1)})
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions, missing
+
+
+def print_comparison(rows: List[Dict[str, Any]], regressions: List[str], missing: List[str],
+                     threshold: float, warnings: List[str] = ()) -> int:
+    """Print a comparison table; returns the exit code (1 on regressions or missing cases)"""
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    print(f"{'Case':<40} {'Baseline µs':>12} {'Current µs':>12} {'Change':>8}")
+    for row in rows:
+        marker = ' ❌' if row['name'] in regressions else ''
+        print(f"{row['name']:<40} {row['baselineUs']:12.2f} {row['currentUs']:12.2f} "
+              f"{row['changePercent']:+7.1f}%{marker}")
+    for name in missing:
+        print(f"{name:<40} {'':>12} {'missing':>12} {'':>8} ❌")
+    
+    status = 0
+    if missing:
+        print(f"\n❌ {len(missing)} baseline case(s) missing from the current run")
+        status = 1
+    if regressions:
+        print(f"\n❌ {len(regressions)} case(s) slower than the baseline by more than {threshold:g}%")
+        status = 1
+    if not status:
+        print(f"\n✅ No case slower than the baseline by more than {threshold:g}%")
+    return status
+
+
+def compare_and_print(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Check the runs are comparable, then print their comparison; returns the exit code"""
+    try:
+        warnings = check_comparable(baseline, current)
+    except ValueError as e:
+        print(f"❌ Cannot compare: {e}")
+        return 2
+    rows, regressions, missing = compare_results(baseline, current, threshold)
+    return print_comparison(rows, regressions, missing, threshold, warnings)
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    with open(filename, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('baselineVersion') != BASELINE_VERSION:
+        raise ValueError(f"{filename} is not a version {BASELINE_VERSION} benchmark file")
+    return results
+
+
+def main():
+    """Command-line interface for the benchmark suite"""
+    parser = argparse.ArgumentParser(description='Benchmark the job autofill tools')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='Run the benchmarks')
+    run_parser.add_argument('--output', '-o', help='Write results as a JSON baseline file')
+    run_parser.add_argument('--baseline', '-b', help='Compare the run against this baseline file')
+    run_parser.add_argument('--scale', type=int, default=1, help='Synthetic data size multiplier (default: 1)')
+    run_parser.add_argument('--seed', type=int, default=1, help='Synthetic data seed (default: 1)')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Timing repeats per case (default: 5)')
+    run_parser.add_argument('--min-time', type=float, default=0.05,
+                            help='Minimum seconds per timing repeat (default: 0.05)')
+    run_parser.add_argument('--filter', '-k', help='Only run cases whose name contains this text')
+    run_parser.add_argument('--threshold', '-t', type=float, default=DEFAULT_THRESHOLD,
+                            help=f'Allowed slowdown in percent for --baseline (default: {DEFAULT_THRESHOLD:g})')
+    
+    compare_parser = subparsers.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline', help='Baseline results')
+    compare_parser.add_argument('current', help='New results')
+    compare_parser.add_argument('--threshold', '-t', type=float, default=DEFAULT_THRESHOLD,
+                                help=f'Allowed slowdown in percent (default: {DEFAULT_THRESHOLD:g})')
+    
+    generate_parser = subparsers.add_parser('generate', help='Write synthetic benchmark data to a directory')
+    generate_parser.add_argument('output_dir', help='Directory for the generated files')
+    generate_parser.add_argument('--scale', type=int, default=1, help='Synthetic data size multiplier (default: 1)')
+    generate_parser.add_argument('--seed', type=int, default=1, help='Synthetic data seed (default: 1)')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'generate':
+        paths = SyntheticData(args.scale, args.seed).write(args.output_dir, ProfileDataConverter(),
+                                                           FormFieldMapper())
+        for name, path in paths.items():
+            print(f"Generated {name}: {path}")
+        return
+    
+    if args.command == 'compare':
+        sys.exit(compare_and_print(load_results(args.baseline), load_results(args.current), args.threshold))
+    
+    print(f"⏱️  Running benchmarks (scale {args.scale}, best of {args.repeat})", file=sys.stderr)
+    results = run_suite(args.scale, args.seed, args.repeat, args.min_time, args.filter)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📊 Results written to: {args.output}", file=sys.stderr)
+    
+    if args.baseline:
+        sys.exit(compare_and_print(load_results(args.baseline), results, args.threshold))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,27 +10,761 @@ import xml.etree.ElementTree as ET
 import yaml
 import argparse
 from typing import Dict, List, Any, Optional
-from datetime import datetime
+from datetime import date
+import calendar
+from collections import defaultdict
+import glob
+import hashlib
+import mmap
+import multiprocessing
+import multiprocessing.pool
+import os
+import sys
 import re
+import struct
+import threading
+import time
+
+from archive_io import (detect_compression, iter_records, open_binary, open_text,
+                        strip_compression_extension)
+from mapped_file import MappedFile
+
+
+class DateNormalizer:
+    """Normalizes date strings to ISO format (YYYY-MM-DD) with a single regex dispatch"""
+
+    # One pattern covers every accepted shape: %Y-%m-%d, %m/%d/%Y, %d/%m/%Y,
+    # %Y/%m/%d, %B %Y, %b %Y and %Y; component values are checked with the
+    # same token rules strptime uses. Month and day slots accept a leading
+    # space so the token checks decide, as with "2020-01- 5" (%d allows it).
+    DATE_SHAPE = re.compile(
+        r'(?P<iy>\d{4})-(?P<im> ?\d{1,2})-(?P<id> ?\d{1,2})'
+        r'|(?P<sa> ?\d{1,4})/(?P<sb> ?\d{1,2})/(?P<sc> ?\d{1,4})'
+        r'|(?P<mon>[A-Za-z]+)\s+(?P<my>\d{4})'
+        r'|(?P<y>\d{4})'
+    )
+    MONTH_TOKEN = re.compile(r'1[0-2]|0[1-9]|[1-9]')
+    DAY_TOKEN = re.compile(r'3[01]|[12]\d|0[1-9]|[1-9]| [1-9]')
+    YEAR_TOKEN = re.compile(r'\d{4}')
+    OPEN_ENDED = frozenset(['present', 'current', 'ongoing'])
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._cache = {}
+        self.month_lookup = {}
+        for i in range(1, 13):
+            self.month_lookup[calendar.month_name[i].lower()] = i
+            self.month_lookup[calendar.month_abbr[i].lower()] = i
+
+    def normalize(self, date_str: str) -> str:
+        """Convert a single date string to ISO format, returning it unchanged if unparseable"""
+        try:
+            return self._cache[date_str]
+        except KeyError:
+            pass
+        
+        result = self._normalize_uncached(date_str)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[date_str] = result
+        return result
+
+    def _normalize_uncached(self, date_str: str) -> str:
+        if not date_str or date_str.lower() in self.OPEN_ENDED:
+            return date_str
+        
+        match = self.DATE_SHAPE.fullmatch(date_str)
+        if not match:
+            return date_str
+        
+        groups = match.groupdict()
+        if groups['iy'] is not None:
+            candidates = [(groups['iy'], groups['im'], groups['id'])]
+        elif groups['sa'] is not None:
+            a, b, c = groups['sa'], groups['sb'], groups['sc']
+            # Tried in order: %m/%d/%Y, %d/%m/%Y, %Y/%m/%d
+            candidates = [(c, a, b), (c, b, a), (a, b, c)]
+        elif groups['mon'] is not None:
+            month = self.month_lookup.get(groups['mon'].lower())
+            if month is None:
+                return date_str
+            return self._format(int(groups['my']), month, 1) or date_str
+        else:
+            return self._format(int(groups['y']), 1, 1) or date_str
+        
+        for year, month, day in candidates:
+            if (self.YEAR_TOKEN.fullmatch(year) and self.MONTH_TOKEN.fullmatch(month)
+                    and self.DAY_TOKEN.fullmatch(day)):
+                result = self._format(int(year), int(month), int(day))
+                if result:
+                    return result
+        
+        return date_str
+
+    def _format(self, year: int, month: int, day: int) -> Optional[str]:
+        """Build the ISO string, or None if the date does not exist"""
+        try:
+            parsed_date = date(year, month, day)
+        except ValueError:
+            return None
+        if year >= 1000:
+            return f"{year}-{month:02d}-{day:02d}"
+        # Keep the platform strftime rendering for short years
+        return parsed_date.strftime('%Y-%m-%d')
+
+    def standardize_in_place(self, obj: Any) -> Any:
+        """Normalize every string value under a key containing 'date', mutating obj"""
+        normalize = self.normalize
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                for key, value in current.items():
+                    if isinstance(value, str):
+                        if 'date' in key.lower():
+                            current[key] = normalize(value)
+                    elif isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(current, list):
+                for item in current:
+                    if isinstance(item, (dict, list)):
+                        stack.append(item)
+        return obj
+
+    def standardized_copy(self, obj: Any) -> Any:
+        """Return a deep copy of obj with dates normalized, in a single traversal"""
+        if isinstance(obj, dict):
+            return {key: (self.normalize(value) if isinstance(value, str) and 'date' in key.lower()
+                          else self.standardized_copy(value))
+                    for key, value in obj.items()}
+        if isinstance(obj, (list, tuple)):
+            return [self.standardized_copy(item) for item in obj]
+        return obj
+
+
+class ResumeTextParser:
+    """Single-pass parser for structured plain-text resumes"""
+
+    YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+    DEGREE_PATTERN = re.compile(r'bachelor|master|phd|doctorate|associate|diploma')
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    PHONE_PATTERN = re.compile(r'[\+]?[1-9]?[\d\s\-\(\)\.]{7,15}')
+    SKILL_SEPARATORS = str.maketrans({'•': ',', '-': ',', '*': ','})
+
+    def __init__(self):
+        self._section_kinds = {}
+        self.entry_builders = {
+            'work': self._build_position,
+            'education': self._build_school
+        }
+
+    def parse_file(self, filename: str) -> Dict[str, Any]:
+        """Parse a text resume file, decoding it line by line from a memory map"""
+        with MappedFile(filename) as mapped:
+            return self.parse_lines(mapped.iter_lines())
+
+    def parse_text(self, content: str) -> Dict[str, Any]:
+        """Parse text resume content that is already in memory"""
+        return self.parse_lines(content.split('\n'))
+
+    def parse_lines(self, lines) -> Dict[str, Any]:
+        """
+        Parse resume lines into profile data in one pass
+        
+        Args:
+            lines: Iterable of text lines
+            
+        Returns:
+            Profile data dictionary
+        """
+        # A repeated section name replaces the earlier section's content
+        # but keeps its original position, like a dict of section texts.
+        sections = {}
+        section_name = 'general'
+        kind = None
+        line_count = 0
+        
+        # Section state: finished entries/lines, the current entry block
+        # and the number of blank lines seen since the block's last line
+        collected = []
+        block = []
+        blank_lines = 0
+        build_entry = None
+        
+        for line in lines:
+            line = line.strip()
+            
+            # Section header: '# Title', 'Title:' or an all-caps line
+            if line and (line[0] == '#' or line[-1] == ':' or
+                         (len(line) > 3 and line.isupper())):
+                if line_count:
+                    sections[section_name] = (
+                        kind, self._finish_section(kind, collected, block, blank_lines)
+                    )
+                section_name = line.strip(':').strip('#').strip()
+                kind = self._section_kind(section_name)
+                build_entry = self.entry_builders.get(kind)
+                collected = []
+                block = []
+                blank_lines = 0
+                line_count = 0
+                continue
+            
+            line_count += 1
+            if kind is None:
+                continue
+            
+            if build_entry is None:
+                collected.append(line)
+            elif not line:
+                blank_lines += 1
+            else:
+                # Entries are separated by blank lines, like re.split(r'\n\s*\n')
+                if blank_lines:
+                    if block:
+                        collected.append(build_entry(block))
+                        block = []
+                    elif blank_lines == 1:
+                        block.append('')
+                    blank_lines = 0
+                block.append(line)
+        
+        if line_count:
+            sections[section_name] = (
+                kind, self._finish_section(kind, collected, block, blank_lines)
+            )
+        
+        profile_data = {
+            'personalInfo': {},
+            'workExperience': {'positions': []},
+            'education': {'schools': []},
+            'skills': {'technical': []}
+        }
+        
+        for kind, parsed in sections.values():
+            if kind == 'personal':
+                profile_data['personalInfo'].update(parsed)
+            elif kind == 'work':
+                profile_data['workExperience']['positions'].extend(parsed)
+            elif kind == 'education':
+                profile_data['education']['schools'].extend(parsed)
+            elif kind == 'skills':
+                profile_data['skills']['technical'].extend(parsed)
+        
+        return profile_data
+
+    def _section_kind(self, section_name: str) -> Optional[str]:
+        """Classify a section header, caching the result per header text"""
+        kind = self._section_kinds.get(section_name, '')
+        if kind != '':
+            return kind
+        
+        name = section_name.lower()
+        if 'personal' in name:
+            kind = 'personal'
+        elif 'work' in name or 'experience' in name:
+            kind = 'work'
+        elif 'education' in name:
+            kind = 'education'
+        elif 'skill' in name:
+            kind = 'skills'
+        else:
+            kind = None
+        
+        self._section_kinds[section_name] = kind
+        return kind
+
+    def _finish_section(self, kind: Optional[str], collected: list,
+                        block: List[str], blank_lines: int):
+        """Produce the parsed result for a completed section"""
+        if kind in self.entry_builders:
+            if block:
+                if blank_lines == 1:
+                    block.append('')
+                collected.append(self.entry_builders[kind](block))
+            return collected
+        if kind == 'skills':
+            return self._build_skills(collected)
+        if kind == 'personal':
+            return self._build_personal('\n'.join(collected))
+        return None
+
+    def _build_personal(self, content: str) -> Dict[str, str]:
+        """Parse personal information from text"""
+        personal = {}
+        
+        email_match = self.EMAIL_PATTERN.search(content)
+        if email_match:
+            personal['email'] = email_match.group()
+        
+        # Phone numbers may span line breaks, so search the whole section
+        phone_match = self.PHONE_PATTERN.search(content)
+        if phone_match:
+            personal['phone'] = phone_match.group().strip()
+        
+        # Name extraction (simple heuristic)
+        for line in content.split('\n'):
+            if 'name' in line.lower():
+                name_part = line.split(':')[-1].strip()
+                if ' ' in name_part:
+                    parts = name_part.split()
+                    personal['firstName'] = parts[0]
+                    personal['lastName'] = ' '.join(parts[1:])
+        
+        return personal
+
+    def _build_position(self, lines: List[str]) -> Dict[str, str]:
+        """Build a work position from an entry block"""
+        position = {}
+        block = '\n'.join(lines)
+        
+        # First line often contains company and title
+        first_line = lines[0]
+        if ',' in first_line:
+            parts = first_line.split(',')
+            position['title'] = parts[0].strip()
+            position['company'] = parts[1].strip()
+        else:
+            position['company'] = first_line
+        
+        dates = self.YEAR_PATTERN.findall(block)
+        if len(dates) >= 2:
+            position['startDate'] = dates[0]
+            position['endDate'] = dates[1]
+        elif len(dates) == 1:
+            position['startDate'] = dates[0]
+            position['endDate'] = 'present'
+        
+        # Description is remaining text
+        if len(lines) > 1:
+            position['description'] = block[len(first_line) + 1:].strip()
+        
+        return position
+
+    def _build_school(self, lines: List[str]) -> Dict[str, str]:
+        """Build a school entry from an entry block"""
+        school = {'institution': lines[0]}
+        
+        # The last line mentioning a degree wins
+        degree_search = self.DEGREE_PATTERN.search
+        for line in reversed(lines):
+            if degree_search(line.lower()):
+                school['degree'] = line
+                break
+        
+        # Last date is likely graduation
+        dates = self.YEAR_PATTERN.findall('\n'.join(lines))
+        if dates:
+            school['graduationDate'] = dates[-1]
+        
+        return school
+
+    def _build_skills(self, lines: List[str]) -> List[str]:
+        """Split skill lines on commas and bullets"""
+        skills = []
+        separators = self.SKILL_SEPARATORS
+        for line in lines:
+            for skill in line.translate(separators).split(','):
+                skill = skill.strip()
+                if len(skill) > 1:
+                    skills.append(skill)
+        return skills
+
+
+class ConversionCache:
+    """Manifest of completed conversions, used to skip unchanged inputs
+    
+    Entries are keyed by output file and remember the input's content hash,
+    both formats, the conversion options and the converter version. Inputs are checked with a cheap
+    stat comparison first and only hashed when size or mtime changed.
+    """
+
+    MANIFEST_VERSION = 1
+
+    def __init__(self, manifest_file: str, converter_version: str):
+        self.manifest_file = manifest_file
+        self.converter_version = converter_version
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._hashes = {}
+        
+        if os.path.exists(manifest_file):
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('manifestVersion') == self.MANIFEST_VERSION:
+                    self.entries = manifest.get('entries', {})
+            except (OSError, ValueError):
+                # A damaged manifest only costs a full reconversion
+                self.entries = {}
+
+    def is_up_to_date(self, input_file: str, output_file: str,
+                      input_format: str, output_format: str, options: Dict[str, Any] = None) -> bool:
+        """Check whether output_file already holds the conversion of input_file with these options"""
+        up_to_date = self._check(input_file, output_file, input_format, output_format, options or {})
+        if up_to_date:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return up_to_date
+
+    def _check(self, input_file: str, output_file: str,
+               input_format: str, output_format: str, options: Dict[str, Any]) -> bool:
+        entry = self.entries.get(os.path.abspath(output_file))
+        if not entry:
+            return False
+        if (entry['inputFormat'], entry['outputFormat'], entry['converterVersion'], entry.get('options', {})) != \
+                (input_format, output_format, self.converter_version, options):
+            return False
+        
+        try:
+            output_stat = os.stat(output_file)
+            input_stat = os.stat(input_file)
+        except OSError:
+            return False
+        
+        # An output edited since it was written must be regenerated
+        if [output_stat.st_size, output_stat.st_mtime_ns] != entry['outputStat']:
+            return False
+        
+        input_path = os.path.abspath(input_file)
+        if entry['inputPath'] == input_path and \
+                [input_stat.st_size, input_stat.st_mtime_ns] == entry['inputStat']:
+            return True
+        
+        if input_stat.st_size != entry['inputStat'][0]:
+            return False
+        if self._hash_file(input_file, input_stat) != entry['inputHash']:
+            return False
+        
+        # Same content under a new path or mtime: refresh the stat fast path
+        entry['inputPath'] = input_path
+        entry['inputStat'] = [input_stat.st_size, input_stat.st_mtime_ns]
+        self._dirty = True
+        return True
+
+    def record(self, input_file: str, output_file: str,
+               input_format: str, output_format: str, options: Dict[str, Any] = None):
+        """Remember a completed conversion, once the output file is final"""
+        input_stat = os.stat(input_file)
+        output_stat = os.stat(output_file)
+        self.entries[os.path.abspath(output_file)] = {
+            'inputPath': os.path.abspath(input_file),
+            'inputStat': [input_stat.st_size, input_stat.st_mtime_ns],
+            'inputHash': self._hash_file(input_file, input_stat),
+            'inputFormat': input_format,
+            'outputFormat': output_format,
+            'options': options or {},
+            'converterVersion': self.converter_version,
+            'outputStat': [output_stat.st_size, output_stat.st_mtime_ns]
+        }
+        self._dirty = True
+
+    def _hash_file(self, filename: str, stat_result) -> str:
+        """SHA-256 of a file's content, reused while its stat is unchanged"""
+        key = (os.path.abspath(filename), stat_result.st_size, stat_result.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(filename, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._hashes[key] = digest
+        return digest
+
+    def save(self):
+        """Write the manifest atomically if anything changed"""
+        if not self._dirty:
+            return
+        
+        directory = os.path.dirname(os.path.abspath(self.manifest_file))
+        os.makedirs(directory, exist_ok=True)
+        temp_file = f"{self.manifest_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'manifestVersion': self.MANIFEST_VERSION, 'entries': self.entries}, f)
+        os.replace(temp_file, self.manifest_file)
+        self._dirty = False
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counts"""
+        return {
+            'saved': self.hits,
+            'converted': self.misses,
+            'entries': len(self.entries)
+        }
+
+
+class BinaryProfileStore:
+    """Compact binary container holding one or more profiles
+    
+    Layout: an 8-byte header, length-prefixed records, a table of interned
+    dictionary keys, an offset index mapping record ids to record offsets,
+    and a fixed-size footer pointing at the key table and index. Opening a
+    store memory-maps the file and reads only the key table and index, so
+    a single profile can be decoded by id without touching the others.
+    """
+
+    MAGIC = b'JAPB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sB3x')
+    FOOTER = struct.Struct('<QQ4s')
+    U32 = struct.Struct('<I')
+    U64 = struct.Struct('<Q')
+    I64 = struct.Struct('<q')
+    F64 = struct.Struct('<d')
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a binary profile store: {filename}")
+        
+        try:
+            self._read_directory()
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError(f"Not a binary profile store: {filename}")
+
+    @classmethod
+    def write(cls, filename: str, records) -> int:
+        """
+        Write profiles to a binary store
+        
+        Args:
+            filename: Output file path
+            records: Iterable of (record_id, profile) pairs with unique ids
+            
+        Returns:
+            Number of records written
+            
+        Raises:
+            ValueError: Two records share an id; the index could only reach
+                one of them, so nothing is written
+        """
+        try:
+            return cls._write(filename, records)
+        except BaseException:
+            if os.path.exists(filename):
+                os.remove(filename)
+            raise
+
+    @classmethod
+    def _write(cls, filename: str, records) -> int:
+        keys = {}
+        index = []
+        seen = set()
+        
+        with open(filename, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION))
+            offset = cls.HEADER.size
+            
+            for number, (record_id, profile) in enumerate(records, 1):
+                record_id = str(record_id)
+                if record_id in seen:
+                    raise ValueError(f"Duplicate record id {record_id!r} (record {number})")
+                seen.add(record_id)
+                payload = bytearray()
+                cls._encode(profile, payload, keys)
+                f.write(cls.U32.pack(len(payload)))
+                f.write(payload)
+                index.append((record_id, offset))
+                offset += cls.U32.size + len(payload)
+            
+            key_table_offset = offset
+            table = bytearray(cls.U32.pack(len(keys)))
+            for key in keys:
+                encoded = key.encode('utf-8')
+                table += cls.U32.pack(len(encoded))
+                table += encoded
+            f.write(table)
+            
+            index_offset = key_table_offset + len(table)
+            table = bytearray(cls.U32.pack(len(index)))
+            for record_id, record_offset in index:
+                encoded = record_id.encode('utf-8')
+                table += cls.U32.pack(len(encoded))
+                table += encoded
+                table += cls.U64.pack(record_offset)
+            f.write(table)
+            
+            f.write(cls.FOOTER.pack(key_table_offset, index_offset, cls.MAGIC))
+        
+        return len(index)
+
+    @classmethod
+    def _encode(cls, value: Any, out: bytearray, keys: Dict[str, int]):
+        """Append the tagged binary form of a JSON-compatible value"""
+        if value is None:
+            out += b'N'
+        elif value is True:
+            out += b'T'
+        elif value is False:
+            out += b'F'
+        elif isinstance(value, str):
+            encoded = value.encode('utf-8')
+            out += b's'
+            out += cls.U32.pack(len(encoded))
+            out += encoded
+        elif isinstance(value, dict):
+            out += b'd'
+            out += cls.U32.pack(len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    # Same key coercion json.dumps applies
+                    key = json.dumps(key)
+                key_id = keys.get(key)
+                if key_id is None:
+                    key_id = keys[key] = len(keys)
+                out += cls.U32.pack(key_id)
+                cls._encode(item, out, keys)
+        elif isinstance(value, (list, tuple)):
+            out += b'l'
+            out += cls.U32.pack(len(value))
+            for item in value:
+                cls._encode(item, out, keys)
+        elif isinstance(value, int):
+            if -(1 << 63) <= value < (1 << 63):
+                out += b'i'
+                out += cls.I64.pack(value)
+            else:
+                encoded = str(value).encode('ascii')
+                out += b'I'
+                out += cls.U32.pack(len(encoded))
+                out += encoded
+        elif isinstance(value, float):
+            out += b'f'
+            out += cls.F64.pack(value)
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _read_directory(self):
+        """Load the key table and offset index"""
+        mm = self._mm
+        magic, version = self.HEADER.unpack_from(mm, 0)
+        key_table_offset, index_offset, end_magic = self.FOOTER.unpack_from(
+            mm, len(mm) - self.FOOTER.size
+        )
+        if magic != self.MAGIC or end_magic != self.MAGIC:
+            raise ValueError("bad magic")
+        if version != self.VERSION:
+            raise ValueError(f"unsupported version {version}")
+        
+        u32 = self.U32.unpack_from
+        position = key_table_offset
+        (count,) = u32(mm, position)
+        position += 4
+        self.keys = []
+        for _ in range(count):
+            (length,) = u32(mm, position)
+            position += 4
+            self.keys.append(mm[position:position + length].decode('utf-8'))
+            position += length
+        
+        position = index_offset
+        (count,) = u32(mm, position)
+        position += 4
+        self.index = {}
+        for _ in range(count):
+            (length,) = u32(mm, position)
+            position += 4
+            record_id = mm[position:position + length].decode('utf-8')
+            position += length
+            (self.index[record_id],) = self.U64.unpack_from(mm, position)
+            position += 8
+
+    def ids(self) -> List[str]:
+        """Return record ids in file order"""
+        return list(self.index)
+
+    def get(self, record_id: str) -> Any:
+        """Decode a single profile by id"""
+        offset = self.index[record_id]
+        value, _ = self._decode(offset + self.U32.size)
+        return value
+
+    def __iter__(self):
+        for record_id in self.index:
+            yield record_id, self.get(record_id)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _decode(self, position: int):
+        """Decode the value at position, returning it and the next position"""
+        mm = self._mm
+        tag = mm[position]
+        position += 1
+        
+        if tag == 0x73:  # s
+            (length,) = self.U32.unpack_from(mm, position)
+            position += 4
+            return mm[position:position + length].decode('utf-8'), position + length
+        if tag == 0x64:  # d
+            (count,) = self.U32.unpack_from(mm, position)
+            position += 4
+            keys = self.keys
+            result = {}
+            for _ in range(count):
+                (key_id,) = self.U32.unpack_from(mm, position)
+                result[keys[key_id]], position = self._decode(position + 4)
+            return result, position
+        if tag == 0x6c:  # l
+            (count,) = self.U32.unpack_from(mm, position)
+            position += 4
+            result = []
+            for _ in range(count):
+                item, position = self._decode(position)
+                result.append(item)
+            return result, position
+        if tag == 0x4e:  # N
+            return None, position
+        if tag == 0x54:  # T
+            return True, position
+        if tag == 0x46:  # F
+            return False, position
+        if tag == 0x69:  # i
+            return self.I64.unpack_from(mm, position)[0], position + 8
+        if tag == 0x66:  # f
+            return self.F64.unpack_from(mm, position)[0], position + 8
+        if tag == 0x49:  # I
+            (length,) = self.U32.unpack_from(mm, position)
+            position += 4
+            return int(mm[position:position + length]), position + length
+        raise ValueError(f"Corrupt record data at offset {position - 1}")
+
+    def close(self):
+        """Release the memory map and file handle"""
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class ProfileDataConverter:
     """Converts profile data between different formats"""
     
-    def __init__(self):
-        self.supported_formats = ['json', 'csv', 'xml', 'yaml', 'txt']
-        self.date_formats = [
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%d/%m/%Y',
-            '%Y/%m/%d',
-            '%B %Y',
-            '%b %Y',
-            '%Y'
-        ]
+    # Bump when conversion output changes so cached results are regenerated
+    version = '1.1.0'
+    
+    def __init__(self, cache_file: str = None):
+        self.cache = ConversionCache(cache_file, self.version) if cache_file else None
+        self.supported_formats = ['json', 'csv', 'xml', 'yaml', 'txt', 'pbin']
+        self.date_normalizer = DateNormalizer()
+        self.text_parser = ResumeTextParser()
 
     def convert_format(self, input_file: str, output_file: str, 
-                      input_format: str = None, output_format: str = None) -> bool:
+                      input_format: str = None, output_format: str = None,
+                      standardize_dates: bool = False) -> bool:
         """
         Convert profile data from one format to another
         
@@ -39,6 +773,7 @@ class ProfileDataConverter:
             output_file: Path to output file
             input_format: Input format (auto-detected if None)
             output_format: Output format (auto-detected if None)
+            standardize_dates: Standardize dates to ISO format before saving
             
         Returns:
             True if conversion successful
@@ -52,15 +787,28 @@ class ProfileDataConverter:
         if not input_format or not output_format:
             raise ValueError("Could not determine file formats")
         
+        # Options that change the output are part of the cache key
+        options = {'standardizeDates': True} if standardize_dates else {}
+        
+        # Skip work when the output already reflects this input
+        if self.cache and self.cache.is_up_to_date(input_file, output_file,
+                                                   input_format, output_format, options):
+            return True
+        
         # Load data from input file
         data = self._load_data(input_file, input_format)
+        if standardize_dates:
+            data = self.standardize_dates(data, in_place=True)
         
         # Convert and save to output file
-        return self._save_data(data, output_file, output_format)
+        success = self._save_data(data, output_file, output_format)
+        if success and self.cache:
+            self.cache.record(input_file, output_file, input_format, output_format, options)
+        return success
 
     def _detect_format(self, filename: str) -> Optional[str]:
-        """Detect file format from extension"""
-        extension = filename.lower().split('.')[-1]
+        """Detect file format from extension, ignoring a compression suffix"""
+        extension = strip_compression_extension(filename).lower().split('.')[-1]
         return extension if extension in self.supported_formats else None
 
     def _load_data(self, filename: str, format_type: str) -> Dict[str, Any]:
@@ -75,6 +823,8 @@ class ProfileDataConverter:
             return self._load_yaml(filename)
         elif format_type == 'txt':
             return self._load_txt(filename)
+        elif format_type == 'pbin':
+            return self._load_pbin(filename)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
 
@@ -91,6 +841,8 @@ class ProfileDataConverter:
                 return self._save_yaml(data, filename)
             elif format_type == 'txt':
                 return self._save_txt(data, filename)
+            elif format_type == 'pbin':
+                return self._save_pbin(data, filename)
             else:
                 raise ValueError(f"Unsupported format: {format_type}")
         except Exception as e:
@@ -99,12 +851,12 @@ class ProfileDataConverter:
 
     def _load_json(self, filename: str) -> Dict[str, Any]:
         """Load JSON data"""
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open_text(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
 
     def _save_json(self, data: Dict[str, Any], filename: str) -> bool:
         """Save JSON data"""
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open_text(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
         return True
 
@@ -117,7 +869,7 @@ class ProfileDataConverter:
             'skills': {'technical': [], 'certifications': []}
         }
         
-        with open(filename, 'r', encoding='utf-8') as f:
+        with open_text(filename, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             
             for row in reader:
@@ -154,7 +906,7 @@ class ProfileDataConverter:
         
         # Personal info
         if 'personalInfo' in data:
-            personal = data['personalInfo']
+            personal = data['personalInfo'].copy()
             personal['type'] = 'personal'
             rows.append(personal)
         
@@ -181,7 +933,7 @@ class ProfileDataConverter:
             fieldnames.update(row.keys())
         fieldnames = sorted(list(fieldnames))
         
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        with open_text(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(rows)
@@ -190,7 +942,8 @@ class ProfileDataConverter:
 
     def _load_xml(self, filename: str) -> Dict[str, Any]:
         """Load XML data"""
-        tree = ET.parse(filename)
+        with open_binary(filename) as f:
+            tree = ET.parse(f)
         root = tree.getroot()
         
         return self._xml_to_dict(root)
@@ -229,7 +982,8 @@ class ProfileDataConverter:
         self._dict_to_xml(data, root)
         
         tree = ET.ElementTree(root)
-        tree.write(filename, encoding='utf-8', xml_declaration=True)
+        with open_binary(filename, 'wb') as f:
+            tree.write(f, encoding='utf-8', xml_declaration=True)
         return True
 
     def _dict_to_xml(self, data: Any, parent: ET.Element):
@@ -249,7 +1003,7 @@ class ProfileDataConverter:
         """Load YAML data"""
         try:
             import yaml
-            with open(filename, 'r', encoding='utf-8') as f:
+            with open_text(filename, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
         except ImportError:
             raise ImportError("PyYAML library required for YAML support")
@@ -258,7 +1012,7 @@ class ProfileDataConverter:
         """Save data as YAML"""
         try:
             import yaml
-            with open(filename, 'w', encoding='utf-8') as f:
+            with open_text(filename, 'w', encoding='utf-8') as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
             return True
         except ImportError:
@@ -266,188 +1020,10 @@ class ProfileDataConverter:
 
     def _load_txt(self, filename: str) -> Dict[str, Any]:
         """Load structured text data"""
-        profile_data = {
-            'personalInfo': {},
-            'workExperience': {'positions': []},
-            'education': {'schools': []},
-            'skills': {'technical': []}
-        }
-        
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse sections
-        sections = self._parse_text_sections(content)
-        
-        for section_name, section_content in sections.items():
-            if 'personal' in section_name.lower():
-                profile_data['personalInfo'].update(self._parse_personal_section(section_content))
-            elif 'work' in section_name.lower() or 'experience' in section_name.lower():
-                profile_data['workExperience']['positions'].extend(
-                    self._parse_work_section(section_content)
-                )
-            elif 'education' in section_name.lower():
-                profile_data['education']['schools'].extend(
-                    self._parse_education_section(section_content)
-                )
-            elif 'skill' in section_name.lower():
-                profile_data['skills']['technical'].extend(
-                    self._parse_skills_section(section_content)
-                )
-        
-        return profile_data
-
-    def _parse_text_sections(self, content: str) -> Dict[str, str]:
-        """Parse text content into sections"""
-        sections = {}
-        current_section = 'general'
-        current_content = []
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Check if line is a section header
-            if self._is_section_header(line):
-                # Save previous section
-                if current_content:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                # Start new section
-                current_section = line.strip(':').strip('#').strip()
-                current_content = []
-            else:
-                current_content.append(line)
-        
-        # Save last section
-        if current_content:
-            sections[current_section] = '\n'.join(current_content)
-        
-        return sections
-
-    def _is_section_header(self, line: str) -> bool:
-        """Check if line is a section header"""
-        return (line.startswith('#') or 
-                line.endswith(':') or 
-                line.isupper() and len(line) > 3)
-
-    def _parse_personal_section(self, content: str) -> Dict[str, str]:
-        """Parse personal information from text"""
-        personal = {}
-        
-        # Email pattern
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
-        if email_match:
-            personal['email'] = email_match.group()
-        
-        # Phone pattern
-        phone_match = re.search(r'[\+]?[1-9]?[\d\s\-\(\)\.]{7,15}', content)
-        if phone_match:
-            personal['phone'] = phone_match.group().strip()
-        
-        # Name extraction (simple heuristic)
-        lines = content.split('\n')
-        for line in lines:
-            if 'name' in line.lower():
-                name_part = line.split(':')[-1].strip()
-                if ' ' in name_part:
-                    parts = name_part.split()
-                    personal['firstName'] = parts[0]
-                    personal['lastName'] = ' '.join(parts[1:])
-        
-        return personal
-
-    def _parse_work_section(self, content: str) -> List[Dict[str, str]]:
-        """Parse work experience from text"""
-        positions = []
-        
-        # Split by job entries (simple heuristic)
-        job_blocks = re.split(r'\n\s*\n', content)
-        
-        for block in job_blocks:
-            if block.strip():
-                position = {}
-                lines = block.split('\n')
-                
-                # First line often contains company and title
-                if lines:
-                    first_line = lines[0].strip()
-                    if ',' in first_line:
-                        parts = first_line.split(',')
-                        position['title'] = parts[0].strip()
-                        position['company'] = parts[1].strip()
-                    else:
-                        position['company'] = first_line
-                
-                # Look for dates
-                date_pattern = r'\b(19|20)\d{2}\b'
-                dates = re.findall(date_pattern, block)
-                if len(dates) >= 2:
-                    position['startDate'] = dates[0]
-                    position['endDate'] = dates[1]
-                elif len(dates) == 1:
-                    position['startDate'] = dates[0]
-                    position['endDate'] = 'present'
-                
-                # Description is remaining text
-                if len(lines) > 1:
-                    position['description'] = '\n'.join(lines[1:]).strip()
-                
-                if position:
-                    positions.append(position)
-        
-        return positions
-
-    def _parse_education_section(self, content: str) -> List[Dict[str, str]]:
-        """Parse education from text"""
-        schools = []
-        
-        # Split by school entries
-        school_blocks = re.split(r'\n\s*\n', content)
-        
-        for block in school_blocks:
-            if block.strip():
-                school = {}
-                lines = block.split('\n')
-                
-                # First line often contains institution
-                if lines:
-                    school['institution'] = lines[0].strip()
-                
-                # Look for degree keywords
-                degree_keywords = ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'diploma']
-                for line in lines:
-                    for keyword in degree_keywords:
-                        if keyword in line.lower():
-                            school['degree'] = line.strip()
-                            break
-                
-                # Look for graduation year
-                date_pattern = r'\b(19|20)\d{2}\b'
-                dates = re.findall(date_pattern, block)
-                if dates:
-                    school['graduationDate'] = dates[-1]  # Last date is likely graduation
-                
-                if school:
-                    schools.append(school)
-        
-        return schools
-
-    def _parse_skills_section(self, content: str) -> List[str]:
-        """Parse skills from text"""
-        skills = []
-        
-        # Split by commas, newlines, or bullets
-        skill_text = re.sub(r'[•\-\*]', ',', content)
-        potential_skills = re.split(r'[,\n]', skill_text)
-        
-        for skill in potential_skills:
-            skill = skill.strip()
-            if skill and len(skill) > 1:
-                skills.append(skill)
-        
-        return skills
+        if detect_compression(filename):
+            with open_text(filename, 'r', encoding='utf-8') as f:
+                return self.text_parser.parse_text(f.read())
+        return self.text_parser.parse_file(filename)
 
     def _save_txt(self, data: Dict[str, Any], filename: str) -> bool:
         """Save data as formatted text"""
@@ -536,44 +1112,390 @@ class ProfileDataConverter:
                         output.append(f"  • {cert}")
                 output.append("")
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open_text(filename, 'w', encoding='utf-8') as f:
             f.write('\n'.join(output))
         
         return True
 
-    def standardize_dates(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Standardize all dates in the profile to ISO format (YYYY-MM-DD)"""
-        standardized = json.loads(json.dumps(data))  # Deep copy
+    def _load_pbin(self, filename: str) -> Dict[str, Any]:
+        """Load the first profile from a binary profile store"""
+        self._check_uncompressed_pbin(filename, 'r')
+        with BinaryProfileStore(filename) as store:
+            ids = store.ids()
+            if not ids:
+                raise ValueError(f"Binary profile store is empty: {filename}")
+            return store.get(ids[0])
+
+    def _save_pbin(self, data: Dict[str, Any], filename: str) -> bool:
+        """Save a single profile as a binary profile store"""
+        self._check_uncompressed_pbin(filename, 'w')
+        BinaryProfileStore.write(filename, [(self._profile_id(data, 'profile'), data)])
+        return True
+
+    @staticmethod
+    def _check_uncompressed_pbin(filename: str, mode: str):
+        """Binary stores are memory-mapped for random access, so they cannot be compressed"""
+        if detect_compression(filename, mode):
+            raise ValueError(f"Binary profile stores cannot be compressed: {filename}")
+
+    def _profile_id(self, profile: Dict[str, Any], default: str) -> str:
+        """Pick a record id from profile metadata"""
+        metadata = profile.get('metadata') if isinstance(profile, dict) else None
+        if isinstance(metadata, dict):
+            for key in ('id', 'sourceFile'):
+                if metadata.get(key):
+                    return str(metadata[key])
+        return default
+
+    # Columns of a CSV profile dataset; rows follow the _save_csv layout
+    # with a profileId column tying rows to their profile
+    DATASET_CSV_FIELDS = [
+        'profileId', 'type', 'firstName', 'lastName', 'email', 'phone',
+        'company', 'title', 'startDate', 'endDate', 'description', 'location',
+        'institution', 'degree', 'fieldOfStudy', 'graduationDate', 'gpa'
+    ]
+
+    def convert_dataset(self, input_file: str, output_file: str) -> int:
+        """
+        Stream a profile dataset between JSONL and CSV
         
-        def standardize_date_recursive(obj):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if 'date' in key.lower() and isinstance(value, str):
-                        obj[key] = self._standardize_single_date(value)
-                    else:
-                        standardize_date_recursive(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    standardize_date_recursive(item)
+        Either side may be gzip/bz2/lzma compressed (detected by magic bytes
+        or extension); data is processed one profile at a time, so archives
+        are never expanded on disk or held in memory as a whole.
+        
+        Args:
+            input_file: Dataset path (.jsonl or .csv, optionally compressed)
+            output_file: Dataset path (.jsonl or .csv, optionally compressed)
+            
+        Returns:
+            Number of profiles written
+        """
+        input_format = self._detect_dataset_format(input_file)
+        output_format = self._detect_dataset_format(output_file)
+        
+        if input_format == 'jsonl':
+            profiles = (json.loads(text) for _, text in iter_records(input_file))
+        else:
+            profiles = self._iter_csv_dataset(input_file)
+        
+        count = 0
+        if output_format == 'jsonl':
+            with open_text(output_file, 'w') as f:
+                for profile in profiles:
+                    f.write(json.dumps(profile, ensure_ascii=False) + '\n')
+                    count += 1
+        else:
+            with open_text(output_file, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=self.DATASET_CSV_FIELDS,
+                                        extrasaction='ignore')
+                writer.writeheader()
+                for profile in profiles:
+                    count += 1
+                    profile_id = self._profile_id(profile, str(count))
+                    for row in self._dataset_rows(profile):
+                        row['profileId'] = profile_id
+                        writer.writerow(row)
+        
+        return count
+
+    def _detect_dataset_format(self, filename: str) -> str:
+        """Detect a dataset format (jsonl or csv) from the extension"""
+        extension = strip_compression_extension(filename).lower().split('.')[-1]
+        if extension not in ('jsonl', 'csv'):
+            raise ValueError(f"Unsupported dataset format: {extension}")
+        return extension
+
+    def _dataset_rows(self, profile: Dict[str, Any]):
+        """Yield CSV rows for one profile"""
+        personal = profile.get('personalInfo')
+        if isinstance(personal, dict):
+            row = {key: value for key, value in personal.items() if not isinstance(value, (dict, list))}
+            row['type'] = 'personal'
+            yield row
+        
+        for position in profile.get('workExperience', {}).get('positions', []):
+            row = dict(position)
+            row['type'] = 'work'
+            yield row
+        
+        for school in profile.get('education', {}).get('schools', []):
+            row = dict(school)
+            row['type'] = 'education'
+            yield row
+
+    def _iter_csv_dataset(self, filename: str):
+        """Yield profiles from a CSV dataset, grouping consecutive rows by profileId"""
+        personal_fields = ['firstName', 'lastName', 'email', 'phone']
+        work_fields = ['company', 'title', 'startDate', 'endDate', 'description', 'location']
+        education_fields = ['institution', 'degree', 'fieldOfStudy', 'graduationDate', 'gpa']
+        
+        current_id = None
+        profile = None
+        with open_text(filename, 'r', newline='') as f:
+            for row in csv.DictReader(f):
+                if profile is None or row.get('profileId') != current_id:
+                    if profile is not None:
+                        yield profile
+                    current_id = row.get('profileId')
+                    profile = {
+                        'personalInfo': {},
+                        'workExperience': {'positions': []},
+                        'education': {'schools': []}
+                    }
+                    if current_id:
+                        profile['metadata'] = {'id': current_id}
+                
+                row_type = row.get('type')
+                if row_type == 'personal':
+                    profile['personalInfo'].update(
+                        {key: row[key] for key in personal_fields if row.get(key)}
+                    )
+                elif row_type == 'work':
+                    profile['workExperience']['positions'].append(
+                        {key: row[key] for key in work_fields if row.get(key)}
+                    )
+                elif row_type == 'education':
+                    profile['education']['schools'].append(
+                        {key: row[key] for key in education_fields if row.get(key)}
+                    )
+        
+        if profile is not None:
+            yield profile
+
+    def pack_jsonl(self, jsonl_file: str, output_file: str) -> int:
+        """
+        Pack a JSONL profile dataset into a binary profile store
+        
+        Records are keyed by metadata.id or metadata.sourceFile, falling
+        back to the record number. Duplicate ids raise ValueError rather
+        than hide a profile behind another.
+        
+        Returns:
+            Number of profiles packed
+        """
+        def records():
+            for number, (offset, text) in enumerate(iter_records(jsonl_file), 1):
+                profile = json.loads(text)
+                yield self._profile_id(profile, str(number)), profile
         
-        standardize_date_recursive(standardized)
-        return standardized
+        self._check_uncompressed_pbin(output_file, 'w')
+        return BinaryProfileStore.write(output_file, records())
+
+    def standardize_dates(self, data: Dict[str, Any], in_place: bool = False) -> Dict[str, Any]:
+        """
+        Standardize all dates in the profile to ISO format (YYYY-MM-DD)
+        
+        Args:
+            data: Profile data
+            in_place: Update data directly instead of returning a standardized copy
+            
+        Returns:
+            The standardized profile data
+        """
+        if in_place:
+            return self.date_normalizer.standardize_in_place(data)
+        return self.date_normalizer.standardized_copy(data)
 
     def _standardize_single_date(self, date_str: str) -> str:
         """Convert a single date string to ISO format"""
-        if not date_str or date_str.lower() in ['present', 'current', 'ongoing']:
-            return date_str
+        return self.date_normalizer.normalize(date_str)
+
+    def ingest_resumes(self, source: str, output_file: str, workers: int = None,
+                       chunk_size: int = 16, summary_file: str = None,
+                       resume: bool = True) -> Dict[str, Any]:
+        """
+        Parse many plain-text resumes into a JSONL profile dataset
         
-        # Try to parse with different formats
-        for fmt in self.date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                return parsed_date.strftime('%Y-%m-%d')
-            except ValueError:
+        Args:
+            source: Directory of .txt resumes or a glob pattern
+            output_file: JSONL file receiving one profile per line
+            workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Number of files handed to a worker at a time
+            summary_file: Path for the timing/failure summary
+                          (defaults to <output_file>.summary.json)
+            resume: Skip files already present in output_file
+            
+        Returns:
+            Summary dictionary with per-file timings and failures
+        """
+        files = self._expand_sources(source, '*.txt')
+        done = self._ingested_sources(output_file) if resume else set()
+        pending = [filename for filename in files if filename not in done]
+        
+        summary = {
+            'source': source,
+            'output': output_file,
+            'total': len(files),
+            'skipped': len(files) - len(pending),
+            'succeeded': 0,
+            'failed': 0,
+            'elapsedSeconds': 0.0,
+            'files': []
+        }
+        
+        start = time.perf_counter()
+        with open(output_file, 'a' if resume else 'w', encoding='utf-8') as out:
+            for result in self._run_workers(_parse_resume_file, _init_resume_worker,
+                                            pending, workers, chunk_size):
+                profile = result.pop('profile')
+                if result['error'] is None:
+                    out.write(json.dumps(profile, ensure_ascii=False) + '\n')
+                    out.flush()
+                    summary['succeeded'] += 1
+                else:
+                    summary['failed'] += 1
+                summary['files'].append(result)
+        summary['elapsedSeconds'] = round(time.perf_counter() - start, 6)
+        
+        with open(summary_file or output_file + '.summary.json', 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        
+        return summary
+
+    def _expand_sources(self, source: str, pattern: str) -> List[str]:
+        """Expand a directory or glob pattern into a sorted list of absolute paths"""
+        if os.path.isdir(source):
+            matches = glob.glob(os.path.join(source, '**', pattern), recursive=True)
+        else:
+            matches = glob.glob(source, recursive=True)
+        return sorted(os.path.abspath(path) for path in matches if os.path.isfile(path))
+
+    def _ingested_sources(self, output_file: str) -> set:
+        """Collect source files already written to a JSONL dataset
+        
+        A partially written last line left by an interrupted run is
+        truncated so the dataset can be appended to safely.
+        """
+        done = set()
+        if not os.path.exists(output_file):
+            return done
+        
+        good_offset = 0
+        with open(output_file, 'rb+') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b'\n'):
+                    break
+                good_offset += len(line)
+                # Complete lines that are not profiles name no source; keep them
+                metadata = record.get('metadata') if isinstance(record, dict) else None
+                source = metadata.get('sourceFile') if isinstance(metadata, dict) else None
+                if isinstance(source, str) and source:
+                    done.add(source)
+            f.truncate(good_offset)
+        
+        return done
+
+    def convert_directory(self, input_dir: str, output_dir: str, output_format: str,
+                          input_format: str = None, workers: int = None,
+                          chunk_size: int = 8, threads: bool = False,
+                          standardize_dates: bool = False) -> Dict[str, Any]:
+        """
+        Convert every supported file in a directory tree to another format
+        
+        Args:
+            input_dir: Directory containing profile files
+            output_dir: Directory receiving converted files (same relative layout)
+            output_format: Target format for every file
+            input_format: Only convert files of this format (all supported if None)
+            workers: Number of workers (defaults to CPU count)
+            chunk_size: Number of files handed to a worker at a time
+            threads: Use a thread pool instead of processes, for I/O-bound batches
+            standardize_dates: Standardize dates to ISO format before saving
+            
+        Returns:
+            Report with throughput figures and per-file errors
+        """
+        if output_format not in self.supported_formats:
+            raise ValueError(f"Unsupported format: {output_format}")
+        
+        # Same cache key convert_format uses for these options
+        options = {'standardizeDates': True} if standardize_dates else {}
+        tasks = []
+        for input_file in self._expand_sources(input_dir, '*'):
+            file_format = self._detect_format(input_file)
+            if not file_format or (input_format and file_format != input_format):
                 continue
+            relative = strip_compression_extension(os.path.relpath(input_file, input_dir))
+            output_file = os.path.join(output_dir, os.path.splitext(relative)[0] + '.' + output_format)
+            tasks.append((input_file, output_file, file_format, output_format, options))
         
-        # If no format matches, return original
-        return date_str
+        # Inputs differing only in extension (a.json, a.yaml) would race on
+        # the same output file, so none of them is converted
+        claims = defaultdict(list)
+        for task in tasks:
+            claims[task[1]].append(task[0])
+        collisions = [
+            {'file': task[0], 'error': f"Output {task[1]} would also be written from "
+                                       f"{', '.join(other for other in claims[task[1]] if other != task[0])}"}
+            for task in tasks if len(claims[task[1]]) > 1
+        ]
+        tasks = [task for task in tasks if len(claims[task[1]]) == 1]
+        
+        # Cache checks and updates stay in this process so workers never
+        # race on the manifest
+        total = len(tasks) + len(collisions)
+        if self.cache:
+            tasks = [task for task in tasks if not self.cache.is_up_to_date(*task)]
+        
+        report = {
+            'inputDir': input_dir,
+            'outputDir': output_dir,
+            'outputFormat': output_format,
+            'total': total,
+            'cached': total - len(collisions) - len(tasks),
+            'succeeded': 0,
+            'failed': len(collisions),
+            'inputBytes': 0,
+            'elapsedSeconds': 0.0,
+            'filesPerSecond': 0.0,
+            'megabytesPerSecond': 0.0,
+            'errors': collisions
+        }
+        
+        start = time.perf_counter()
+        for result in self._run_workers(_convert_file, _init_convert_worker, tasks,
+                                        workers, chunk_size, threads):
+            report['inputBytes'] += result['bytes']
+            if result['error'] is None:
+                report['succeeded'] += 1
+                if self.cache:
+                    self.cache.record(*result['task'])
+            else:
+                report['failed'] += 1
+                report['errors'].append({'file': result['file'], 'error': result['error']})
+        
+        if self.cache:
+            self.cache.save()
+        
+        elapsed = time.perf_counter() - start
+        report['elapsedSeconds'] = round(elapsed, 6)
+        if elapsed > 0:
+            report['filesPerSecond'] = round(len(tasks) / elapsed, 2)
+            report['megabytesPerSecond'] = round(report['inputBytes'] / elapsed / 1e6, 3)
+        
+        return report
+
+    def _run_workers(self, func, initializer, tasks: list, workers: int,
+                     chunk_size: int, threads: bool = False):
+        """Yield func(task) results as they complete, using a worker pool when useful"""
+        if not tasks:
+            return
+        
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            initializer()
+            for task in tasks:
+                yield func(task)
+            return
+        
+        pool_class = multiprocessing.pool.ThreadPool if threads else multiprocessing.Pool
+        with pool_class(processes=workers, initializer=initializer) as pool:
+            for result in pool.imap_unordered(func, tasks, chunksize=chunk_size):
+                yield result
 
     def validate_data_structure(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Validate profile data structure and return any issues"""
@@ -621,23 +1543,165 @@ class ProfileDataConverter:
         return issues
 
 
+# Per-worker instances, reused for every task a process or thread handles
+_worker_state = threading.local()
+
+
+def _init_resume_worker():
+    """Create the per-worker resume parser"""
+    _worker_state.text_parser = ResumeTextParser()
+
+
+def _parse_resume_file(filename: str) -> Dict[str, Any]:
+    """Parse one resume in a worker, capturing timing and any failure"""
+    start = time.perf_counter()
+    try:
+        profile = _worker_state.text_parser.parse_file(filename)
+        profile['metadata'] = {'sourceFile': filename}
+        error = None
+    except Exception as e:
+        profile = None
+        error = f"{type(e).__name__}: {e}"
+    
+    return {
+        'file': filename,
+        'seconds': round(time.perf_counter() - start, 6),
+        'error': error,
+        'profile': profile
+    }
+
+
+def _init_convert_worker():
+    """Create the per-worker converter"""
+    _worker_state.converter = ProfileDataConverter()
+
+
+def _convert_file(task: tuple) -> Dict[str, Any]:
+    """Convert one file in a worker, capturing timing and any failure"""
+    input_file, output_file, input_format, output_format, options = task
+    start = time.perf_counter()
+    error = None
+    try:
+        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+        if not _worker_state.converter.convert_format(input_file, output_file, input_format, output_format,
+                                                      standardize_dates=bool(options.get('standardizeDates'))):
+            error = "Conversion failed"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    
+    try:
+        size = os.path.getsize(input_file)
+    except OSError:
+        size = 0
+    
+    return {
+        'file': input_file,
+        'task': task,
+        'seconds': round(time.perf_counter() - start, 6),
+        'bytes': size,
+        'error': error
+    }
+
+
 def main():
     """Command-line interface for the data converter"""
     parser = argparse.ArgumentParser(description='Convert profile data between formats')
-    parser.add_argument('input', help='Input file path')
-    parser.add_argument('output', help='Output file path')
-    parser.add_argument('--input-format', '-if', choices=['json', 'csv', 'xml', 'yaml', 'txt'],
+    parser.add_argument('input', help='Input file path (directory with --batch, directory or glob with --ingest)')
+    parser.add_argument('output', help='Output file path (directory with --batch, JSONL with --ingest)')
+    parser.add_argument('--input-format', '-if', choices=['json', 'csv', 'xml', 'yaml', 'txt', 'pbin'],
                        help='Input format (auto-detected if not specified)')
-    parser.add_argument('--output-format', '-of', choices=['json', 'csv', 'xml', 'yaml', 'txt'],
+    parser.add_argument('--output-format', '-of', choices=['json', 'csv', 'xml', 'yaml', 'txt', 'pbin'],
                        help='Output format (auto-detected if not specified)')
     parser.add_argument('--standardize-dates', '-sd', action='store_true',
                        help='Standardize all dates to ISO format')
     parser.add_argument('--validate', '-v', action='store_true',
                        help='Validate data structure')
+    parser.add_argument('--ingest', action='store_true',
+                       help='Parse a directory or glob of text resumes into a JSONL dataset')
+    parser.add_argument('--batch', '-b', action='store_true',
+                       help='Convert every file in the input directory to --output-format')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Workers for --batch/--ingest (default: CPU count)')
+    parser.add_argument('--threads', action='store_true',
+                       help='Use worker threads instead of processes for --batch (I/O-bound inputs)')
+    parser.add_argument('--chunk-size', type=int, default=16,
+                       help='Files dispatched to a worker at a time (default: 16)')
+    parser.add_argument('--summary', help='Summary file for --ingest (default: OUTPUT.summary.json)')
+    parser.add_argument('--no-resume', action='store_true',
+                       help='Start --ingest from scratch instead of skipping ingested files')
+    parser.add_argument('--dataset', action='store_true',
+                       help='Stream a JSONL/CSV profile dataset (optionally .gz/.bz2/.xz) to JSONL/CSV')
+    parser.add_argument('--pack', action='store_true',
+                       help='Pack a JSONL profile dataset into a binary profile store (.pbin)')
+    parser.add_argument('--cache', metavar='MANIFEST',
+                       help='Skip conversions whose output is up to date, tracked in this manifest')
     
     args = parser.parse_args()
     
-    converter = ProfileDataConverter()
+    converter = ProfileDataConverter(cache_file=args.cache)
+    
+    if args.batch:
+        if not args.output_format:
+            parser.error('--batch requires --output-format')
+        if args.validate:
+            parser.error('--validate is not supported with --batch; '
+                         'validate the output directory with data_validator.py --dir')
+        report = converter.convert_directory(
+            args.input,
+            args.output,
+            args.output_format,
+            input_format=args.input_format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            threads=args.threads,
+            standardize_dates=args.standardize_dates
+        )
+        print(f"Converted {report['succeeded']} of {report['total']} files "
+              f"in {report['elapsedSeconds']:.2f}s "
+              f"({report['filesPerSecond']:.1f} files/s, {report['megabytesPerSecond']:.2f} MB/s)")
+        if converter.cache:
+            print(f"Cache saved {report['cached']} conversions")
+        if report['errors']:
+            print(f"Failed to convert {report['failed']} files:")
+            for entry in report['errors']:
+                print(f"  ✗ {entry['file']}: {entry['error']}")
+        sys.exit(1 if report['failed'] else 0)
+    
+    if args.dataset:
+        try:
+            count = converter.convert_dataset(args.input, args.output)
+            print(f"Converted {count} profiles from {args.input} to {args.output}")
+        except (OSError, ValueError, EOFError) as e:
+            print(f"Error: {e}")
+        return
+    
+    if args.pack:
+        try:
+            count = converter.pack_jsonl(args.input, args.output)
+            print(f"Packed {count} profiles into {args.output}")
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+        return
+    
+    if args.ingest:
+        summary = converter.ingest_resumes(
+            args.input,
+            args.output,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            summary_file=args.summary,
+            resume=not args.no_resume
+        )
+        print(f"Ingested {summary['succeeded']} of {summary['total']} resumes "
+              f"into {args.output} in {summary['elapsedSeconds']:.2f}s")
+        if summary['skipped']:
+            print(f"Skipped {summary['skipped']} already ingested files")
+        if summary['failed']:
+            print(f"Failed to parse {summary['failed']} files:")
+            for entry in summary['files']:
+                if entry['error']:
+                    print(f"  ✗ {entry['file']}: {entry['error']}")
+        return
     
     try:
         # Convert format
@@ -645,22 +1709,22 @@ def main():
             args.input, 
             args.output,
             args.input_format,
-            args.output_format
+            args.output_format,
+            standardize_dates=args.standardize_dates
         )
         
+        if converter.cache:
+            converter.cache.save()
+            if converter.cache.hits:
+                print(f"Output is up to date (cache saved {converter.cache.hits} conversion)")
+        
         if success:
             print(f"Successfully converted {args.input} to {args.output}")
             
-            # Post-processing options
             if args.standardize_dates:
-                # Load converted data, standardize dates, and save again
-                data = converter._load_data(args.output, 
-                                          args.output_format or converter._detect_format(args.output))
-                standardized = converter.standardize_dates(data)
-                converter._save_data(standardized, args.output, 
-                                   args.output_format or converter._detect_format(args.output))
                 print("Dates standardized to ISO format")
             
+            # Post-processing options
             if args.validate:
                 # Validate the converted data
                 data = converter._load_data(args.output, 
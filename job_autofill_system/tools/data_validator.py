@@ -5,10 +5,715 @@ Validates JSON profile data structure and content
 """
 
 import json
+import glob
+import hashlib
+import marshal
+import math
+import multiprocessing
+import os
 import re
-from typing import Dict, List, Any, Tuple
-from datetime import datetime
+import sys
+from collections import Counter
+from typing import Dict, List, Any, Iterator, NamedTuple, Optional, Tuple
+from datetime import date, datetime
+from itertools import repeat
 import argparse
+import time
+
+from archive_io import iter_records, open_binary
+from json_stream import JsonStreamError, JsonStreamReader
+
+# NumPy is optional and slow to import, so batch timeline analysis loads it on
+# first use and falls back to pure Python without it
+np = None
+_numpy_checked = False
+
+
+def _load_numpy():
+    """Import NumPy into the module on first call; returns None if unavailable"""
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+    return np
+
+
+class ValidationResult(NamedTuple):
+    """Immutable outcome of validating one profile"""
+    is_valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+
+
+class StreamIssue(NamedTuple):
+    """Error or warning found while streaming a profile, at a byte offset"""
+    severity: str
+    offset: int
+    message: str
+
+
+KNOWN_SECTIONS = frozenset(['personalInfo', 'workExperience', 'education', 'skills', 'metadata'])
+PHONE_SEPARATORS = re.compile(r'[\s\-\(\)]')
+
+
+class ErrorBudget(list):
+    """Error list that stops validation once it holds max_errors entries"""
+
+    class Exhausted(Exception):
+        """Raised by append when the budget is used up"""
+
+    def __init__(self, max_errors: int):
+        super().__init__()
+        if max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+        self.max_errors = max_errors
+
+    def append(self, error: str):
+        super().append(error)
+        if len(self) >= self.max_errors:
+            raise ErrorBudget.Exhausted()
+
+
+class MarkedErrors(list):
+    """Error list remembering how many warnings preceded each error
+    
+    Lets a cached section result be cut off where an error budget would
+    have stopped the checks, keeping exactly the warnings found before.
+    """
+
+    def __init__(self, warnings: List[str]):
+        super().__init__()
+        self.warnings = warnings
+        self.marks = []
+
+    def append(self, error: str):
+        super().append(error)
+        self.marks.append(len(self.warnings))
+
+
+class CompiledSchema:
+    """Section checks specialized for one validator configuration
+    
+    The nested required_fields dict and the patterns are resolved once into
+    closures holding plain tuples, pre-formatted messages and bound regex
+    methods, so validating a profile performs no configuration lookups.
+    Messages are identical to the interpreted checks it replaced
+    (tests/reference_validator.py).
+    
+    A schema compiled with check_warnings=False leaves out every check that
+    can only produce a warning (phone format, date ordering, empty sections,
+    the language loop, ...), for callers that only need to know validity.
+    """
+
+    _cache = {}
+
+    @classmethod
+    def get(cls, required_fields: Dict[str, Dict[str, List[str]]],
+            patterns: Dict[str, Any], check_warnings: bool = True) -> 'CompiledSchema':
+        """Return the compiled schema for a configuration, compiling it once per process"""
+        key = cls._configuration_key(required_fields, patterns, check_warnings)
+        schema = cls._cache.get(key)
+        if schema is None:
+            schema = cls._cache[key] = cls(required_fields, patterns, check_warnings)
+        return schema
+
+    @staticmethod
+    def _configuration_key(required_fields, patterns, check_warnings) -> tuple:
+        return (
+            json.dumps(required_fields, sort_keys=True),
+            tuple(sorted((name, pattern.pattern, pattern.flags)
+                         for name, pattern in patterns.items())),
+            check_warnings
+        )
+
+    def __init__(self, required_fields: Dict[str, Dict[str, List[str]]],
+                 patterns: Dict[str, Any], check_warnings: bool = True):
+        self.check_warnings = check_warnings
+        # Stable across processes, so persisted results can be tied to the rules
+        self.fingerprint = hashlib.sha256(repr(
+            self._configuration_key(required_fields, patterns, check_warnings)
+        ).encode('utf-8')).hexdigest()[:16]
+        self.check_personal_info = self._compile_personal_info(required_fields, patterns, check_warnings)
+        self.check_position = self._compile_position(required_fields, patterns, check_warnings)
+        self.check_school = self._compile_school(required_fields, patterns, check_warnings)
+        self.check_work_experience = self._compile_work_experience(self.check_position, check_warnings)
+        self.check_education = self._compile_education(self.check_school, check_warnings)
+        self.check_skills = self._compile_skills(check_warnings)
+
+    def validate(self, profile_data: Any, max_errors: int = None) -> Tuple[List[str], List[str]]:
+        """
+        Run every section check, returning (errors, warnings)
+        
+        Args:
+            profile_data: Profile to validate
+            max_errors: Stop as soon as this many errors were found (None = all)
+        """
+        errors = [] if max_errors is None else ErrorBudget(max_errors)
+        warnings = []
+        
+        if not isinstance(profile_data, dict):
+            errors = ["Profile data must be a dictionary"]
+            return errors, warnings
+        
+        get = profile_data.get
+        try:
+            self.check_personal_info(get('personalInfo', {}), errors, warnings)
+            self.check_work_experience(get('workExperience', {}), errors, warnings)
+            self.check_education(get('education', {}), errors, warnings)
+            self.check_skills(get('skills', {}), errors, warnings)
+        except ErrorBudget.Exhausted:
+            return errors, warnings
+        
+        if self.check_warnings:
+            unknown_sections = set(profile_data.keys()) - KNOWN_SECTIONS
+            if unknown_sections:
+                warnings.append(f"Unknown sections found: {', '.join(unknown_sections)}")
+        
+        return errors, warnings
+
+    @staticmethod
+    def _memoized_match(pattern, max_size: int = 4096):
+        """Wrap pattern.match in a result cache; profile dates repeat heavily"""
+        match = pattern.match
+        results = {}
+        
+        def memoized_match(value):
+            try:
+                return results[value]
+            except KeyError:
+                pass
+            except TypeError:
+                # Unhashable values fail inside match() exactly as before
+                return match(value)
+            if len(results) >= max_size:
+                results.clear()
+            result = results[value] = match(value) is not None
+            return result
+        
+        return memoized_match
+
+    @staticmethod
+    def _compile_personal_info(required_fields, patterns, check_warnings):
+        required = tuple(
+            (field, f"Personal info: {field} is required")
+            for field in required_fields['personalInfo']['required']
+        )
+        email_match = patterns['email'].match
+        phone_match = patterns['phone'].match
+        url_match = patterns['url'].match
+        strip_phone = PHONE_SEPARATORS.sub
+        
+        def check_personal_info(personal_info, errors, warnings):
+            if not personal_info:
+                errors.append("Personal information section is required")
+                return
+            
+            for field, message in required:
+                if field not in personal_info or not personal_info[field]:
+                    errors.append(message)
+            
+            get = personal_info.get
+            email = get('email', '')
+            if email and not email_match(email):
+                errors.append(f"Personal info: Invalid email format: {email}")
+            
+            if check_warnings:
+                phone = get('phone', '')
+                if phone and not phone_match(strip_phone('', phone)):
+                    warnings.append(f"Personal info: Phone number format may be invalid: {phone}")
+            
+            url = get('linkedin', '')
+            if url and not url_match(url):
+                errors.append(f"Personal info: Invalid linkedin URL format: {url}")
+            url = get('website', '')
+            if url and not url_match(url):
+                errors.append(f"Personal info: Invalid website URL format: {url}")
+            
+            if check_warnings:
+                address = get('address', {})
+                if address and isinstance(address, dict):
+                    if 'street' in address and not address['street']:
+                        warnings.append("Personal info: Address street is empty")
+        
+        return check_personal_info
+
+    @classmethod
+    def _compile_position(cls, required_fields, patterns, check_warnings):
+        required = tuple(required_fields['workExperience']['position_required'])
+        date_match = cls._memoized_match(patterns['date'])
+        
+        def check_position(index, position, errors, warnings):
+            number = index + 1
+            if not isinstance(position, dict):
+                errors.append(f"Position {number}: Must be a dictionary")
+                return
+            
+            for field in required:
+                if field not in position or not position[field]:
+                    errors.append(f"Position {number}: {field} is required")
+            
+            start_date = position.get('startDate', '')
+            end_date = position.get('endDate', '')
+            
+            if start_date and not date_match(start_date):
+                errors.append(f"Position {number}: Invalid start date format: {start_date}")
+            
+            if end_date and not date_match(end_date):
+                errors.append(f"Position {number}: Invalid end date format: {end_date}")
+            
+            if (check_warnings and start_date and end_date and
+                    end_date.lower() not in ('present', 'current') and
+                    start_date > end_date):
+                warnings.append(f"Position {number}: Start date is after end date")
+        
+        return check_position
+
+    @classmethod
+    def _compile_school(cls, required_fields, patterns, check_warnings):
+        required = tuple(required_fields['education']['school_required'])
+        date_match = cls._memoized_match(patterns['date'])
+        
+        def check_school(index, school, errors, warnings):
+            number = index + 1
+            if not isinstance(school, dict):
+                errors.append(f"School {number}: Must be a dictionary")
+                return
+            
+            for field in required:
+                if field not in school or not school[field]:
+                    errors.append(f"School {number}: {field} is required")
+            
+            grad_date = school.get('graduationDate', '')
+            if grad_date and not date_match(grad_date):
+                errors.append(f"School {number}: Invalid graduation date format: {grad_date}")
+            
+            gpa = school.get('gpa', '')
+            if gpa:
+                try:
+                    gpa_float = float(gpa)
+                    if check_warnings and (gpa_float < 0 or gpa_float > 4.0):
+                        warnings.append(f"School {number}: GPA {gpa} seems unusual (expected 0-4.0)")
+                except ValueError:
+                    errors.append(f"School {number}: Invalid GPA format: {gpa}")
+        
+        return check_school
+
+    @staticmethod
+    def _compile_work_experience(check_position, check_warnings):
+        def check_work_experience(work_experience, errors, warnings):
+            if not work_experience:
+                if check_warnings:
+                    warnings.append("Work experience section is empty")
+                return
+            
+            positions = work_experience.get('positions', [])
+            if not positions:
+                if check_warnings:
+                    warnings.append("No work positions found")
+                return
+            
+            if not isinstance(positions, list):
+                errors.append("Work experience positions must be a list")
+                return
+            
+            for index, position in enumerate(positions):
+                check_position(index, position, errors, warnings)
+        
+        return check_work_experience
+
+    @staticmethod
+    def _compile_education(check_school, check_warnings):
+        def check_education(education, errors, warnings):
+            if not education:
+                if check_warnings:
+                    warnings.append("Education section is empty")
+                return
+            
+            schools = education.get('schools', [])
+            if not schools:
+                if check_warnings:
+                    warnings.append("No educational institutions found")
+                return
+            
+            if not isinstance(schools, list):
+                errors.append("Education schools must be a list")
+                return
+            
+            for index, school in enumerate(schools):
+                check_school(index, school, errors, warnings)
+        
+        return check_education
+
+    @staticmethod
+    def _compile_skills(check_warnings):
+        def check_skills(skills, errors, warnings):
+            if not skills:
+                if check_warnings:
+                    warnings.append("Skills section is empty")
+                return
+            
+            get = skills.get
+            if check_warnings and not (get('technical') or get('languages') or
+                                       get('certifications') or get('softSkills')):
+                warnings.append("No skills found in any category")
+            
+            technical = get('technical', [])
+            if technical and not isinstance(technical, list):
+                errors.append("Technical skills must be a list")
+            
+            languages = get('languages', [])
+            if languages:
+                if not isinstance(languages, list):
+                    errors.append("Languages must be a list")
+                elif check_warnings:
+                    for lang in languages:
+                        if isinstance(lang, dict) and 'language' not in lang:
+                            warnings.append("Language entry missing 'language' field")
+        
+        return check_skills
+
+
+class TimelineAnalyzer:
+    """Consistency checks across all positions and schools of a profile
+    
+    Dates are parsed once into integer day numbers ('present' and 'current'
+    map to the reference day: the today passed in, otherwise the date when
+    analyze or analyze_many is called, so a long-lived analyzer follows the
+    calendar). Positions are sorted by start once, and a
+    sweep keeping the furthest end seen so far finds overlaps and gaps, so
+    a profile costs O(n log n) in its positions. An overlapping position is
+    reported against the position holding that furthest end, not against
+    every position it overlaps.
+    
+    Entries without a parseable start, or with an end that is neither a
+    date nor present/current, are left to the per-entry format checks.
+    """
+
+    ONGOING = ('present', 'current')
+    DATE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$', re.ASCII)
+
+    # Keeps profiles apart when the batch path sorts them as one array;
+    # larger than date.max.toordinal()
+    PROFILE_STRIDE = 1 << 22
+
+    def __init__(self, min_gap_days: int = 90, today: date = None):
+        self.min_gap_days = min_gap_days
+        self.fixed_today = today
+        self.today = None
+        self.refresh_today()
+        self._days = {}
+
+    def refresh_today(self):
+        """Move the reference day to the current date unless a fixed today was given"""
+        self.today = (self.fixed_today or date.today()).toordinal()
+
+    def day_number(self, value: Any) -> Optional[int]:
+        """
+        Day number of a YYYY-MM-DD or present/current value, None if unparseable
+        
+        Only dates are cached; present/current follow the reference day.
+        """
+        try:
+            return self._days[value]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+        
+        day = None
+        if isinstance(value, str):
+            text = value.strip()
+            if text.lower() in self.ONGOING:
+                return self.today
+            match = self.DATE.match(text)
+            if match:
+                try:
+                    day = date(*map(int, match.groups())).toordinal()
+                except ValueError:
+                    day = None
+        # A century of distinct dates is about 36500 entries
+        if len(self._days) >= 65536:
+            self._days.clear()
+        self._days[value] = day
+        return day
+
+    @classmethod
+    def is_ongoing(cls, value: Any) -> bool:
+        return isinstance(value, str) and value.strip().lower() in cls.ONGOING
+
+    def position_spans(self, positions: Any) -> Tuple[List[Tuple[int, int, int]], List[int], List[int]]:
+        """
+        Parse positions into sweep input
+        
+        Returns:
+            Tuple of (spans as (start, end, index), current role indices,
+            indices of positions that end before they start)
+        """
+        spans = []
+        current = []
+        impossible = []
+        if not isinstance(positions, list):
+            return spans, current, impossible
+        
+        for index, position in enumerate(positions):
+            if not isinstance(position, dict):
+                continue
+            start = self.day_number(position.get('startDate'))
+            end = self.day_number(position.get('endDate'))
+            if start is None or end is None:
+                continue
+            if start > end:
+                impossible.append(index)
+                continue
+            if end == self.today and self.is_ongoing(position.get('endDate')):
+                current.append(index)
+            spans.append((start, end, index))
+        return spans, current, impossible
+
+    def school_impossible(self, schools: Any) -> List[int]:
+        """Indices of schools whose end or graduation date precedes their start"""
+        impossible = []
+        if not isinstance(schools, list):
+            return impossible
+        
+        for index, school in enumerate(schools):
+            if not isinstance(school, dict):
+                continue
+            start = self.day_number(school.get('startDate'))
+            if start is None:
+                continue
+            for field in ('endDate', 'graduationDate'):
+                end = self.day_number(school.get(field))
+                if end is not None and start > end:
+                    impossible.append(index)
+                    break
+        return impossible
+
+    def sweep(self, spans: List[Tuple[int, int, int]]) -> Tuple[list, list]:
+        """
+        Find overlaps and gaps among position spans
+        
+        Returns:
+            Tuple of (overlaps, gaps) as lists of (earlier index, later index, days)
+        """
+        overlaps = []
+        gaps = []
+        min_gap_days = self.min_gap_days
+        max_end = None
+        holder = None
+        for start, end, index in sorted(spans):
+            if max_end is not None:
+                if start < max_end:
+                    overlaps.append((holder, index, min(end, max_end) - start))
+                elif start - max_end > min_gap_days:
+                    gaps.append((holder, index, start - max_end))
+            if max_end is None or end >= max_end:
+                max_end = end
+                holder = index
+        return overlaps, gaps
+
+    def analyze(self, profile_data: Any) -> Dict[str, Any]:
+        """
+        Analyze one profile's employment and education timeline
+        
+        Returns:
+            Dictionary with overlaps and gaps as (index, index, days) lists,
+            current roles, impossible positions and schools (0-based indices)
+            and human-readable warnings
+        """
+        self.refresh_today()
+        positions, schools = self._entries(profile_data)
+        spans, current, impossible = self.position_spans(positions)
+        overlaps, gaps = self.sweep(spans)
+        return self._result(overlaps, gaps, current, impossible, self.school_impossible(schools))
+
+    def analyze_many(self, profiles: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Analyze many profiles, parsing and sweeping all of them at once with NumPy when available
+        
+        Returns:
+            One analyze() result per profile, in order
+        """
+        if _load_numpy() is None:
+            return [self.analyze(profile_data) for profile_data in profiles]
+        
+        self.refresh_today()
+        counts = []
+        indices = []
+        start_values = []
+        end_values = []
+        impossible_schools = []
+        for profile_data in profiles:
+            positions, schools = self._entries(profile_data)
+            impossible_schools.append(self.school_impossible(schools))
+            if not isinstance(positions, list):
+                counts.append(0)
+                continue
+            try:
+                starts = list(map(dict.get, positions, repeat('startDate')))
+                ends = list(map(dict.get, positions, repeat('endDate')))
+                kept = range(len(positions))
+            except TypeError:
+                # Some entries are not dictionaries
+                kept = [index for index, position in enumerate(positions) if isinstance(position, dict)]
+                starts = [positions[index].get('startDate') for index in kept]
+                ends = [positions[index].get('endDate') for index in kept]
+            counts.append(len(kept))
+            indices.extend(kept)
+            start_values.extend(starts)
+            end_values.extend(ends)
+        
+        overlaps = [[] for _ in profiles]
+        gaps = [[] for _ in profiles]
+        current = [[] for _ in profiles]
+        impossible = [[] for _ in profiles]
+        if indices:
+            profile_ids = np.repeat(np.arange(len(profiles), dtype=np.int64), counts)
+            indices = np.array(indices, dtype=np.int64)
+            starts, start_valid, _ = self._day_number_array(start_values)
+            ends, end_valid, ongoing = self._day_number_array(end_values)
+            
+            valid = start_valid & end_valid
+            backwards = valid & (starts > ends)
+            valid &= ~backwards
+            for found, target in ((backwards, impossible), (valid & ongoing, current)):
+                for profile_id, index in zip(profile_ids[found].tolist(), indices[found].tolist()):
+                    target[profile_id].append(index)
+            
+            if valid.any():
+                self._sweep_arrays(profile_ids[valid], starts[valid], ends[valid], indices[valid],
+                                   overlaps, gaps)
+        
+        return [
+            self._result(overlaps[profile_id], gaps[profile_id], current[profile_id],
+                         impossible[profile_id], impossible_schools[profile_id])
+            for profile_id in range(len(profiles))
+        ]
+
+    def _day_number_array(self, values: List[Any]):
+        """
+        Vectorized day_number
+        
+        Canonical YYYY-MM-DD strings are parsed from their code points and
+        'present'/'current' are matched directly; the few other values
+        (other spellings, padded or malformed text) go through day_number.
+        
+        Returns:
+            Tuple of (day numbers, parseable mask, present/current mask) arrays
+        """
+        # One spare column shows whether a string was longer than ten characters
+        texts = np.array([value if type(value) is str else '' for value in values], dtype='<U11')
+        codes = texts.view(np.uint32).reshape(len(texts), 11)
+        digits = codes.astype(np.int32) - ord('0')
+        digit_columns = [0, 1, 2, 3, 5, 6, 8, 9]
+        canonical = (((digits[:, digit_columns] >= 0) & (digits[:, digit_columns] <= 9)).all(axis=1) &
+                     (codes[:, 4] == ord('-')) & (codes[:, 7] == ord('-')) & (codes[:, 10] == 0))
+        
+        year = np.where(canonical, digits[:, 0] * 1000 + digits[:, 1] * 100 +
+                        digits[:, 2] * 10 + digits[:, 3], 1970)
+        month = np.where(canonical, digits[:, 5] * 10 + digits[:, 6], 1)
+        day = np.where(canonical, digits[:, 8] * 10 + digits[:, 9], 1)
+        valid = canonical & (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+        month = np.where(valid, month, 1)
+        
+        month_start = ((year.astype(np.int64) - 1970) * 12 + month - 1).astype('datetime64[M]')
+        first_day = month_start.astype('datetime64[D]').astype(np.int64)
+        month_days = (month_start + 1).astype('datetime64[D]').astype(np.int64) - first_day
+        valid &= day <= month_days
+        
+        # date(1970, 1, 1).toordinal() == 719163
+        days = first_day + day - 1 + 719163
+        ongoing = (texts == 'present') | (texts == 'current')
+        days[ongoing] = self.today
+        valid |= ongoing
+        for position in np.flatnonzero(~(canonical | ongoing)).tolist():
+            value = values[position]
+            number = self.day_number(value)
+            if number is not None:
+                days[position] = number
+                valid[position] = True
+                ongoing[position] = self.is_ongoing(value)
+        return days, valid, ongoing
+
+    def _sweep_arrays(self, profile_ids, starts, ends, indices, overlaps, gaps):
+        """Vectorized sweep over every profile's spans, filling per-profile result lists"""
+        # Offsetting each profile by a stride turns the per-profile running
+        # maximum into a single cumulative maximum over the sorted batch
+        offset = profile_ids * self.PROFILE_STRIDE
+        starts = starts + offset
+        ends = ends + offset
+        
+        # Entries arrive in (profile, index) order, so two stable sorts give
+        # the (profile, start, end, index) order of the per-profile sweep
+        order = np.argsort(ends, kind='stable')
+        order = order[np.argsort(starts[order], kind='stable')]
+        profile_ids = profile_ids[order]
+        indices = indices[order]
+        starts = starts[order]
+        ends = ends[order]
+        
+        max_end = np.maximum.accumulate(ends)
+        positions = np.arange(len(ends))
+        holder = np.maximum.accumulate(np.where(ends == max_end, positions, -1))
+        
+        previous_end = np.empty_like(max_end)
+        previous_end[1:] = max_end[:-1]
+        previous_holder = np.empty_like(holder)
+        previous_holder[1:] = holder[:-1]
+        has_previous = np.empty(len(ends), dtype=bool)
+        has_previous[0] = False
+        has_previous[1:] = profile_ids[1:] == profile_ids[:-1]
+        
+        overlap = has_previous & (starts < previous_end)
+        gap = has_previous & ~overlap & (starts - previous_end > self.min_gap_days)
+        overlap_days = np.minimum(ends, previous_end) - starts
+        gap_days = starts - previous_end
+        
+        for found, days, target in ((overlap, overlap_days, overlaps), (gap, gap_days, gaps)):
+            found_profiles = profile_ids[found].tolist()
+            earlier = indices[previous_holder[found]].tolist()
+            later = indices[found].tolist()
+            for profile_id, first, second, length in zip(found_profiles, earlier, later,
+                                                          days[found].tolist()):
+                target[profile_id].append((first, second, length))
+
+    @staticmethod
+    def _entries(profile_data: Any) -> Tuple[Any, Any]:
+        if not isinstance(profile_data, dict):
+            return None, None
+        work_experience = profile_data.get('workExperience')
+        education = profile_data.get('education')
+        positions = work_experience.get('positions') if isinstance(work_experience, dict) else None
+        schools = education.get('schools') if isinstance(education, dict) else None
+        return positions, schools
+
+    @staticmethod
+    def _result(overlaps, gaps, current, impossible, impossible_schools) -> Dict[str, Any]:
+        warnings = []
+        for first, second, days in overlaps:
+            warnings.append(f"Timeline: Positions {first + 1} and {second + 1} overlap by {days} days")
+        for first, second, days in gaps:
+            warnings.append(f"Timeline: {days}-day gap between positions {first + 1} and {second + 1}")
+        if len(current) > 1:
+            numbers = ', '.join(str(index + 1) for index in current)
+            warnings.append(f"Timeline: Multiple current roles (positions {numbers})")
+        for index in impossible:
+            warnings.append(f"Timeline: Position {index + 1} ends before it starts")
+        for index in impossible_schools:
+            warnings.append(f"Timeline: School {index + 1} ends before it starts")
+        
+        return {
+            'overlaps': overlaps,
+            'gaps': gaps,
+            'currentRoles': current,
+            'impossiblePositions': impossible,
+            'impossibleSchools': impossible_schools,
+            'warnings': warnings
+        }
 
 
 class ProfileDataValidator:
@@ -47,190 +752,88 @@ class ProfileDataValidator:
             'url': re.compile(r'^https?://[^\s/$.?#].[^\s]*$'),
             'date': re.compile(r'^\d{4}-\d{2}-\d{2}$|^present$|^current$', re.IGNORECASE)
         }
+        
+        self.timeline = TimelineAnalyzer()
+        self.refresh_schema()
+
+    def refresh_schema(self):
+        """Recompile the checks after changing required_fields or patterns"""
+        self.schema = CompiledSchema.get(self.required_fields, self.patterns)
+        self.errors_only_schema = CompiledSchema.get(self.required_fields, self.patterns,
+                                                     check_warnings=False)
 
-    def validate_profile(self, profile_data: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
+    def validate_profile(self, profile_data: Dict[str, Any], fail_fast: bool = False,
+                         max_errors: int = None,
+                         skip_warnings: bool = False) -> Tuple[bool, List[str], List[str]]:
         """
         Validate complete profile data
         
         Args:
             profile_data: Dictionary containing profile information
+            fail_fast: Stop at the first error
+            max_errors: Stop after this many errors
+            skip_warnings: Skip checks that can only produce warnings
             
         Returns:
             Tuple of (is_valid, errors, warnings)
         """
-        self.errors.clear()
-        self.warnings.clear()
-        
-        if not isinstance(profile_data, dict):
-            self.errors.append("Profile data must be a dictionary")
-            return False, self.errors, self.warnings
-        
-        # Validate each section
-        self._validate_personal_info(profile_data.get('personalInfo', {}))
-        self._validate_work_experience(profile_data.get('workExperience', {}))
-        self._validate_education(profile_data.get('education', {}))
-        self._validate_skills(profile_data.get('skills', {}))
-        
-        # Check for unknown sections
-        known_sections = {'personalInfo', 'workExperience', 'education', 'skills', 'metadata'}
-        unknown_sections = set(profile_data.keys()) - known_sections
-        if unknown_sections:
-            self.warnings.append(f"Unknown sections found: {', '.join(unknown_sections)}")
-        
-        return len(self.errors) == 0, self.errors, self.warnings
-
-    def _validate_personal_info(self, personal_info: Dict[str, Any]):
-        """Validate personal information section"""
-        if not personal_info:
-            self.errors.append("Personal information section is required")
-            return
-        
-        # Check required fields
-        for field in self.required_fields['personalInfo']['required']:
-            if field not in personal_info or not personal_info[field]:
-                self.errors.append(f"Personal info: {field} is required")
-        
-        # Validate email format
-        email = personal_info.get('email', '')
-        if email and not self.patterns['email'].match(email):
-            self.errors.append(f"Personal info: Invalid email format: {email}")
-        
-        # Validate phone format
-        phone = personal_info.get('phone', '')
-        if phone:
-            # Clean phone number for validation
-            clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
-            if not self.patterns['phone'].match(clean_phone):
-                self.warnings.append(f"Personal info: Phone number format may be invalid: {phone}")
-        
-        # Validate URLs
-        for url_field in ['linkedin', 'website']:
-            url = personal_info.get(url_field, '')
-            if url and not self.patterns['url'].match(url):
-                self.errors.append(f"Personal info: Invalid {url_field} URL format: {url}")
-        
-        # Validate address structure
-        address = personal_info.get('address', {})
-        if address and isinstance(address, dict):
-            if 'street' in address and not address['street']:
-                self.warnings.append("Personal info: Address street is empty")
-
-    def _validate_work_experience(self, work_experience: Dict[str, Any]):
-        """Validate work experience section"""
-        if not work_experience:
-            self.warnings.append("Work experience section is empty")
-            return
-        
-        positions = work_experience.get('positions', [])
-        if not positions:
-            self.warnings.append("No work positions found")
-            return
+        result = self.check_profile(profile_data, fail_fast, max_errors, skip_warnings)
+        self.errors[:] = result.errors
+        self.warnings[:] = result.warnings
+        return result.is_valid, self.errors, self.warnings
+
+    def check_profile(self, profile_data: Dict[str, Any], fail_fast: bool = False,
+                      max_errors: int = None, skip_warnings: bool = False) -> ValidationResult:
+        """
+        Validate complete profile data without touching validator state
         
-        if not isinstance(positions, list):
-            self.errors.append("Work experience positions must be a list")
-            return
+        Safe to call concurrently from many threads on one validator.
+        With fail_fast or max_errors the errors are a prefix of the full
+        list; is_valid is exact in every mode.
         
-        for i, position in enumerate(positions):
-            if not isinstance(position, dict):
-                self.errors.append(f"Position {i+1}: Must be a dictionary")
-                continue
-            
-            # Check required fields
-            for field in self.required_fields['workExperience']['position_required']:
-                if field not in position or not position[field]:
-                    self.errors.append(f"Position {i+1}: {field} is required")
-            
-            # Validate dates
-            start_date = position.get('startDate', '')
-            end_date = position.get('endDate', '')
-            
-            if start_date and not self.patterns['date'].match(start_date):
-                self.errors.append(f"Position {i+1}: Invalid start date format: {start_date}")
-            
-            if end_date and not self.patterns['date'].match(end_date):
-                self.errors.append(f"Position {i+1}: Invalid end date format: {end_date}")
+        Args:
+            profile_data: Dictionary containing profile information
+            fail_fast: Stop at the first error
+            max_errors: Stop after this many errors
+            skip_warnings: Skip checks that can only produce warnings
             
-            # Check date logic
-            if (start_date and end_date and 
-                not end_date.lower() in ['present', 'current'] and
-                start_date > end_date):
-                self.warnings.append(f"Position {i+1}: Start date is after end date")
+        Returns:
+            ValidationResult with immutable error and warning tuples
+        """
+        schema = self.errors_only_schema if skip_warnings else self.schema
+        errors, warnings = schema.validate(profile_data, 1 if fail_fast else max_errors)
+        return ValidationResult(not errors, tuple(errors), tuple(warnings))
 
-    def _validate_education(self, education: Dict[str, Any]):
-        """Validate education section"""
-        if not education:
-            self.warnings.append("Education section is empty")
-            return
-        
-        schools = education.get('schools', [])
-        if not schools:
-            self.warnings.append("No educational institutions found")
-            return
-        
-        if not isinstance(schools, list):
-            self.errors.append("Education schools must be a list")
-            return
+    def analyze_timeline(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Check positions and schools against each other
         
-        for i, school in enumerate(schools):
-            if not isinstance(school, dict):
-                self.errors.append(f"School {i+1}: Must be a dictionary")
-                continue
-            
-            # Check required fields
-            for field in self.required_fields['education']['school_required']:
-                if field not in school or not school[field]:
-                    self.errors.append(f"School {i+1}: {field} is required")
-            
-            # Validate graduation date
-            grad_date = school.get('graduationDate', '')
-            if grad_date and not self.patterns['date'].match(grad_date):
-                self.errors.append(f"School {i+1}: Invalid graduation date format: {grad_date}")
+        Args:
+            profile_data: Dictionary containing profile information
             
-            # Validate GPA
-            gpa = school.get('gpa', '')
-            if gpa:
-                try:
-                    gpa_float = float(gpa)
-                    if gpa_float < 0 or gpa_float > 4.0:
-                        self.warnings.append(f"School {i+1}: GPA {gpa} seems unusual (expected 0-4.0)")
-                except ValueError:
-                    self.errors.append(f"School {i+1}: Invalid GPA format: {gpa}")
+        Returns:
+            Overlaps, gaps, current roles and impossible date orderings,
+            plus their warning messages (see TimelineAnalyzer.analyze)
+        """
+        return self.timeline.analyze(profile_data)
 
-    def _validate_skills(self, skills: Dict[str, Any]):
-        """Validate skills section"""
-        if not skills:
-            self.warnings.append("Skills section is empty")
-            return
-        
-        # Check that skills contain at least one category
-        skill_categories = ['technical', 'languages', 'certifications', 'softSkills']
-        has_skills = any(skills.get(cat) for cat in skill_categories)
-        
-        if not has_skills:
-            self.warnings.append("No skills found in any category")
-        
-        # Validate technical skills format
-        technical = skills.get('technical', [])
-        if technical and not isinstance(technical, list):
-            self.errors.append("Technical skills must be a list")
-        
-        # Validate languages format
-        languages = skills.get('languages', [])
-        if languages:
-            if not isinstance(languages, list):
-                self.errors.append("Languages must be a list")
-            else:
-                for lang in languages:
-                    if isinstance(lang, dict):
-                        if 'language' not in lang:
-                            self.warnings.append("Language entry missing 'language' field")
+    def analyze_timelines(self, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch analyze_timeline, vectorized with NumPy when it is installed"""
+        return self.timeline.analyze_many(profiles)
 
-    def validate_file(self, file_path: str) -> Tuple[bool, List[str], List[str]]:
+    def is_valid(self, profile_data: Dict[str, Any]) -> bool:
+        """Cheapest answer to "is this profile OK?": fail fast, no warning checks"""
+        return self.check_profile(profile_data, fail_fast=True, skip_warnings=True).is_valid
+
+    def validate_file(self, file_path: str, timeline: bool = False,
+                      **options) -> Tuple[bool, List[str], List[str]]:
         """
         Validate profile data from JSON file
         
         Args:
             file_path: Path to JSON file
+            timeline: Add analyze_timeline warnings
+            **options: fail_fast, max_errors, skip_warnings (see validate_profile)
             
         Returns:
             Tuple of (is_valid, errors, warnings)
@@ -238,7 +841,10 @@ class ProfileDataValidator:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return self.validate_profile(data)
+            result = self.validate_profile(data, **options)
+            if timeline:
+                self.warnings.extend(self.analyze_timeline(data)['warnings'])
+            return result
         except FileNotFoundError:
             return False, [f"File not found: {file_path}"], []
         except json.JSONDecodeError as e:
@@ -246,6 +852,246 @@ class ProfileDataValidator:
         except Exception as e:
             return False, [f"Error reading file: {e}"], []
 
+    def check_file(self, file_path: str, **options) -> ValidationResult:
+        """
+        Validate profile data from JSON file without touching validator state
+        
+        Args:
+            file_path: Path to JSON file
+            **options: fail_fast, max_errors, skip_warnings (see check_profile)
+            
+        Returns:
+            ValidationResult with immutable error and warning tuples
+        """
+        data, failure = self._load_json_file(file_path)
+        if failure:
+            return failure
+        try:
+            return self.check_profile(data, **options)
+        except Exception as e:
+            return ValidationResult(False, (f"Error reading file: {e}",), ())
+
+    def _load_json_file(self, file_path: str) -> Tuple[Any, ValidationResult]:
+        """Load a JSON file, returning (data, None) or (None, failure result)"""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f), None
+        except FileNotFoundError:
+            return None, ValidationResult(False, (f"File not found: {file_path}",), ())
+        except json.JSONDecodeError as e:
+            return None, ValidationResult(False, (f"Invalid JSON format: {e}",), ())
+        except Exception as e:
+            return None, ValidationResult(False, (f"Error reading file: {e}",), ())
+
+    def check_stream(self, file_path: str, fail_fast: bool = False, max_errors: int = None,
+                     skip_warnings: bool = False) -> ValidationResult:
+        """
+        Validate a (possibly huge or compressed) JSON profile file incrementally
+        
+        Each message ends with the byte offset of the section, position or
+        school it refers to. With fail_fast or max_errors the rest of the
+        file is not read once the budget is used up.
+        
+        Args:
+            file_path: Path to JSON file
+            fail_fast: Stop at the first error
+            max_errors: Stop after this many errors
+            skip_warnings: Skip checks that can only produce warnings
+            
+        Returns:
+            ValidationResult with immutable error and warning tuples
+        """
+        limit = 1 if fail_fast else max_errors
+        if limit is not None and limit < 1:
+            raise ValueError(f"max_errors must be at least 1, got {limit}")
+        errors = []
+        warnings = []
+        
+        issues = self.iter_stream_issues(file_path, skip_warnings)
+        try:
+            for issue in issues:
+                message = f"{issue.message} (byte {issue.offset})"
+                if issue.severity == 'warning':
+                    warnings.append(message)
+                    continue
+                errors.append(message)
+                if limit is not None and len(errors) >= limit:
+                    break
+        finally:
+            issues.close()
+        
+        return ValidationResult(not errors, tuple(errors), tuple(warnings))
+
+    def iter_stream_issues(self, file_path: str, skip_warnings: bool = False) -> Iterator[StreamIssue]:
+        """
+        Yield issues of a JSON profile file as soon as each part is decoded
+        
+        Top-level sections are decoded one at a time, and positions and
+        schools one entry at a time, so memory is bounded by the largest
+        single entry. Messages match check_profile; they follow document
+        order, and duplicate keys are each validated where json.load would
+        keep only the last one. Closing the generator stops reading.
+        
+        Args:
+            file_path: Path to JSON file (optionally gzip/bz2/lzma compressed)
+            skip_warnings: Skip checks that can only produce warnings
+            
+        Yields:
+            StreamIssue per error or warning
+        """
+        schema = self.errors_only_schema if skip_warnings else self.schema
+        try:
+            stream = open_binary(file_path)
+        except FileNotFoundError:
+            yield StreamIssue('error', 0, f"File not found: {file_path}")
+            return
+        except OSError as e:
+            yield StreamIssue('error', 0, f"Error reading file: {e}")
+            return
+        
+        with stream:
+            reader = JsonStreamReader(stream)
+            try:
+                yield from self._stream_profile(reader, schema)
+            except JsonStreamError as e:
+                yield StreamIssue('error', e.offset, f"Invalid JSON format: {e.message}")
+            except Exception as e:
+                yield StreamIssue('error', reader.offset(), f"Error reading file: {e}")
+
+    def _stream_profile(self, reader: JsonStreamReader, schema: CompiledSchema) -> Iterator[StreamIssue]:
+        if reader.peek() != '{':
+            offset = reader.offset()
+            data = reader.read_value()
+            reader.expect_end()
+            errors, warnings = schema.validate(data)
+            yield from self._stream_issues(offset, errors, warnings)
+            return
+        
+        section_checks = {
+            'personalInfo': schema.check_personal_info,
+            'workExperience': schema.check_work_experience,
+            'education': schema.check_education,
+            'skills': schema.check_skills
+        }
+        entry_lists = {
+            'workExperience': ('positions', schema.check_position),
+            'education': ('schools', schema.check_school)
+        }
+        
+        seen = set()
+        for key in reader.iter_object():
+            seen.add(key)
+            offset = reader.offset()
+            check_section = section_checks.get(key)
+            if check_section is None:
+                reader.skip_value()
+            elif key in entry_lists and reader.peek() == '{':
+                list_key, check_entry = entry_lists[key]
+                yield from self._stream_entries(reader, offset, list_key, check_entry, check_section)
+            else:
+                yield from self._stream_check(offset, check_section, reader.read_value())
+        
+        end_offset = reader.offset()
+        reader.expect_end()
+        
+        # Absent sections are checked as empty, like profile_data.get(name, {})
+        for name, check_section in section_checks.items():
+            if name not in seen:
+                yield from self._stream_check(end_offset, check_section, {})
+        
+        if schema.check_warnings:
+            unknown_sections = seen - KNOWN_SECTIONS
+            if unknown_sections:
+                yield StreamIssue('warning', end_offset,
+                                  f"Unknown sections found: {', '.join(unknown_sections)}")
+
+    def _stream_entries(self, reader: JsonStreamReader, section_offset: int, list_key: str,
+                        check_entry, check_section) -> Iterator[StreamIssue]:
+        """Stream a workExperience/education object, checking each entry as it is decoded"""
+        has_keys = False
+        has_entries = False
+        for key in reader.iter_object():
+            has_keys = True
+            if key == list_key and reader.peek() == '[':
+                for index in reader.iter_array():
+                    has_entries = True
+                    offset = reader.offset()
+                    errors = []
+                    warnings = []
+                    check_entry(index, reader.read_value(), errors, warnings)
+                    yield from self._stream_issues(offset, errors, warnings)
+            elif key == list_key:
+                # Not an array: the section check reports it like check_profile would
+                has_entries = True
+                offset = reader.offset()
+                yield from self._stream_check(offset, check_section, {list_key: reader.read_value()})
+            else:
+                reader.skip_value()
+        
+        # An empty section, or one without entries, gets the section-level warning
+        if not has_keys:
+            yield from self._stream_check(section_offset, check_section, {})
+        elif not has_entries:
+            yield from self._stream_check(section_offset, check_section, {list_key: []})
+
+    def _stream_check(self, offset: int, check_section, value: Any) -> Iterator[StreamIssue]:
+        errors = []
+        warnings = []
+        check_section(value, errors, warnings)
+        return self._stream_issues(offset, errors, warnings)
+
+    @staticmethod
+    def _stream_issues(offset: int, errors: List[str], warnings: List[str]) -> Iterator[StreamIssue]:
+        for message in errors:
+            yield StreamIssue('error', offset, message)
+        for message in warnings:
+            yield StreamIssue('warning', offset, message)
+
+    def validate_jsonl(self, file_path: str) -> Iterator[Tuple[int, bool, List[str], List[str]]]:
+        """
+        Validate every profile in a JSONL dataset without loading the whole file
+        
+        Args:
+            file_path: Path to JSONL file with one profile per line
+                       (optionally gzip/bz2/lzma compressed)
+            
+        Yields:
+            Tuple of (byte_offset, is_valid, errors, warnings) per profile,
+            with offsets into the uncompressed data
+        """
+        for offset, text in iter_records(file_path):
+            try:
+                data = json.loads(text)
+            except json.JSONDecodeError as e:
+                yield offset, False, [f"Invalid JSON format: {e}"], []
+                continue
+            result = self.check_profile(data)
+            yield offset, result.is_valid, list(result.errors), list(result.warnings)
+
+    def benchmark(self, profile_data: Dict[str, Any], iterations: int = 1000) -> Dict[str, Any]:
+        """
+        Time the compiled checks in each validation mode
+        
+        Args:
+            profile_data: Profile to validate repeatedly
+            iterations: Number of validations per mode
+            
+        Returns:
+            Seconds per mode (full, skipWarnings, failFast) for all iterations
+        """
+        modes = {
+            'full': {},
+            'skipWarnings': {'skip_warnings': True},
+            'failFast': {'fail_fast': True, 'skip_warnings': True}
+        }
+        seconds = {}
+        for mode, options in modes.items():
+            start = time.perf_counter()
+            for _ in range(iterations):
+                self.check_profile(profile_data, **options)
+            seconds[mode] = round(time.perf_counter() - start, 6)
+        return {'iterations': iterations, 'seconds': seconds}
+
     def generate_report(self, is_valid: bool, errors: List[str], warnings: List[str]) -> str:
         """Generate a validation report"""
         report = []
@@ -275,17 +1121,578 @@ class ProfileDataValidator:
         return "\n".join(report)
 
 
+class ValidationSession:
+    """Incremental validation for profiles that change one section at a time
+    
+    personalInfo, workExperience, education and skills are digested
+    separately and each section's errors and warnings are cached by digest,
+    so re-validating an edited profile only re-runs the checks of sections
+    that changed. Whole files (by size and mtime) and JSONL records (by text
+    digest) are cached as well. With cache_file the results persist between
+    runs; they are discarded when the validation rules or options differ.
+    
+    The session uses the validator's schema as of construction time.
+    """
+
+    CACHE_VERSION = 2
+    MAX_SECTION_ENTRIES = 100000
+
+    def __init__(self, validator: 'ProfileDataValidator' = None, cache_file: str = None,
+                 fail_fast: bool = False, max_errors: int = None, skip_warnings: bool = False,
+                 timeline: bool = False):
+        self.validator = validator or ProfileDataValidator()
+        self.cache_file = cache_file
+        self.max_errors = 1 if fail_fast else max_errors
+        if self.max_errors is not None and self.max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {self.max_errors}")
+        self.skip_warnings = skip_warnings
+        self.timeline = timeline
+        
+        schema = self.validator.errors_only_schema if skip_warnings else self.validator.schema
+        self.check_warnings = schema.check_warnings
+        self.section_checks = (
+            ('personalInfo', schema.check_personal_info),
+            ('workExperience', schema.check_work_experience),
+            ('education', schema.check_education),
+            ('skills', schema.check_skills)
+        )
+        # Section results never depend on the error budget; whole-profile results do
+        self.section_fingerprint = schema.fingerprint
+        self.result_fingerprint = f"{schema.fingerprint}:{self.max_errors}:{int(timeline)}"
+        
+        self.sections = {}
+        self.files = {}
+        self.records = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        
+        if cache_file and os.path.exists(cache_file):
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            # A damaged cache only costs a full re-validation
+            return
+        if cache.get('cacheVersion') != self.CACHE_VERSION:
+            return
+        if cache.get('sectionFingerprint') == self.section_fingerprint:
+            self.sections = cache.get('sections', {})
+        if cache.get('resultFingerprint') == self.result_fingerprint:
+            self.files = cache.get('files', {})
+            self.records = cache.get('records', {})
+
+    def save(self):
+        """Write the cache file atomically if anything changed"""
+        if not self.cache_file or not self._dirty:
+            return
+        
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        os.makedirs(directory, exist_ok=True)
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'cacheVersion': self.CACHE_VERSION,
+                'sectionFingerprint': self.section_fingerprint,
+                'resultFingerprint': self.result_fingerprint,
+                'sections': self.sections,
+                'files': self.files,
+                'records': self.records
+            }, f, ensure_ascii=False)
+        os.replace(temp_file, self.cache_file)
+        self._dirty = False
+
+    @staticmethod
+    def digest(value: Any) -> str:
+        """Digest of a section; marshal keeps list/tuple and True/1 apart, unlike JSON"""
+        try:
+            encoded = marshal.dumps(value)
+        except ValueError:
+            encoded = repr(value).encode('utf-8', 'surrogatepass')
+        return hashlib.sha256(encoded).hexdigest()
+
+    def check_profile(self, profile_data: Dict[str, Any]) -> ValidationResult:
+        """
+        Validate a profile, re-running only the checks of changed sections
+        
+        Args:
+            profile_data: Dictionary containing profile information
+            
+        Returns:
+            ValidationResult identical to ProfileDataValidator.check_profile
+            with the session's options, including its error budget
+        """
+        if not isinstance(profile_data, dict):
+            return ValidationResult(False, ("Profile data must be a dictionary",), ())
+        
+        errors = []
+        warnings = []
+        get = profile_data.get
+        for name, check in self.section_checks:
+            section = get(name, {})
+            key = f"{name}:{self.digest(section)}"
+            cached = self.sections.get(key)
+            if cached is None:
+                self.misses += 1
+                section_warnings = []
+                section_errors = MarkedErrors(section_warnings)
+                try:
+                    check(section, section_errors, section_warnings)
+                except Exception:
+                    if self.max_errors is None:
+                        raise
+                    # A budgeted run may stop before reaching the failing check
+                    return self.validator.check_profile(profile_data, max_errors=self.max_errors,
+                                                        skip_warnings=self.skip_warnings)
+                if len(self.sections) >= self.MAX_SECTION_ENTRIES:
+                    del self.sections[next(iter(self.sections))]
+                cached = self.sections[key] = (list(section_errors), section_warnings, section_errors.marks)
+                self._dirty = True
+            else:
+                self.hits += 1
+            section_errors, section_warnings, marks = cached
+            
+            # Stop where the budget would have stopped the checks: at its last
+            # error, with only the warnings found before it
+            if self.max_errors is not None and len(errors) + len(section_errors) >= self.max_errors:
+                last = self.max_errors - len(errors) - 1
+                errors.extend(section_errors[:last + 1])
+                warnings.extend(section_warnings[:marks[last]])
+                return ValidationResult(False, tuple(errors), tuple(warnings))
+            errors.extend(section_errors)
+            warnings.extend(section_warnings)
+        
+        if self.check_warnings:
+            unknown_sections = set(profile_data.keys()) - KNOWN_SECTIONS
+            if unknown_sections:
+                warnings.append(f"Unknown sections found: {', '.join(unknown_sections)}")
+        
+        if self.timeline:
+            warnings.extend(self.validator.analyze_timeline(profile_data)['warnings'])
+        
+        return ValidationResult(not errors, tuple(errors), tuple(warnings))
+
+    def check_file(self, file_path: str) -> ValidationResult:
+        """
+        Validate a JSON profile file, answering from the cache while its stat is unchanged
+        
+        Args:
+            file_path: Path to JSON file
+            
+        Returns:
+            ValidationResult with immutable error and warning tuples
+        """
+        cached = self.cached_file(file_path)
+        if cached is not None:
+            return cached
+        
+        data, failure = self.validator._load_json_file(file_path)
+        if failure:
+            return failure
+        try:
+            result = self.check_profile(data)
+        except Exception as e:
+            return ValidationResult(False, (f"Error reading file: {e}",), ())
+        self.record_file(file_path, result)
+        return result
+
+    def cached_file(self, file_path: str) -> ValidationResult:
+        """Return the cached result for an unchanged file, or None"""
+        entry = self.files.get(os.path.abspath(file_path))
+        if entry is None:
+            return None
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if [file_stat.st_size, file_stat.st_mtime_ns] != entry['stat']:
+            return None
+        return ValidationResult(*self._unpack(entry['result']))
+
+    def record_file(self, file_path: str, result: ValidationResult):
+        """Remember the result for a file at its current size and mtime"""
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return
+        self.files[os.path.abspath(file_path)] = {
+            'stat': [file_stat.st_size, file_stat.st_mtime_ns],
+            'result': [result.is_valid, list(result.errors), list(result.warnings)]
+        }
+        self._dirty = True
+
+    def record_key(self, text: str) -> str:
+        """Cache key of a raw JSONL record"""
+        return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+    def cached_record(self, key: str) -> ValidationResult:
+        """Return the cached result for a JSONL record key, or None"""
+        entry = self.records.get(key)
+        return ValidationResult(*self._unpack(entry)) if entry is not None else None
+
+    def record_record(self, key: str, result: ValidationResult):
+        """Remember the result for a JSONL record key"""
+        self.records[key] = [result.is_valid, list(result.errors), list(result.warnings)]
+        self._dirty = True
+
+    @staticmethod
+    def _unpack(entry: list) -> tuple:
+        is_valid, errors, warnings = entry
+        return is_valid, tuple(errors), tuple(warnings)
+
+    def stats(self) -> Dict[str, int]:
+        """Return section cache hit/miss counts and cache sizes"""
+        return {
+            'sectionHits': self.hits,
+            'sectionMisses': self.misses,
+            'sections': len(self.sections),
+            'files': len(self.files),
+            'records': len(self.records)
+        }
+
+
+class ValidationStats:
+    """Aggregate statistics over bulk validation results"""
+    
+    FORMAT_VALUE = re.compile(r'(format): .*$')
+    ENTRY_NUMBER = re.compile(r'^(Position|School) \d+')
+    
+    def __init__(self):
+        self.total = 0
+        self.passed = 0
+        self.cached = 0
+        self.error_counts = Counter()
+        self.seconds = []
+
+    def add(self, result: Dict[str, Any]):
+        """Record one per-profile result"""
+        self.total += 1
+        if result['valid']:
+            self.passed += 1
+        if result.get('cached'):
+            # Cache hits did no validation work and would skew the timings
+            self.cached += 1
+        else:
+            self.seconds.append(result['seconds'])
+        # Count each kind of error once per profile
+        self.error_counts.update(set(self.error_kind(error) for error in result['errors']))
+
+    def error_kind(self, error: str) -> str:
+        """Strip entry numbers and offending values so similar errors group together"""
+        return self.FORMAT_VALUE.sub(r'\1', self.ENTRY_NUMBER.sub(r'\1 N', error))
+
+    def percentile(self, fraction: float) -> float:
+        """Nearest-rank percentile of validation time in seconds"""
+        if not self.seconds:
+            return 0.0
+        ordered = sorted(self.seconds)
+        rank = math.ceil(fraction * len(ordered))
+        return ordered[min(len(ordered) - 1, max(0, rank - 1))]
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """Return pass rate, most common errors and timing percentiles"""
+        return {
+            'total': self.total,
+            'passed': self.passed,
+            'failed': self.total - self.passed,
+            'passRate': round(self.passed / self.total, 4) if self.total else 1.0,
+            'commonErrors': [
+                {'error': error, 'profiles': count}
+                for error, count in self.error_counts.most_common(top)
+            ],
+            'p50Ms': round(self.percentile(0.50) * 1000, 4),
+            'p99Ms': round(self.percentile(0.99) * 1000, 4),
+            'maxMs': round(max(self.seconds) * 1000, 4) if self.seconds else 0.0
+        }
+
+
+def iter_validation_tasks(directory: str = None, jsonl_file: str = None):
+    """Yield bulk validation tasks for a directory of JSON files or a JSONL dataset"""
+    if directory:
+        pattern = os.path.join(directory, '**', '*.json')
+        for file_path in sorted(glob.glob(pattern, recursive=True)):
+            yield ('file', file_path, None, None)
+    if jsonl_file:
+        for offset, text in iter_records(jsonl_file):
+            yield ('record', jsonl_file, offset, text)
+
+
+def validate_bulk(tasks, workers: int = None, chunk_size: int = 256, options: Dict[str, Any] = None,
+                  session: ValidationSession = None, timeline: bool = False):
+    """
+    Validate tasks in a process pool, yielding per-profile results as they complete
+    
+    Args:
+        tasks: Tasks from iter_validation_tasks
+        workers: Worker processes (default: CPU count)
+        chunk_size: Tasks dispatched to a worker at a time
+        options: fail_fast, max_errors, skip_warnings passed to check_profile
+        session: Optional ValidationSession; unchanged files and records are
+                 answered from it in this process and only the rest reach workers
+        timeline: Add TimelineAnalyzer warnings, analyzed per batch
+    """
+    if session is None:
+        yield from _validate_uncached(tasks, workers, chunk_size, options, timeline)
+        return
+    
+    hits = []
+    pending = {}
+    
+    def misses():
+        for task in tasks:
+            kind, source, offset, text = task
+            if kind == 'file':
+                cached = session.cached_file(source)
+            else:
+                key = pending[(source, offset)] = session.record_key(text)
+                cached = session.cached_record(key)
+            if cached is None:
+                yield task
+            else:
+                pending.pop((source, offset), None)
+                hits.append(_task_result(source, offset, cached, 0.0, cached=True))
+    
+    for result in _validate_uncached(misses(), workers, chunk_size, options, timeline):
+        while hits:
+            yield hits.pop()
+        if result['offset'] is None:
+            session.record_file(result['source'], _result_tuple(result))
+        else:
+            session.record_record(pending.pop((result['source'], result['offset'])),
+                                  _result_tuple(result))
+        yield result
+    while hits:
+        yield hits.pop()
+
+
+def _result_tuple(result: Dict[str, Any]) -> ValidationResult:
+    return ValidationResult(result['valid'], tuple(result['errors']), tuple(result['warnings']))
+
+
+def _validate_uncached(tasks, workers: int, chunk_size: int, options: Dict[str, Any],
+                       timeline: bool = False):
+    workers = workers or os.cpu_count() or 1
+    # Workers take whole batches so timeline analysis can be vectorized per batch
+    batches = _batched(tasks, chunk_size)
+    if workers == 1:
+        _init_validation_worker(options, timeline)
+        for batch in batches:
+            yield from _validate_batch(batch)
+        return
+    
+    with multiprocessing.Pool(processes=workers, initializer=_init_validation_worker,
+                              initargs=(options, timeline)) as pool:
+        for results in pool.imap_unordered(_validate_batch, batches):
+            yield from results
+
+
+def _batched(items, size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+_worker_validator = None
+_worker_options = {}
+_worker_timeline = False
+
+
+def _init_validation_worker(options: Dict[str, Any] = None, timeline: bool = False):
+    """Create the per-process validator"""
+    global _worker_validator, _worker_options, _worker_timeline
+    _worker_validator = ProfileDataValidator()
+    _worker_options = options or {}
+    _worker_timeline = timeline
+
+
+def _validate_batch(batch: list) -> List[Dict[str, Any]]:
+    """Validate a batch of tasks, adding timeline warnings for the whole batch at once"""
+    results = []
+    profiles = []
+    for task in batch:
+        result, data = _validate_task(task)
+        results.append(result)
+        profiles.append(data)
+    
+    if _worker_timeline:
+        analyzed = [index for index, data in enumerate(profiles) if isinstance(data, dict)]
+        timelines = _worker_validator.analyze_timelines([profiles[index] for index in analyzed])
+        for index, timeline in zip(analyzed, timelines):
+            results[index]['warnings'].extend(timeline['warnings'])
+    return results
+
+
+def _validate_task(task: tuple) -> Tuple[Dict[str, Any], Any]:
+    """Validate one file or JSONL record, timing only the validation itself
+    
+    Returns:
+        Tuple of (result, decoded profile or None)
+    """
+    kind, source, offset, text = task
+    
+    failure = None
+    if kind == 'file':
+        data, failure = _worker_validator._load_json_file(source)
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            data = None
+            failure = ValidationResult(False, (f"Invalid JSON format: {e}",), ())
+    
+    start = time.perf_counter()
+    if failure:
+        result = failure
+    else:
+        try:
+            result = _worker_validator.check_profile(data, **_worker_options)
+        except Exception as e:
+            result = ValidationResult(False, (f"Error validating profile: {e}",), ())
+    seconds = time.perf_counter() - start
+    
+    return _task_result(source, offset, result, seconds), data
+
+
+def _task_result(source: str, offset: int, result: ValidationResult, seconds: float,
+                 cached: bool = False) -> Dict[str, Any]:
+    task_result = {
+        'source': source,
+        'offset': offset,
+        'valid': result.is_valid,
+        'errors': list(result.errors),
+        'warnings': list(result.warnings),
+        'seconds': seconds
+    }
+    if cached:
+        task_result['cached'] = True
+    return task_result
+
+
+def run_bulk_validation(args) -> int:
+    """Stream bulk results as JSON lines, then the summary; return the exit code"""
+    stats = ValidationStats()
+    tasks = iter_validation_tasks(args.dir, args.jsonl)
+    options = validation_options(args)
+    session = None
+    if args.cache:
+        session = ValidationSession(cache_file=args.cache, timeline=args.timeline, **options)
+    
+    for result in validate_bulk(tasks, args.workers, args.chunk_size, options, session, args.timeline):
+        stats.add(result)
+        if not args.summary_only:
+            line = dict(result)
+            line['seconds'] = round(line['seconds'], 6)
+            print(json.dumps(line, ensure_ascii=False))
+    
+    summary = stats.summary()
+    if session:
+        session.save()
+        summary['cached'] = stats.cached
+    print(json.dumps({'summary': summary}, ensure_ascii=False))
+    
+    # CI gate: fail when the pass rate drops below the threshold
+    if stats.total == 0:
+        return 1
+    return 0 if summary['passRate'] >= args.min_pass_rate else 1
+
+
+def validation_options(args) -> Dict[str, Any]:
+    """check_profile keyword arguments selected on the command line"""
+    return {
+        'fail_fast': args.fail_fast,
+        'max_errors': args.max_errors,
+        'skip_warnings': args.skip_warnings
+    }
+
+
+def positive_int(text: str) -> int:
+    """argparse type for counts that must be at least 1"""
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {text!r}")
+    return value
+
+
 def main():
     """Command-line interface for the validator"""
     parser = argparse.ArgumentParser(description='Validate job profile JSON data')
-    parser.add_argument('file', help='Path to JSON profile file')
+    parser.add_argument('file', nargs='?', help='Path to JSON profile file')
     parser.add_argument('--quiet', '-q', action='store_true', help='Only show errors and warnings')
     parser.add_argument('--json-output', action='store_true', help='Output results in JSON format')
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                       help='Time N validations of the file in each mode (full, skip warnings, fail fast)')
+    parser.add_argument('--dir', help='Validate every *.json profile under this directory')
+    parser.add_argument('--jsonl', help='Validate every profile in a JSONL dataset (optionally compressed)')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Worker processes for --dir/--jsonl (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=256,
+                       help='Profiles dispatched to a worker at a time (default: 256)')
+    parser.add_argument('--summary-only', action='store_true',
+                       help='With --dir/--jsonl, print only the final summary line')
+    parser.add_argument('--min-pass-rate', type=float, default=1.0,
+                       help='With --dir/--jsonl, exit 1 when the pass rate is below this (default: 1.0)')
+    parser.add_argument('--fail-fast', action='store_true',
+                       help='Stop validating a profile at its first error')
+    parser.add_argument('--max-errors', type=positive_int, metavar='N',
+                       help='Stop validating a profile after N errors')
+    parser.add_argument('--skip-warnings', action='store_true',
+                       help='Skip checks that can only produce warnings')
+    parser.add_argument('--timeline', action='store_true',
+                       help='Also check positions and schools against each other (overlaps, gaps, ...)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Validate the file incrementally, reporting byte offsets')
+    parser.add_argument('--cache', metavar='FILE',
+                       help='Reuse results for unchanged files, records and sections across runs')
     
     args = parser.parse_args()
     
+    if args.dir or args.jsonl:
+        sys.exit(run_bulk_validation(args))
+    if not args.file:
+        parser.error('a profile file, --dir or --jsonl is required')
+    if args.stream and args.timeline:
+        parser.error('--timeline needs the whole profile and cannot be combined with --stream')
+    
     validator = ProfileDataValidator()
-    is_valid, errors, warnings = validator.validate_file(args.file)
+    
+    if args.benchmark:
+        try:
+            with open(args.file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load {args.file}: {e}", file=sys.stderr)
+            sys.exit(1)
+        result = validator.benchmark(data, args.benchmark)
+        if args.json_output:
+            print(json.dumps(result, indent=2))
+        else:
+            for mode, seconds in result['seconds'].items():
+                print(f"{mode + ':':<14}{seconds * 1e6 / args.benchmark:.1f} µs/profile")
+        sys.exit(0)
+    
+    if args.stream:
+        result = validator.check_stream(args.file, **validation_options(args))
+        is_valid, errors, warnings = result.is_valid, list(result.errors), list(result.warnings)
+    elif args.cache:
+        session = ValidationSession(validator, args.cache, timeline=args.timeline,
+                                    **validation_options(args))
+        result = session.check_file(args.file)
+        session.save()
+        is_valid, errors, warnings = result.is_valid, list(result.errors), list(result.warnings)
+    else:
+        is_valid, errors, warnings = validator.validate_file(args.file, args.timeline,
+                                                             **validation_options(args))
     
     if args.json_output:
         result = {
@@ -309,7 +1716,7 @@ def main():
                     print(f"  {warning}")
     
     # Exit with error code if validation failed
-    exit(0 if is_valid else 1)
+    sys.exit(0 if is_valid else 1)
 
 
 if __name__ == '__main__':
@@ -12,6 +12,69 @@ from collections import defaultdict
 from difflib import SequenceMatcher
 
 
+def _full_name(info: Any) -> Optional[str]:
+    if not isinstance(info, dict):
+        return None
+    return ' '.join(part for part in (info.get('firstName'), info.get('lastName'))
+                    if isinstance(part, str) and part) or None
+
+
+def _join_items(value: Any, key: str = None) -> Optional[str]:
+    """Comma-join a list, taking key from dict items; text passes through, anything else is None"""
+    if isinstance(value, str):
+        return value
+    if not isinstance(value, list):
+        return None
+    parts = (str(item.get(key) or '') if key and isinstance(item, dict) else str(item) for item in value)
+    return ', '.join(part for part in parts if part)
+
+
+# Where each mapped profile field lives in a profile: a path of keys and list
+# indices, optionally followed by a function turning the found value into
+# what a form field expects
+PROFILE_PATHS = {
+    'firstName': (('personalInfo', 'firstName'),),
+    'lastName': (('personalInfo', 'lastName'),),
+    'fullName': (('personalInfo',), _full_name),
+    'email': (('personalInfo', 'email'),),
+    'phone': (('personalInfo', 'phone'),),
+    'street': (('personalInfo', 'address', 'street'),),
+    'street2': (('personalInfo', 'address', 'line2'),),
+    'city': (('personalInfo', 'address', 'city'),),
+    'state': (('personalInfo', 'address', 'state'),),
+    'zipCode': (('personalInfo', 'address', 'zipCode'),),
+    'country': (('personalInfo', 'address', 'country'),),
+    'linkedin': (('personalInfo', 'linkedin'),),
+    'website': (('personalInfo', 'website'),),
+    'github': (('personalInfo', 'github'),),
+    'summary': (('personalInfo', 'summary'),),
+    'objective': (('personalInfo', 'objective'),),
+    'currentCompany': (('workExperience', 'positions', 0, 'company'),),
+    'currentTitle': (('workExperience', 'positions', 0, 'title'),),
+    'yearsExperience': (('workExperience', 'totalYears'),),
+    'salary': (('workExperience', 'positions', 0, 'salary'),),
+    'university': (('education', 'schools', 0, 'institution'),),
+    'degree': (('education', 'schools', 0, 'degree'),),
+    'major': (('education', 'schools', 0, 'fieldOfStudy'),),
+    'gpa': (('education', 'schools', 0, 'gpa'),),
+    'graduationYear': (('education', 'schools', 0, 'graduationDate'),
+                       lambda value: value[:4] if isinstance(value, str) and value[:4].isdigit() else None),
+    'skills': (('skills', 'technical'), _join_items),
+    'certifications': (('skills', 'certifications'), lambda value: _join_items(value, 'name')),
+    'languages': (('skills', 'languages'), lambda value: _join_items(value, 'language')),
+    'coverLetter': (('application', 'coverLetter'),),
+    'references': (('application', 'references'),),
+    'availability': (('application', 'availability'),),
+    'workAuthorization': (('application', 'workAuthorization'),),
+    'willingToRelocate': (('application', 'willingToRelocate'),),
+    'travelWillingness': (('application', 'travelWillingness'),)
+}
+
+# Confidence earned by an exact name match, per unit of fuzzy name
+# similarity otherwise, and for an attribute naming the mapped field
+CONFIDENCE_WEIGHTS = {'direct': 0.8, 'fuzzy': 0.6, 'attribute': 0.2}
+
+
 class FormFieldMapper:
     """Maps job application form fields to profile data"""
     
@@ -181,6 +244,8 @@ class FormFieldMapper:
             'gpa': re.compile(r'^\d\.\d{1,2}$|^[0-4]\.\d{1,2}$'),
             'salary': re.compile(r'^\$?\d{1,3}(,\d{3})*(\.\d{2})?$')
         }
+        
+        self.confidence_weights = dict(CONFIDENCE_WEIGHTS)
 
     def map_field_to_profile(self, field_name: str, field_attributes: Dict[str, Any] = None) -> Optional[str]:
         """
@@ -292,23 +357,10 @@ class FormFieldMapper:
         }
         
         for field in form_data:
-            field_name = field.get('name', field.get('id', ''))
-            field_type = field.get('type', 'text')
-            field_attributes = {
-                'placeholder': field.get('placeholder', ''),
-                'label': field.get('label', ''),
-                'class': field.get('class', ''),
-                'title': field.get('title', '')
-            }
-            
-            # Attempt to map the field
-            mapped_field = self.map_field_to_profile(field_name, field_attributes)
+            field_name, field_type, field_attributes, mapped_field, confidence = self._map_form_field(field)
             
             if mapped_field:
                 results['mapped_fields'][field_name] = mapped_field
-                
-                # Calculate confidence score
-                confidence = self._calculate_confidence(field_name, mapped_field, field_attributes)
                 results['confidence_scores'][field_name] = confidence
                 
                 results['statistics']['mapped'] += 1
@@ -327,29 +379,124 @@ class FormFieldMapper:
         
         return results
 
+    def _map_form_field(self, field: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any], Optional[str], float]:
+        """Map one form field, returning (name, type, attributes, profile field, confidence)"""
+        field_name = field.get('name', field.get('id', ''))
+        field_type = field.get('type', 'text')
+        field_attributes = {
+            'placeholder': field.get('placeholder', ''),
+            'label': field.get('label', ''),
+            'class': field.get('class', ''),
+            'title': field.get('title', '')
+        }
+        
+        # Attempt to map the field
+        mapped_field = self.map_field_to_profile(field_name, field_attributes)
+        confidence = 0.0
+        if mapped_field:
+            confidence = self._calculate_confidence(field_name, mapped_field, field_attributes)
+        
+        return field_name, field_type, field_attributes, mapped_field, confidence
+
+    def plan_form_mapping(self, form_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Map every field of a form, independent of any profile
+        
+        Args:
+            form_data: List of dictionaries containing field information
+            
+        Returns:
+            One {'name', 'type', 'profileField', 'path', 'confidence'} entry per field, in order
+        """
+        plan = []
+        for field in form_data:
+            field_name, field_type, _, mapped_field, confidence = self._map_form_field(field)
+            path = PROFILE_PATHS.get(mapped_field, ((),))[0]
+            plan.append({
+                'name': field_name,
+                'type': field_type,
+                'profileField': mapped_field,
+                'path': '.'.join(map(str, path)) or None,
+                'confidence': round(confidence, 3)
+            })
+        return plan
+
+    def plan_form_fill(self, form_data: List[Dict[str, Any]], profile_data: Dict[str, Any],
+                       mapping: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Decide what to put in each field of a form, like the extension's fill step
+        
+        Args:
+            form_data: List of dictionaries containing field information
+            profile_data: Profile supplying the values
+            mapping: Result of plan_form_mapping for this form, if already known
+            
+        Returns:
+            {'fields': mapping entries plus 'value' (None when nothing fits),
+             'filled': number of fields with a value, 'total': number of fields}
+        """
+        if mapping is None:
+            mapping = self.plan_form_mapping(form_data)
+        
+        fields = []
+        filled = 0
+        for field, entry in zip(form_data, mapping):
+            value = self.resolve_profile_value(entry['profileField'], profile_data)
+            if value is not None:
+                filled += 1
+            planned = dict(entry, value=value)
+            if field.get('selector'):
+                planned['selector'] = field['selector']
+            fields.append(planned)
+        
+        return {'fields': fields, 'filled': filled, 'total': len(fields)}
+
+    @staticmethod
+    def resolve_profile_value(profile_field: Optional[str], profile_data: Any) -> Any:
+        """Look up the value for a mapped profile field; None if the profile has none"""
+        location = PROFILE_PATHS.get(profile_field)
+        if location is None:
+            return None
+        
+        value = profile_data
+        for key in location[0]:
+            if isinstance(key, int):
+                if not isinstance(value, list) or len(value) <= key:
+                    return None
+            elif not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+        
+        if len(location) > 1:
+            value = location[1](value)
+        if value == '' or value == []:
+            return None
+        return value
+
     def _calculate_confidence(self, field_name: str, mapped_field: str, 
                             attributes: Dict[str, Any]) -> float:
         """Calculate confidence score for a field mapping"""
         confidence = 0.0
+        weights = self.confidence_weights
         
         # Direct match gets highest confidence
         field_name_clean = self._clean_field_name(field_name)
         if field_name_clean in self.field_mappings.get(mapped_field, []):
-            confidence += 0.8
+            confidence += weights['direct']
         else:
             # Fuzzy match gets lower confidence
             best_ratio = 0
             for variation in self.field_mappings.get(mapped_field, []):
                 ratio = SequenceMatcher(None, field_name_clean, variation).ratio()
                 best_ratio = max(best_ratio, ratio)
-            confidence += best_ratio * 0.6
+            confidence += best_ratio * weights['fuzzy']
         
         # Bonus for attribute matches
         for attr_value in attributes.values():
             if isinstance(attr_value, str) and attr_value:
                 attr_clean = self._clean_field_name(attr_value)
                 if attr_clean in self.field_mappings.get(mapped_field, []):
-                    confidence += 0.2
+                    confidence += weights['attribute']
                     break
         
         return min(confidence, 1.0)
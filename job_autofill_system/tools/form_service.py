@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Form Service
+Localhost HTTP endpoint mapping whole forms for the browser extension
+"""
+
+import argparse
+import asyncio
+import hashlib
+import http.client
+import json
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from field_mapper import FormFieldMapper
+from latency_stats import LatencyStats
+
+DEFAULT_PORT = 8765
+
+# Only loopback addresses may be bound or named in the Host header
+LOOPBACK_HOSTS = {'127.0.0.1', '::1', 'localhost'}
+
+# Browser origins allowed to call the service (pages on the web are refused)
+EXTENSION_ORIGINS = ('chrome-extension://', 'moz-extension://')
+
+MAX_BODY_BYTES = 8 << 20
+
+# Seconds an idle keep-alive connection stays open
+KEEP_ALIVE_SECONDS = 60
+
+# Distinct forms whose mapping is kept, least recently used dropped first
+PLAN_CACHE_SIZE = 512
+
+# Field attributes the mapping depends on; anything else (selectors, values)
+# can change without invalidating a cached form
+FINGERPRINT_KEYS = ('name', 'id', 'type', 'placeholder', 'label', 'class', 'title')
+
+# In-page budgets: a first look at a new form, and any repeat visit
+LATENCY_TARGETS_MS = {'cold': 250.0, 'cached': 5.0}
+
+REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 403: 'Forbidden',
+           404: 'Not Found', 405: 'Method Not Allowed', 411: 'Length Required',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+# A typical application form, used when benchmarking without --form
+SAMPLE_FORM = [
+    {'name': name, 'type': field_type, 'label': label}
+    for name, field_type, label in [
+        ('first_name', 'text', 'First Name'), ('last_name', 'text', 'Last Name'),
+        ('email', 'email', 'Email Address'), ('phone', 'tel', 'Phone Number'),
+        ('address_line_1', 'text', 'Street Address'), ('city', 'text', 'City'),
+        ('state', 'select-one', 'State'), ('zip', 'text', 'ZIP Code'),
+        ('linkedin_profile', 'url', 'LinkedIn Profile'), ('portfolio', 'url', 'Website'),
+        ('current_employer', 'text', 'Current Company'), ('job_title', 'text', 'Current Title'),
+        ('years_experience', 'number', 'Years of Experience'), ('desired_salary', 'text', 'Salary Expectations'),
+        ('school', 'text', 'University'), ('degree', 'select-one', 'Degree'),
+        ('major', 'text', 'Field of Study'), ('gpa', 'text', 'GPA'),
+        ('grad_year', 'text', 'Graduation Year'), ('skills', 'textarea', 'Skills'),
+        ('cover_letter', 'textarea', 'Cover Letter'), ('start_date', 'date', 'Available Start Date'),
+        ('work_authorization', 'select-one', 'Are you authorized to work?'),
+        ('relocate', 'checkbox', 'Willing to relocate'), ('referral_source', 'text', 'How did you hear about us?')
+    ]
+]
+
+
+def form_fingerprint(fields: List[Dict[str, Any]]) -> str:
+    """
+    Stable digest of the field attributes that decide a form's mapping
+    
+    Key presence is encoded next to each value, because the mapper treats a
+    missing key differently from an explicit null (a missing name falls back
+    to the id, a missing type defaults to text).
+    """
+    canonical = [[[key in field, field.get(key)] for key in FINGERPRINT_KEYS] for field in fields]
+    text = json.dumps(canonical, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+
+def host_name(header: str) -> str:
+    """
+    Host name of a Host header without its port; '' when malformed
+    
+    IPv6 literals must be bracketed ([::1] or [::1]:8765).
+    """
+    header = header.strip().lower()
+    if header.startswith('['):
+        end = header.find(']')
+        name, port = header[1:end], header[end + 1:]
+        if end == -1 or (port and not (port.startswith(':') and port[1:].isdigit())):
+            return ''
+        return name
+    
+    name, separator, port = header.partition(':')
+    if separator and not port.isdigit():
+        return ''
+    return name
+
+
+class FormPlanService:
+    """
+    Maps whole forms with one warm FormFieldMapper, caching by form fingerprint
+    
+    The mapping of a form depends only on its fields, so repeat visits to a
+    form are answered from the cache; profile values are resolved per request.
+    """
+
+    def __init__(self, mapper: FormFieldMapper = None, cache_size: int = PLAN_CACHE_SIZE):
+        self.mapper = mapper or FormFieldMapper()
+        self.cache_size = cache_size
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def plan(self, form: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map one form and, given a profile, plan the value of every field
+        
+        Args:
+            form: {'fields': [...], 'profile': optional profile, 'analyze': optional bool}
+        
+        Returns:
+            {'fingerprint', 'cached', 'fields', 'filled', 'total'} plus
+            'analysis' (analyze_form_fields output) when requested
+        """
+        if not isinstance(form, dict) or not isinstance(form.get('fields'), list):
+            raise ValueError("A form needs a 'fields' list")
+        fields = form['fields']
+        if not all(isinstance(field, dict) for field in fields):
+            raise ValueError("Every field must be a JSON object")
+        
+        fingerprint = form_fingerprint(fields)
+        entry = self.cache.pop(fingerprint, None)
+        cached = entry is not None
+        if cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = {'mapping': self.mapper.plan_form_mapping(fields), 'analysis': None}
+        
+        # Re-insert so dict order tracks recency
+        self.cache[fingerprint] = entry
+        if len(self.cache) > self.cache_size:
+            del self.cache[next(iter(self.cache))]
+        
+        profile = form.get('profile')
+        if profile is None:
+            planned = [dict(mapped, selector=field['selector']) if field.get('selector') else mapped
+                       for field, mapped in zip(fields, entry['mapping'])]
+            result = {'fields': planned, 'filled': 0, 'total': len(planned)}
+        else:
+            result = self.mapper.plan_form_fill(fields, profile, entry['mapping'])
+        result = dict(result, fingerprint=fingerprint, cached=cached)
+        
+        if form.get('analyze'):
+            if entry['analysis'] is None:
+                entry['analysis'] = self.mapper.analyze_form_fields(fields)
+            result['analysis'] = entry['analysis']
+        return result
+
+    def batch(self, forms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Plan several forms; a failing form yields {'error'} without affecting the rest"""
+        results = []
+        for form in forms:
+            try:
+                results.append(self.plan(form))
+            except Exception as e:
+                results.append({'error': {'type': type(e).__name__, 'message': str(e)}})
+        return results
+
+    def cache_stats(self) -> Dict[str, int]:
+        return {'forms': len(self.cache), 'hits': self.hits, 'misses': self.misses}
+
+
+class FormService:
+    """
+    Minimal asyncio HTTP/1.1 server for FormPlanService, bound to loopback only
+    
+    Routes:
+        POST /v1/forms/plan   one form: {'fields', 'profile'?, 'analyze'?}
+        POST /v1/forms/batch  {'forms': [...]} -> {'results': [...]}
+        GET  /v1/stats        per-route latency and cache statistics
+        GET  /v1/health
+    
+    Connections are kept alive between requests. Requests carrying an Origin
+    header are only accepted from browser extensions, and the Host header
+    must name a loopback address, so web pages cannot reach the service.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                 service: FormPlanService = None):
+        if host not in LOOPBACK_HOSTS:
+            raise ValueError(f"Refusing to listen on non-loopback host: {host}")
+        self.host = host
+        self.port = port
+        self.service = service or FormPlanService()
+        self.started = time.time()
+        self.stats = {}
+        self.server = None
+        self.routes = {
+            ('POST', '/v1/forms/plan'): self.service.plan,
+            ('POST', '/v1/forms/batch'): self._batch,
+            ('GET', '/v1/stats'): self.summary,
+            ('GET', '/v1/health'): self.health
+        }
+
+    async def start(self):
+        """Start listening; the bound port is stored in self.port"""
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve(self):
+        """Listen until cancelled"""
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def health(self) -> Dict[str, Any]:
+        return {'status': 'ok', 'uptimeSeconds': round(time.time() - self.started, 3)}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'routes': {route: stats.summary() for route, stats in sorted(self.stats.items())},
+            'cache': self.service.cache_stats()
+        }
+
+    def _batch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(request, dict) or not isinstance(request.get('forms'), list):
+            raise ValueError("A batch needs a 'forms' list")
+        return {'results': self.service.batch(request['forms'])}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEP_ALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line.strip():
+                    break
+                
+                parts = request_line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                
+                if len(parts) != 3:
+                    writer.write(self._response(400, {'error': 'Malformed request line'}, False, None))
+                    break
+                method, target, version = parts
+                
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                if version == 'HTTP/1.0':
+                    keep_alive = headers.get('connection', '').lower() == 'keep-alive'
+                
+                status, payload, keep_alive, origin = await self._read_and_dispatch(
+                    reader, method, target.split('?', 1)[0], headers, keep_alive)
+                writer.write(self._response(status, payload, keep_alive, origin))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_and_dispatch(self, reader: asyncio.StreamReader, method: str, path: str,
+                                 headers: Dict[str, str],
+                                 keep_alive: bool) -> Tuple[int, Any, bool, Optional[str]]:
+        """Read the body and run the route; returns (status, payload, keep_alive, cors origin)"""
+        if 'transfer-encoding' in headers:
+            return 411, {'error': 'Send a Content-Length body'}, False, None
+        length = headers.get('content-length') or '0'
+        if not length.isdigit() or not length.isascii():
+            return 400, {'error': 'Invalid Content-Length'}, False, None
+        length = int(length)
+        if length > MAX_BODY_BYTES:
+            return 413, {'error': f'Body exceeds {MAX_BODY_BYTES} bytes'}, False, None
+        body = await reader.readexactly(length) if length else b''
+        
+        host = host_name(headers.get('host', ''))
+        origin = headers.get('origin')
+        if host not in LOOPBACK_HOSTS or (origin and not origin.startswith(EXTENSION_ORIGINS)):
+            return 403, {'error': 'Forbidden'}, keep_alive, None
+        
+        if method == 'OPTIONS':
+            return 204, None, keep_alive, origin
+        
+        handler = self.routes.get((method, path))
+        if handler is None:
+            allowed = any(route_path == path for _, route_path in self.routes)
+            status = 405 if allowed else 404
+            return status, {'error': REASONS[status]}, keep_alive, origin
+        
+        stats = self.stats.get(path)
+        if stats is None:
+            stats = self.stats[path] = LatencyStats()
+        start = time.perf_counter()
+        try:
+            if method == 'POST':
+                result = handler(json.loads(body))
+            else:
+                result = handler()
+            status, payload = 200, result
+        except ValueError as e:
+            status, payload = 400, {'error': str(e)}
+        except Exception as e:
+            status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+        stats.record(time.perf_counter() - start, status != 200)
+        return status, payload, keep_alive, origin
+
+    @staticmethod
+    def _response(status: int, payload: Any, keep_alive: bool, origin: Optional[str]) -> bytes:
+        body = b''
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        lines = [
+            f"HTTP/1.1 {status} {REASONS[status]}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        if origin:
+            lines += [
+                f"Access-Control-Allow-Origin: {origin}",
+                "Access-Control-Allow-Methods: GET, POST, OPTIONS",
+                "Access-Control-Allow-Headers: Content-Type",
+                "Access-Control-Max-Age: 600",
+                "Vary: Origin"
+            ]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+class FormServiceClient:
+    """Stub client reusing one keep-alive connection, as the extension would"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT, timeout: float = 10.0):
+        self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def close(self):
+        self.connection.close()
+
+    def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        """Send one request, returning (status, decoded JSON body)"""
+        body = None if payload is None else json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        data = response.read()
+        return response.status, json.loads(data) if data else None
+
+    def plan(self, fields: List[Dict[str, Any]], profile: Dict[str, Any] = None,
+             analyze: bool = False) -> Dict[str, Any]:
+        form = {'fields': fields, 'analyze': analyze}
+        if profile is not None:
+            form['profile'] = profile
+        return self._ok(*self.request('POST', '/v1/forms/plan', form))
+
+    def batch(self, forms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self._ok(*self.request('POST', '/v1/forms/batch', {'forms': forms}))['results']
+
+    def stats(self) -> Dict[str, Any]:
+        return self._ok(*self.request('GET', '/v1/stats'))
+
+    @staticmethod
+    def _ok(status: int, payload: Any) -> Any:
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}: {payload}")
+        return payload
+
+
+def start_background_server(service: FormPlanService = None) -> FormService:
+    """Run a FormService on an ephemeral loopback port in a daemon thread"""
+    server = FormService(port=0, service=service)
+    ready = threading.Event()
+
+    def run():
+        async def main():
+            await server.start()
+            ready.set()
+            await server.server.serve_forever()
+        asyncio.run(main())
+
+    threading.Thread(target=run, daemon=True).start()
+    ready.wait()
+    return server
+
+
+def benchmark(client: FormServiceClient, fields: List[Dict[str, Any]], profile: Dict[str, Any],
+              requests: int) -> Dict[str, Any]:
+    """Time a first (uncached) plan of a form, then repeat plans over one connection"""
+    start = time.perf_counter()
+    first = client.plan(fields, profile)
+    cold = time.perf_counter() - start
+
+    stats = LatencyStats(samples=requests)
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.plan(fields, profile)
+        stats.record(time.perf_counter() - start)
+
+    return {
+        'fields': len(fields),
+        'mapped': sum(1 for field in first['fields'] if field['profileField']),
+        'coldMs': round(cold * 1000, 3),
+        'cached': stats.summary()
+    }
+
+
+def main():
+    """Command-line interface for the form service"""
+    parser = argparse.ArgumentParser(description='Localhost HTTP form mapping service for the extension')
+    parser.add_argument('action', choices=['serve', 'bench'],
+                       help='Run the service, or benchmark one with the stub client')
+    parser.add_argument('--host', default='127.0.0.1', help='Loopback address to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int,
+                       help=f'Port (serve default: {DEFAULT_PORT}; bench starts a private server if omitted)')
+    parser.add_argument('--form', help='JSON file with a list of form fields for bench (default: built-in sample)')
+    parser.add_argument('--profile', help='Profile JSON for bench fill plans')
+    parser.add_argument('--requests', '-n', type=int, default=500, help='Repeat requests for bench (default: 500)')
+    parser.add_argument('--target-cold-ms', type=float, default=LATENCY_TARGETS_MS['cold'],
+                       help=f"Budget for an uncached form (default: {LATENCY_TARGETS_MS['cold']:g})")
+    parser.add_argument('--target-p95-ms', type=float, default=LATENCY_TARGETS_MS['cached'],
+                       help=f"p95 budget for cached forms (default: {LATENCY_TARGETS_MS['cached']:g})")
+
+    args = parser.parse_args()
+
+    if args.host not in LOOPBACK_HOSTS:
+        parser.error(f"--host must be a loopback address ({', '.join(sorted(LOOPBACK_HOSTS))})")
+
+    if args.action == 'serve':
+        server = FormService(args.host, args.port or DEFAULT_PORT)
+        print(f"🚀 Form service on http://{args.host}:{server.port}/v1/forms/plan")
+        try:
+            asyncio.run(server.serve())
+        except KeyboardInterrupt:
+            print("👋 Form service stopped")
+        return
+
+    fields = SAMPLE_FORM
+    if args.form:
+        with open(args.form, 'r', encoding='utf-8') as f:
+            fields = json.load(f)
+    profile = {}
+    if args.profile:
+        with open(args.profile, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+
+    port = args.port
+    if port is None:
+        port = start_background_server().port
+    client = FormServiceClient(args.host, port)
+    try:
+        report = benchmark(client, fields, profile, args.requests)
+    finally:
+        client.close()
+
+    cached = report['cached']
+    print(f"📊 {report['fields']} fields, {report['mapped']} mapped")
+    print(f"  Uncached form: {report['coldMs']:8.2f} ms (target {args.target_cold_ms:g})")
+    print(f"  Cached p50:    {cached['p50Ms']:8.2f} ms")
+    print(f"  Cached p95:    {cached['p95Ms']:8.2f} ms (target {args.target_p95_ms:g})")
+    print(f"  Cached p99:    {cached['p99Ms']:8.2f} ms")
+
+    if report['coldMs'] > args.target_cold_ms or cached['p95Ms'] > args.target_p95_ms:
+        print("❌ Latency targets missed")
+        sys.exit(1)
+    print("✅ Latency targets met")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Unified Command Line
+Runs every tool from one entry point, importing a tool only when its command runs
+"""
+
+import argparse
+import importlib
+import os
+import shlex
+import sys
+import time
+from typing import List, Optional
+
+# Command name -> (tool module, description); modules are imported on first use
+COMMANDS = {
+    'map': ('field_mapper', 'Map form fields to profile data'),
+    'convert': ('data_converter', 'Convert profile data between formats'),
+    'validate': ('data_validator', 'Validate profile data'),
+    'template': ('template_generator', 'Generate job profile templates'),
+    'pipeline': ('profile_pipeline', 'Standardize, validate and export profiles in one pass'),
+    'daemon': ('autofill_daemon', 'Serve warm tool instances over a Unix socket'),
+    'forms': ('form_service', 'Localhost HTTP form mapping service for the extension'),
+    'bench': ('benchmark_suite', 'Benchmark the tools and compare against a baseline'),
+    'evaluate': ('mapping_evaluation', 'Measure field mapping accuracy against latency')
+}
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Default allowance for this CLI's own startup on top of a bare interpreter
+STARTUP_BUDGET_MS = 75.0
+
+
+def run_command(argv: List[str]) -> int:
+    """
+    Run one tool command in this process
+    
+    Args:
+        argv: Command name followed by the tool's own arguments
+    
+    Returns:
+        Exit code of the command
+    """
+    name, arguments = argv[0], argv[1:]
+    module = importlib.import_module(COMMANDS[name][0])
+    
+    saved_argv = sys.argv
+    sys.argv = [f"jobautofill {name}", *arguments]
+    try:
+        result = module.main()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception as e:
+        # A crashing tool fails its own command rather than the whole batch
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sys.argv = saved_argv
+        sys.stdout.flush()
+    return result if isinstance(result, int) else 0
+
+
+def run_batch(script: str, keep_going: bool = False) -> int:
+    """
+    Run a script of commands, one per line, in this process
+    
+    Tool modules stay imported and warm between commands. Blank lines and
+    # comments are ignored.
+    
+    Args:
+        script: Script file, or '-' for standard input
+        keep_going: Continue after a failing command instead of stopping
+    
+    Returns:
+        0 if every command succeeded, otherwise the last failing exit code
+    """
+    if script == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(script, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    
+    status = 0
+    commands = 0
+    failed = 0
+    start = time.perf_counter()
+    for line_number, line in enumerate(lines, 1):
+        argv = shlex.split(line, comments=True)
+        if not argv:
+            continue
+        if argv[0] not in COMMANDS:
+            print(f"❌ {script}:{line_number}: unknown command '{argv[0]}'", file=sys.stderr)
+            code = 2
+        else:
+            commands += 1
+            code = run_command(argv)
+        
+        if code:
+            failed += 1
+            status = code
+            print(f"❌ {script}:{line_number}: exited with status {code}", file=sys.stderr)
+            if not keep_going:
+                break
+    
+    elapsed = time.perf_counter() - start
+    print(f"📊 {commands} commands, {failed} failed in {elapsed:.2f}s", file=sys.stderr)
+    return status
+
+
+def measure_startup(repeat: int = 5) -> dict:
+    """
+    Measure startup costs in fresh interpreters, keeping the best of several runs
+    
+    Returns:
+        Milliseconds for a bare interpreter, for `jobautofill --help`, and per
+        command for importing its module and for `jobautofill COMMAND --help`;
+        plus any tool modules that importing the CLI loaded eagerly
+    """
+    # Only this command spawns processes, so keep subprocess off the startup path
+    import subprocess
+    
+    def best(arguments: List[str]) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *arguments], cwd=TOOLS_DIR, check=True,
+                           stdout=subprocess.DEVNULL)
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+
+    def run_python(code: str) -> str:
+        return subprocess.run([sys.executable, '-c', code, TOOLS_DIR], cwd=TOOLS_DIR,
+                              check=True, capture_output=True, text=True).stdout
+    
+    def import_time(module: str) -> float:
+        code = ("import sys, time; sys.path.insert(0, sys.argv[1]); start = time.perf_counter(); "
+                f"import {module}; print(time.perf_counter() - start)")
+        return min(float(run_python(code).split()[-1]) for _ in range(repeat)) * 1000
+    
+    cli = os.path.abspath(__file__)
+    eager = run_python("import sys; sys.path.insert(0, sys.argv[1]); import jobautofill; "
+                       "print(*[module for module, _ in jobautofill.COMMANDS.values() "
+                       "if module in sys.modules])").split()
+    return {
+        'interpreter': best(['-c', 'pass']),
+        'cli': best([cli, '--help']),
+        'imports': {name: import_time(module) for name, (module, _) in COMMANDS.items()},
+        'commands': {name: best([cli, name, '--help']) for name in COMMANDS},
+        'eager': eager
+    }
+
+
+def check_startup(repeat: int, budget_ms: float) -> int:
+    """Print startup measurements; non-zero when the CLI overhead exceeds budget_ms"""
+    timings = measure_startup(repeat)
+    overhead = timings['cli'] - timings['interpreter']
+    
+    print("⏱️  Startup (best of {})".format(repeat))
+    print(f"  Interpreter:        {timings['interpreter']:7.1f} ms")
+    print(f"  jobautofill --help: {timings['cli']:7.1f} ms  (+{overhead:.1f} ms)")
+    print("\n📦 Per command                     import     COMMAND --help")
+    for name, (module, _) in COMMANDS.items():
+        print(f"  {name:<10} {module:<20} {timings['imports'][name]:7.1f} ms  {timings['commands'][name]:7.1f} ms")
+    
+    status = 0
+    if timings['eager']:
+        print(f"\n❌ Importing the CLI loaded tool modules: {', '.join(timings['eager'])}")
+        status = 1
+    if overhead > budget_ms:
+        print(f"\n❌ CLI startup overhead {overhead:.1f} ms exceeds budget of {budget_ms:.1f} ms")
+        status = 1
+    if not status:
+        print(f"\n✅ CLI startup overhead within budget of {budget_ms:.1f} ms, no tools imported eagerly")
+    return status
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line interface for all job autofill tools"""
+    argv = sys.argv[1:] if argv is None else argv
+    
+    # Tool commands parse their own arguments, so hand them over untouched
+    if argv and argv[0] in COMMANDS:
+        return run_command(argv)
+    
+    parser = argparse.ArgumentParser(
+        prog='jobautofill',
+        description='Job autofill tools. Run "jobautofill COMMAND --help" for command options.',
+        epilog='Commands:\n' + '\n'.join(f"  {name:<10} {description}"
+                                         for name, (_, description) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    
+    batch_parser = subparsers.add_parser('batch', help='Run a script of commands in one process')
+    batch_parser.add_argument('script', help="Script with one command per line ('-' for stdin)")
+    batch_parser.add_argument('--keep-going', '-k', action='store_true',
+                              help='Continue after a failing command')
+    
+    startup_parser = subparsers.add_parser('startup', help='Measure startup and import times')
+    startup_parser.add_argument('--repeat', type=int, default=5,
+                                help='Runs per measurement, best kept (default: 5)')
+    startup_parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                                help=f'Allowed CLI startup overhead (default: {STARTUP_BUDGET_MS:g})')
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'batch':
+        return run_batch(args.script, args.keep_going)
+    if args.command == 'startup':
+        return check_startup(args.repeat, args.budget_ms)
+    
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - JSON Stream Reader
+Incremental decoding of large JSON documents one value at a time
+"""
+
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator
+
+# Bytes read from the underlying stream at a time
+CHUNK_SIZE = 1 << 16
+
+# Decode errors this close to the end of the buffer may just be truncation
+TRUNCATION_MARGIN = 64
+
+WHITESPACE = ' \t\n\r'
+
+
+class JsonStreamError(ValueError):
+    """Malformed JSON, with the byte offset where decoding failed"""
+
+    def __init__(self, message: str, offset: int):
+        super().__init__(f"{message} (byte {offset})")
+        self.message = message
+        self.offset = offset
+
+
+class JsonStreamReader:
+    """Pull-style reader over a JSON document in a binary stream
+
+    Callers walk objects and arrays with iter_object/iter_array and decode
+    the values they need with read_value. Only the value being decoded is
+    held in memory, so a huge document can be checked piece by piece, and a
+    caller can stop at any point without reading the rest of the stream.
+    Offsets are byte offsets into the (uncompressed) stream.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._position = 0
+        self._base = 0
+        self._mark_index = 0
+        self._mark_offset = 0
+        self._eof = False
+
+    def _fill(self, size: int = None) -> bool:
+        """Append at least size more bytes to the buffer; False at end of stream"""
+        if self._eof:
+            return False
+        
+        # Drop the consumed prefix so memory stays bounded
+        if self._position:
+            self._base = self._offset_of(self._position)
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+            self._mark_index = 0
+            self._mark_offset = self._base
+        
+        data = self.stream.read(max(size or 0, self.chunk_size))
+        if not data:
+            self._eof = True
+            self._buffer += self._utf8.decode(b'', final=True)
+            return False
+        self._buffer += self._utf8.decode(data)
+        return True
+
+    def offset(self) -> int:
+        """Byte offset of the current read position"""
+        self._skip_whitespace()
+        return self._offset_of(self._position)
+
+    def _offset_of(self, index: int) -> int:
+        """Byte offset of a buffer index, encoding only the text since the last query"""
+        if index < self._mark_index:
+            return self._base + len(self._buffer[:index].encode('utf-8', 'surrogatepass'))
+        text = self._buffer[self._mark_index:index]
+        self._mark_offset += len(text.encode('utf-8', 'surrogatepass'))
+        self._mark_index = index
+        return self._mark_offset
+
+    def _skip_whitespace(self):
+        while True:
+            buffer = self._buffer
+            position = self._position
+            length = len(buffer)
+            while position < length and buffer[position] in WHITESPACE:
+                position += 1
+            self._position = position
+            if position < length or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at end)"""
+        self._skip_whitespace()
+        if self._position < len(self._buffer):
+            return self._buffer[self._position]
+        return ''
+
+    def _expect(self, char: str):
+        if self.peek() != char:
+            found = repr(self.peek()) if self.peek() else 'end of data'
+            raise JsonStreamError(f"Expecting '{char}', found {found}", self.offset())
+        self._position += 1
+
+    def read_value(self) -> Any:
+        """Decode and return the next complete value"""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as e:
+                truncated = (e.msg.startswith('Unterminated string') or
+                             len(self._buffer) - e.pos < TRUNCATION_MARGIN)
+                if truncated and not self._eof:
+                    # Grow geometrically so a value spanning many chunks decodes in linear time
+                    self._fill(len(self._buffer) - self._position)
+                    continue
+                raise JsonStreamError(e.msg, self._offset_of(e.pos)) from None
+            
+            # Numbers have no closing delimiter, so one near the buffer edge may continue
+            if (end + TRUNCATION_MARGIN > len(self._buffer) and not self._eof and
+                    isinstance(value, (int, float)) and not isinstance(value, bool)):
+                self._fill(len(self._buffer) - self._position)
+                continue
+            self._position = end
+            return value
+
+    def skip_value(self):
+        """Consume the next value without keeping it"""
+        self.read_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Consume an object, yielding each key; the caller must consume each value"""
+        self._expect('{')
+        if self.peek() == '}':
+            self._position += 1
+            return
+        
+        while True:
+            if self.peek() != '"':
+                raise JsonStreamError("Expecting property name enclosed in double quotes", self.offset())
+            key = self.read_value()
+            self._expect(':')
+            yield key
+            
+            if self.peek() == ',':
+                self._position += 1
+                continue
+            self._expect('}')
+            return
+
+    def iter_array(self) -> Iterator[int]:
+        """Consume an array, yielding each index; the caller must consume each element"""
+        self._expect('[')
+        if self.peek() == ']':
+            self._position += 1
+            return
+        
+        index = 0
+        while True:
+            yield index
+            index += 1
+            
+            if self.peek() == ',':
+                self._position += 1
+                continue
+            self._expect(']')
+            return
+
+    def expect_end(self):
+        """Check that only whitespace follows the document"""
+        if self.peek():
+            raise JsonStreamError("Extra data", self.offset())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Latency Stats
+Per-endpoint call counts and latency percentiles for the local services
+"""
+
+from collections import deque
+from typing import Any, Dict
+
+# Latency samples kept per endpoint for percentiles
+LATENCY_SAMPLES = 2048
+
+
+class LatencyStats:
+    """Call count, errors and latency percentiles over recent calls of one endpoint"""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=samples)
+
+    def record(self, seconds: float, failed: bool = False):
+        self.count += 1
+        self.errors += failed
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return counts and latencies in milliseconds"""
+        recent = sorted(self.recent)
+        
+        def percentile(fraction: float) -> float:
+            if not recent:
+                return 0.0
+            return round(recent[min(len(recent) - 1, int(fraction * len(recent)))] * 1000, 3)
+        
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'meanMs': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50Ms': percentile(0.50),
+            'p95Ms': percentile(0.95),
+            'p99Ms': percentile(0.99),
+            'maxMs': round(self.max * 1000, 3)
+        }
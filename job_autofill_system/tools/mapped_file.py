@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Mapped File Reader
+Memory-mapped access to large JSONL and text exports without reading
+them into memory as a whole
+"""
+
+import json
+import mmap
+from typing import Any, Iterator, Tuple
+
+
+class MappedFile:
+    """Read-only memory map that finds record boundaries on the raw bytes
+    
+    Line boundaries are located with mmap.find, and only the records a
+    caller actually consumes are decoded, straight from a memoryview slice
+    of the mapping.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._mm = None
+        self._view = memoryview(self._mm if self._mm is not None else b'')
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def iter_line_spans(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) byte offsets of each line, excluding the newline"""
+        mm = self._mm
+        if mm is None:
+            return
+        
+        size = len(mm)
+        position = 0
+        while position < size:
+            end = mm.find(b'\n', position)
+            if end == -1:
+                end = size
+            yield position, end
+            position = end + 1
+
+    def decode(self, start: int, end: int, encoding: str = 'utf-8') -> str:
+        """Decode a byte range of the file"""
+        chunk = self._view[start:end]
+        try:
+            return str(chunk, encoding)
+        finally:
+            chunk.release()
+
+    def iter_lines(self, encoding: str = 'utf-8') -> Iterator[str]:
+        """Yield decoded lines like str.split('\\n') on the universal-newline text
+        
+        '\\r\\n' and lone '\\r' line endings are treated as newlines, and a
+        trailing newline produces a final empty line.
+        """
+        last_end = -1
+        for start, end in self.iter_line_spans():
+            last_end = end
+            line = self.decode(start, end, encoding)
+            if line.endswith('\r'):
+                line = line[:-1]
+            if '\r' in line:
+                yield from line.split('\r')
+            else:
+                yield line
+        
+        size = len(self)
+        if size == 0 or last_end < size or self._view[size - 1] == 0x0D:
+            yield ''
+
+    def iter_records(self, encoding: str = 'utf-8') -> Iterator[Tuple[int, str]]:
+        """Yield (byte_offset, text) for each non-blank line"""
+        for start, end in self.iter_line_spans():
+            if start == end:
+                continue
+            text = self.decode(start, end, encoding)
+            if text.strip():
+                yield start, text
+
+    def iter_json(self, encoding: str = 'utf-8') -> Iterator[Tuple[int, Any]]:
+        """Yield (byte_offset, value) for each JSON line"""
+        for offset, text in self.iter_records(encoding):
+            yield offset, json.loads(text)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        self._view.release()
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Mapping Evaluation
+Measures field mapping accuracy against latency across fuzzy thresholds and matcher backends
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Callable, Dict, List, Optional
+
+from field_mapper import CONFIDENCE_WEIGHTS, FormFieldMapper
+
+DEFAULT_GOLDEN_SET = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates',
+                                  'mapping_golden_set.json')
+
+# The threshold FormFieldMapper._fuzzy_match uses today
+CURRENT_THRESHOLD = 0.7
+
+DEFAULT_THRESHOLDS = [0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95]
+
+# Timed runs per field; the fastest is kept
+DEFAULT_REPEAT = 5
+
+# Mean latencies within this fraction of each other tie on the Pareto front,
+# so run-to-run timing noise cannot reorder configurations
+DEFAULT_LATENCY_TOLERANCE = 0.1
+
+# (direct, fuzzy, attribute) confidence weights to compare, the current ones first
+DEFAULT_WEIGHT_VECTORS = [tuple(CONFIDENCE_WEIGHTS.values()), (0.9, 0.5, 0.1), (0.7, 0.6, 0.3),
+                          (0.6, 0.7, 0.4), (0.8, 0.4, 0.4)]
+
+DEFAULT_CUTOFFS = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+
+# Attributes passed to the mapper, as analyze_form_fields does
+ATTRIBUTE_KEYS = ('placeholder', 'label', 'class', 'title')
+
+
+def _sequence_backend(mapper: FormFieldMapper) -> Callable[[str, float], Optional[str]]:
+    """The mapper's own SequenceMatcher scan"""
+    return lambda field_name, threshold: FormFieldMapper._fuzzy_match(mapper, field_name, threshold)
+
+
+def _quick_backend(mapper: FormFieldMapper) -> Callable[[str, float], Optional[str]]:
+    """
+    Same ratios as the sequence backend, with the variation side of each
+    matcher prepared once and ratio() skipped when its upper bounds cannot win
+    """
+    matchers = [(profile_field, SequenceMatcher(None, '', variation))
+                for profile_field, variations in mapper.field_mappings.items() for variation in variations]
+
+    def match(field_name: str, threshold: float) -> Optional[str]:
+        best_match = None
+        best_ratio = 0
+        for profile_field, matcher in matchers:
+            matcher.set_seq1(field_name)
+            floor = max(best_ratio, threshold)
+            if matcher.real_quick_ratio() < floor or matcher.quick_ratio() < floor:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio and ratio >= threshold:
+                best_ratio = ratio
+                best_match = profile_field
+        return best_match
+    return match
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _trigram_backend(mapper: FormFieldMapper) -> Callable[[str, float], Optional[str]]:
+    """Dice similarity of character trigrams, scored through an inverted index"""
+    index = defaultdict(list)
+    variations = []
+    for profile_field, names in mapper.field_mappings.items():
+        for variation in names:
+            grams = _trigrams(variation)
+            for gram in grams:
+                index[gram].append(len(variations))
+            variations.append((profile_field, len(grams)))
+
+    def match(field_name: str, threshold: float) -> Optional[str]:
+        grams = _trigrams(field_name)
+        shared = defaultdict(int)
+        for gram in grams:
+            for position in index.get(gram, ()):
+                shared[position] += 1
+        
+        best_match = None
+        best_score = 0
+        for position, count in shared.items():
+            profile_field, size = variations[position]
+            score = 2 * count / (len(grams) + size)
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = profile_field
+        return best_match
+    return match
+
+
+def _token_backend(mapper: FormFieldMapper) -> Callable[[str, float], Optional[str]]:
+    """Jaccard similarity of the underscore-separated words"""
+    variations = [(profile_field, frozenset(variation.split('_')))
+                  for profile_field, names in mapper.field_mappings.items() for variation in names]
+
+    def match(field_name: str, threshold: float) -> Optional[str]:
+        tokens = set(field_name.split('_'))
+        best_match = None
+        best_score = 0
+        for profile_field, words in variations:
+            shared = len(tokens & words)
+            if not shared:
+                continue
+            score = shared / len(tokens | words)
+            if score > best_score and score >= threshold:
+                best_score = score
+                best_match = profile_field
+        return best_match
+    return match
+
+
+def _exact_backend(mapper: FormFieldMapper) -> Callable[[str, float], Optional[str]]:
+    """No fuzzy matching; only exact variations and attributes map"""
+    return lambda field_name, threshold: None
+
+
+# Backend name -> factory building a (field name, threshold) matcher for a mapper
+BACKENDS = {
+    'sequence': _sequence_backend,
+    'quick': _quick_backend,
+    'trigram': _trigram_backend,
+    'token': _token_backend,
+    'exact': _exact_backend
+}
+
+
+class EvaluationMapper(FormFieldMapper):
+    """FormFieldMapper whose fuzzy step uses a chosen backend and threshold"""
+
+    def __init__(self, backend: str = 'sequence', threshold: float = CURRENT_THRESHOLD):
+        super().__init__()
+        self.backend = backend
+        self.threshold = threshold
+        self._match = BACKENDS[backend](self)
+
+    def _fuzzy_match(self, field_name: str, threshold: float = None) -> Optional[str]:
+        return self._match(field_name, self.threshold if threshold is None else threshold)
+
+
+def parse_config(name: str) -> EvaluationMapper:
+    """Build the mapper for a configuration name such as sequence@0.7 or exact"""
+    backend, _, threshold = name.partition('@')
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    return EvaluationMapper(backend, float(threshold) if threshold else CURRENT_THRESHOLD)
+
+
+def load_golden_set(filename: str = DEFAULT_GOLDEN_SET) -> List[Dict[str, Any]]:
+    """
+    Load labeled fields
+    
+    The file holds {"fields": [...]} or a bare list; each field has a name,
+    optional label/placeholder/class/title attributes, and "expected": the
+    profile field it should map to, or null when it should stay unmapped.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    fields = data['fields'] if isinstance(data, dict) else data
+    for field in fields:
+        if 'name' not in field or 'expected' not in field:
+            raise ValueError(f"Golden field needs 'name' and 'expected': {field}")
+    return fields
+
+
+def evaluate(mapper: FormFieldMapper, fields: List[Dict[str, Any]], repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """
+    Score one mapper configuration against the golden fields
+    
+    A prediction is correct when it equals the expected profile field.
+    Precision counts every non-null prediction; recall counts every field
+    that has an expected profile field.
+    
+    Args:
+        mapper: Configured mapper
+        fields: Golden fields from load_golden_set
+        repeat: Timed runs per field; the fastest is kept
+    
+    Returns:
+        Precision, recall, F1, per-field latency (mean/p95/max µs), the mean
+        confidence of correct and wrong mappings, and the mistakes
+    """
+    correct = predicted = expected = 0
+    latencies = []
+    confidence = {'correct': [], 'wrong': []}
+    mistakes = []
+    
+    for field in fields:
+        attributes = {key: field.get(key, '') for key in ATTRIBUTE_KEYS}
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            mapped = mapper.map_field_to_profile(field['name'], attributes)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best * 1e6)
+        
+        target = field['expected']
+        expected += target is not None
+        if mapped is None:
+            if target is not None:
+                mistakes.append({'name': field['name'], 'expected': target, 'mapped': None})
+            continue
+        
+        predicted += 1
+        score = mapper._calculate_confidence(field['name'], mapped, attributes)
+        if mapped == target:
+            correct += 1
+            confidence['correct'].append(score)
+        else:
+            confidence['wrong'].append(score)
+            mistakes.append({'name': field['name'], 'expected': target, 'mapped': mapped})
+    
+    latencies.sort()
+    return {
+        **_accuracy(correct, predicted, expected),
+        'meanUs': round(sum(latencies) / len(latencies), 2),
+        'p95Us': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+        'maxUs': round(latencies[-1], 2),
+        'confidenceCorrect': _mean(confidence['correct']),
+        'confidenceWrong': _mean(confidence['wrong']),
+        'mistakes': mistakes
+    }
+
+
+def _accuracy(correct: int, predicted: int, expected: int) -> Dict[str, float]:
+    precision = correct / predicted if predicted else 1.0
+    recall = correct / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {'precision': round(precision, 4), 'recall': round(recall, 4), 'f1': round(f1, 4)}
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return round(sum(values) / len(values), 3) if values else None
+
+
+def confidence_sweep(mapper: FormFieldMapper, fields: List[Dict[str, Any]],
+                     weight_vectors: List[tuple] = None, cutoffs: List[float] = None) -> List[Dict[str, Any]]:
+    """
+    Score accepting only mappings whose confidence reaches a cutoff
+    
+    The mapping itself does not depend on the confidence weights, so each
+    field is mapped once and rescored under every weight vector. Recall
+    still counts every field that has an expected profile field.
+    
+    Args:
+        mapper: Configured mapper
+        fields: Golden fields from load_golden_set
+        weight_vectors: (direct, fuzzy, attribute) weights for _calculate_confidence
+        cutoffs: Lowest confidence accepted
+    
+    Returns:
+        One result per weight vector and cutoff, with 'weights', 'cutoff',
+        'accepted' and precision/recall/F1
+    """
+    mapped_fields = []
+    expected = 0
+    for field in fields:
+        attributes = {key: field.get(key, '') for key in ATTRIBUTE_KEYS}
+        mapped = mapper.map_field_to_profile(field['name'], attributes)
+        expected += field['expected'] is not None
+        if mapped is not None:
+            mapped_fields.append((field['name'], attributes, mapped, mapped == field['expected']))
+    
+    results = []
+    original = mapper.confidence_weights
+    try:
+        for weights in weight_vectors or DEFAULT_WEIGHT_VECTORS:
+            mapper.confidence_weights = dict(zip(CONFIDENCE_WEIGHTS, weights))
+            # Rounded so sums such as 0.6 + 0.2 still reach a 0.8 cutoff
+            scored = [(round(mapper._calculate_confidence(name, mapped, attributes), 6), is_correct)
+                      for name, attributes, mapped, is_correct in mapped_fields]
+            for cutoff in cutoffs or DEFAULT_CUTOFFS:
+                accepted = [is_correct for score, is_correct in scored if score >= cutoff]
+                results.append({
+                    'weights': tuple(weights),
+                    'cutoff': cutoff,
+                    'accepted': len(accepted),
+                    **_accuracy(sum(accepted), len(accepted), expected)
+                })
+    finally:
+        mapper.confidence_weights = original
+    return results
+
+
+def sweep(fields: List[Dict[str, Any]], backends: List[str] = None, thresholds: List[float] = None,
+          repeat: int = DEFAULT_REPEAT, progress: bool = True) -> List[Dict[str, Any]]:
+    """
+    Evaluate every backend at every threshold
+    
+    The exact backend ignores the threshold, so it is evaluated once.
+    
+    Returns:
+        One result per configuration, with 'backend' and 'threshold' added
+    """
+    results = []
+    for backend in backends or list(BACKENDS):
+        for threshold in ([None] if backend == 'exact' else thresholds or DEFAULT_THRESHOLDS):
+            mapper = EvaluationMapper(backend, CURRENT_THRESHOLD if threshold is None else threshold)
+            result = {'backend': backend, 'threshold': threshold, **evaluate(mapper, fields, repeat)}
+            results.append(result)
+            if progress:
+                print(f"  {_config_name(result):<16} P={result['precision']:.3f} R={result['recall']:.3f} "
+                      f"mean={result['meanUs']:.1f} µs", file=sys.stderr)
+    return results
+
+
+def pareto_front(results: List[Dict[str, Any]],
+                 tolerance: float = DEFAULT_LATENCY_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Configurations no other configuration beats on precision, recall and mean latency at once
+    
+    Args:
+        results: Configurations from sweep
+        tolerance: Fraction by which one mean latency must undercut another
+            to count as faster; closer latencies are treated as equal
+    
+    Returns:
+        The non-dominated results, fastest first
+    """
+    def dominates(a, b):
+        faster = a['meanUs'] * (1 + tolerance) < b['meanUs']
+        no_slower = a['meanUs'] <= b['meanUs'] * (1 + tolerance)
+        no_worse = a['precision'] >= b['precision'] and a['recall'] >= b['recall'] and no_slower
+        better = a['precision'] > b['precision'] or a['recall'] > b['recall'] or faster
+        return no_worse and better
+    
+    front = [result for result in results if not any(dominates(other, result) for other in results)]
+    return sorted(front, key=lambda result: result['meanUs'])
+
+
+def _config_name(result: Dict[str, Any]) -> str:
+    if result['threshold'] is None:
+        return result['backend']
+    return f"{result['backend']}@{result['threshold']:g}"
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    """Markdown table of configurations"""
+    lines = [
+        '| Config | Precision | Recall | F1 | Mean µs | p95 µs | Max µs | Conf. correct | Conf. wrong |',
+        '|---|---:|---:|---:|---:|---:|---:|---:|---:|'
+    ]
+    for result in results:
+        confidences = [('-' if value is None else f"{value:.2f}")
+                       for value in (result['confidenceCorrect'], result['confidenceWrong'])]
+        lines.append(f"| {_config_name(result)} | {result['precision']:.3f} | {result['recall']:.3f} | "
+                     f"{result['f1']:.3f} | {result['meanUs']:.1f} | {result['p95Us']:.1f} | "
+                     f"{result['maxUs']:.1f} | {confidences[0]} | {confidences[1]} |")
+    return '\n'.join(lines)
+
+
+def format_confidence_table(results: List[Dict[str, Any]]) -> str:
+    """Markdown table of confidence cutoffs per weight vector"""
+    current = tuple(CONFIDENCE_WEIGHTS.values())
+    lines = [
+        '| Weights (direct/fuzzy/attribute) | Cutoff | Accepted | Precision | Recall | F1 |',
+        '|---|---:|---:|---:|---:|---:|'
+    ]
+    for result in results:
+        weights = '/'.join(f"{weight:g}" for weight in result['weights'])
+        if result['weights'] == current:
+            weights += ' (current)'
+        lines.append(f"| {weights} | {result['cutoff']:g} | {result['accepted']} | "
+                     f"{result['precision']:.3f} | {result['recall']:.3f} | {result['f1']:.3f} |")
+    return '\n'.join(lines)
+
+
+def format_report(results: List[Dict[str, Any]], golden_set: str, field_count: int,
+                  repeat: int = DEFAULT_REPEAT, tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+                  confidence: List[Dict[str, Any]] = None, confidence_config: str = None) -> str:
+    """Markdown report with the Pareto front, every configuration, then the confidence cutoffs"""
+    current = next((result for result in results
+                    if result['backend'] == 'sequence' and result['threshold'] == CURRENT_THRESHOLD), None)
+    lines = ['# Field mapping evaluation', '',
+             f"Golden set: {golden_set} ({field_count} fields)", '',
+             f"Latency: fastest of {repeat} runs per field; mean latencies within {tolerance:.0%} "
+             f"of each other count as equal on the Pareto front", '']
+    if current:
+        lines += [f"Current mapper (sequence@{CURRENT_THRESHOLD:g}): precision {current['precision']:.3f}, "
+                  f"recall {current['recall']:.3f}, {current['meanUs']:.1f} µs per field", '']
+    lines += ['## Pareto front (precision, recall, mean latency)', '',
+              format_table(pareto_front(results, tolerance)), '',
+              '## All configurations', '', format_table(results)]
+    if confidence:
+        lines += ['', f"## Confidence cutoffs ({confidence_config})", '',
+                  'Only mappings whose confidence reaches the cutoff are accepted.', '',
+                  format_confidence_table(confidence)]
+    return '\n'.join(lines) + '\n'
+
+
+def _weight_vector(text: str) -> tuple:
+    """argparse type for a direct,fuzzy,attribute weight vector"""
+    try:
+        weights = tuple(float(part) for part in text.split(','))
+    except ValueError:
+        weights = ()
+    if len(weights) != len(CONFIDENCE_WEIGHTS):
+        raise argparse.ArgumentTypeError(f"expected direct,fuzzy,attribute weights, got {text!r}")
+    return weights
+
+
+def main():
+    """Command-line interface for the mapping evaluation"""
+    parser = argparse.ArgumentParser(description='Evaluate field mapping accuracy against latency')
+    parser.add_argument('--golden', '-g', default=DEFAULT_GOLDEN_SET, help='Labeled golden set JSON file')
+    parser.add_argument('--backends', '-b', nargs='+', choices=list(BACKENDS), default=list(BACKENDS),
+                       help='Matcher backends to evaluate (default: all)')
+    parser.add_argument('--thresholds', '-t', nargs='+', type=float, default=DEFAULT_THRESHOLDS,
+                       help='Fuzzy thresholds to sweep')
+    parser.add_argument('--repeat', '-r', type=int, default=DEFAULT_REPEAT,
+                       help=f'Timed runs per field, fastest kept (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--latency-tolerance', type=float, default=DEFAULT_LATENCY_TOLERANCE,
+                       help='Fraction within which mean latencies tie on the Pareto front '
+                            f'(default: {DEFAULT_LATENCY_TOLERANCE:g})')
+    parser.add_argument('--confidence-config', default=f"sequence@{CURRENT_THRESHOLD:g}",
+                       help='Configuration whose confidence cutoffs are swept (default: %(default)s)')
+    parser.add_argument('--weights', '-w', nargs='+', type=_weight_vector, default=DEFAULT_WEIGHT_VECTORS,
+                       help='Confidence weight vectors as direct,fuzzy,attribute (e.g. 0.8,0.6,0.2)')
+    parser.add_argument('--cutoffs', '-c', nargs='+', type=float, default=DEFAULT_CUTOFFS,
+                       help='Confidence cutoffs to sweep')
+    parser.add_argument('--output', '-o', help='Write the Markdown report to a file')
+    parser.add_argument('--json', help='Write every configuration, including its mistakes, as JSON')
+    parser.add_argument('--mistakes', '-m', help='Print the mistakes of one configuration (e.g. sequence@0.7)')
+    
+    args = parser.parse_args()
+    
+    try:
+        confidence_mapper = parse_config(args.confidence_config)
+    except ValueError as e:
+        parser.error(f"--confidence-config: {e}")
+    
+    fields = load_golden_set(args.golden)
+    print(f"🔬 Evaluating {len(fields)} golden fields", file=sys.stderr)
+    results = sweep(fields, args.backends, args.thresholds, args.repeat)
+    confidence = confidence_sweep(confidence_mapper, fields, args.weights, args.cutoffs)
+    report = format_report(results, os.path.basename(args.golden), len(fields), args.repeat,
+                           args.latency_tolerance, confidence, args.confidence_config)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"📊 Report written to: {args.output}", file=sys.stderr)
+    else:
+        print(report)
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📊 Results written to: {args.json}", file=sys.stderr)
+    
+    if args.mistakes:
+        result = next((result for result in results if _config_name(result) == args.mistakes), None)
+        if result is None:
+            parser.error(f"No evaluated configuration named {args.mistakes}")
+        print(f"\n❌ Mistakes of {args.mistakes}:")
+        for mistake in result['mistakes']:
+            print(f"  {mistake['name']:<40} expected {mistake['expected']}, mapped {mistake['mapped']}")
+
+
+if __name__ == '__main__':
+    main()
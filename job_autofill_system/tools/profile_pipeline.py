@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Profile Pipeline
+Loads each profile once and runs standardization, validation and
+multi-format export on the in-memory data
+"""
+
+import json
+import os
+import sys
+import time
+import argparse
+from collections import defaultdict
+from typing import Dict, List, Any, Optional
+
+from archive_io import strip_compression_extension
+from data_converter import ProfileDataConverter
+from data_validator import ProfileDataValidator
+
+
+class ProfilePipeline:
+    """Runs load → standardize → validate → save stages on a single load"""
+    
+    STAGES = ['load', 'standardize', 'validate', 'save']
+    
+    def __init__(self, output_formats: List[str] = None, standardize: bool = True,
+                 validate: bool = True, converter: ProfileDataConverter = None,
+                 validator: ProfileDataValidator = None):
+        self.converter = converter or ProfileDataConverter()
+        self.validator = validator or ProfileDataValidator()
+        self.output_formats = output_formats or ['json']
+        self.standardize = standardize
+        self.validate = validate
+        
+        for format_type in self.output_formats:
+            if format_type not in self.converter.supported_formats:
+                raise ValueError(f"Unsupported format: {format_type}")
+        
+        self.stage_totals = {stage: 0.0 for stage in self.STAGES}
+
+    def run(self, input_file: str, output_dir: str, 
+            input_format: str = None) -> Dict[str, Any]:
+        """
+        Process one profile file through every enabled stage
+        
+        Args:
+            input_file: Path to input file
+            output_dir: Directory receiving one file per output format
+            input_format: Input format (auto-detected if None)
+            
+        Returns:
+            Result with outputs, validation findings and stage timings
+        """
+        result = {
+            'input': input_file,
+            'outputs': {},
+            'validation': None,
+            'error': None,
+            'timings': {}
+        }
+        
+        try:
+            input_format = input_format or self.converter._detect_format(input_file)
+            if not input_format:
+                raise ValueError("Could not determine file formats")
+            
+            data = self._timed(result, 'load', self.converter._load_data, input_file, input_format)
+            
+            if self.standardize:
+                self._timed(result, 'standardize', self.converter.standardize_dates, data, True)
+            
+            if self.validate:
+                result['validation'] = self._timed(result, 'validate', self._validate, data)
+            
+            result['outputs'] = self._timed(result, 'save', self._save_all, data, input_file, output_dir)
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        
+        return result
+
+    def run_many(self, input_files: List[str], output_dir: str,
+                 input_format: str = None) -> Dict[str, Any]:
+        """
+        Process several files and summarize stage timings
+        
+        A file counts as failed when it errored or any of its outputs could
+        not be written.
+        
+        Inputs sharing an output name (a/profile.json and b/profile.yaml)
+        would overwrite each other's outputs, so none of them is processed;
+        each gets an error naming the others.
+        """
+        claims = defaultdict(list)
+        for input_file in input_files:
+            claims[self.output_stem(input_file)].append(input_file)
+        
+        results = []
+        for input_file in input_files:
+            stem = self.output_stem(input_file)
+            if len(claims[stem]) == 1:
+                results.append(self.run(input_file, output_dir, input_format))
+                continue
+            
+            # The same path listed twice collides with itself
+            others = [other for other in claims[stem] if other != input_file] or [input_file]
+            results.append({
+                'input': input_file,
+                'outputs': {},
+                'validation': None,
+                'error': f"Output name {stem} is also used by {', '.join(others)}",
+                'timings': {}
+            })
+        
+        return {
+            'results': results,
+            'processed': len(results),
+            'failed': sum(1 for result in results if self.failed(result)),
+            'invalid': sum(1 for result in results
+                           if result['validation'] and not result['validation']['valid']),
+            'stageSeconds': {stage: round(seconds, 6) for stage, seconds in self.stage_totals.items()}
+        }
+
+    @staticmethod
+    def failed(result: Dict[str, Any]) -> bool:
+        """Whether a run() result errored or could not write one of its outputs"""
+        return bool(result['error']) or any(path is None for path in result['outputs'].values())
+
+    def _timed(self, result: Dict[str, Any], stage: str, func, *args):
+        """Run one stage, recording its duration on the result and in the totals"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            result['timings'][stage] = round(elapsed, 6)
+            self.stage_totals[stage] += elapsed
+
+    def _validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run both the strict validator and the converter's structure check"""
+        is_valid, errors, warnings = self.validator.validate_profile(data)
+        return {
+            'valid': is_valid,
+            'errors': list(errors),
+            'warnings': list(warnings),
+            'structure': self.converter.validate_data_structure(data)
+        }
+
+    @staticmethod
+    def output_stem(input_file: str) -> str:
+        """Output file name without extension: the input name minus compression and format suffixes"""
+        return os.path.splitext(strip_compression_extension(os.path.basename(input_file)))[0]
+
+    def _save_all(self, data: Dict[str, Any], input_file: str, output_dir: str) -> Dict[str, Optional[str]]:
+        """Write the in-memory profile once per output format"""
+        os.makedirs(output_dir, exist_ok=True)
+        stem = self.output_stem(input_file)
+        
+        outputs = {}
+        for format_type in self.output_formats:
+            output_file = os.path.join(output_dir, f"{stem}.{format_type}")
+            if self.converter._save_data(data, output_file, format_type):
+                outputs[format_type] = output_file
+            else:
+                outputs[format_type] = None
+        return outputs
+
+
+def main():
+    """Command-line interface for the profile pipeline"""
+    parser = argparse.ArgumentParser(
+        description='Load profiles once, then standardize, validate and export them'
+    )
+    parser.add_argument('inputs', nargs='+', help='Input profile files')
+    parser.add_argument('--output-dir', '-o', default='.', help='Directory for output files')
+    parser.add_argument('--formats', '-f', nargs='+', default=['json'],
+                       choices=['json', 'csv', 'xml', 'yaml', 'txt', 'pbin'],
+                       help='Output formats to write from each load')
+    parser.add_argument('--input-format', '-if', choices=['json', 'csv', 'xml', 'yaml', 'txt', 'pbin'],
+                       help='Input format (auto-detected if not specified)')
+    parser.add_argument('--no-standardize', action='store_true', help='Skip date standardization')
+    parser.add_argument('--no-validate', action='store_true', help='Skip validation')
+    parser.add_argument('--json-output', action='store_true', help='Output results in JSON format')
+    
+    args = parser.parse_args()
+    
+    pipeline = ProfilePipeline(
+        output_formats=args.formats,
+        standardize=not args.no_standardize,
+        validate=not args.no_validate
+    )
+    summary = pipeline.run_many(args.inputs, args.output_dir, args.input_format)
+    
+    if args.json_output:
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        for result in summary['results']:
+            if result['error']:
+                print(f"✗ {result['input']}: {result['error']}")
+                continue
+            
+            written = ', '.join(path for path in result['outputs'].values() if path)
+            print(f"✓ {result['input']} -> {written}")
+            for format_type, path in result['outputs'].items():
+                if not path:
+                    print(f"  ✗ Could not write {format_type} output")
+            
+            validation = result['validation']
+            if validation:
+                for error in validation['errors']:
+                    print(f"  ✗ {error}")
+                for warning in validation['warnings']:
+                    print(f"  ⚠ {warning}")
+        
+        print()
+        print(f"Processed {summary['processed']} files "
+              f"({summary['failed']} failed, {summary['invalid']} invalid)")
+        print("Stage timings:")
+        for stage, seconds in summary['stageSeconds'].items():
+            print(f"  {stage}: {seconds * 1000:.2f} ms")
+    
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,264 +6,38 @@ Creates customized profile templates based on user requirements
 
 import json
 import argparse
-from typing import Dict, List, Any
+import marshal
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 from datetime import datetime
 
+from template_packs import CHECK_INTERVAL, TemplatePack, TemplatePackStore
+
 
 class ProfileTemplateGenerator:
     """Generates customized job profile templates"""
     
-    def __init__(self):
-        self.base_templates = {
-            'minimal': {
-                'personalInfo': {
-                    'firstName': '',
-                    'lastName': '',
-                    'email': '',
-                    'phone': ''
-                },
-                'workExperience': {
-                    'positions': []
-                }
-            },
-            'standard': {
-                'personalInfo': {
-                    'firstName': '',
-                    'lastName': '',
-                    'email': '',
-                    'phone': '',
-                    'address': {
-                        'street': '',
-                        'city': '',
-                        'state': '',
-                        'zipCode': '',
-                        'country': ''
-                    },
-                    'linkedin': '',
-                    'summary': ''
-                },
-                'workExperience': {
-                    'positions': [{
-                        'company': '',
-                        'title': '',
-                        'startDate': '',
-                        'endDate': '',
-                        'description': '',
-                        'location': '',
-                        'achievements': []
-                    }]
-                },
-                'education': {
-                    'schools': [{
-                        'institution': '',
-                        'degree': '',
-                        'fieldOfStudy': '',
-                        'graduationDate': '',
-                        'gpa': '',
-                        'location': ''
-                    }]
-                },
-                'skills': {
-                    'technical': [],
-                    'languages': [],
-                    'certifications': []
-                }
-            },
-            'comprehensive': {
-                'personalInfo': {
-                    'firstName': '',
-                    'lastName': '',
-                    'email': '',
-                    'phone': '',
-                    'address': {
-                        'street': '',
-                        'line2': '',
-                        'city': '',
-                        'state': '',
-                        'zipCode': '',
-                        'country': ''
-                    },
-                    'linkedin': '',
-                    'website': '',
-                    'github': '',
-                    'summary': '',
-                    'objective': ''
-                },
-                'workExperience': {
-                    'positions': [{
-                        'company': '',
-                        'title': '',
-                        'startDate': '',
-                        'endDate': '',
-                        'description': '',
-                        'location': '',
-                        'achievements': [],
-                        'responsibilities': [],
-                        'technologies': [],
-                        'salary': ''
-                    }],
-                    'totalYears': 0
-                },
-                'education': {
-                    'schools': [{
-                        'institution': '',
-                        'degree': '',
-                        'fieldOfStudy': '',
-                        'graduationDate': '',
-                        'gpa': '',
-                        'location': '',
-                        'achievements': [],
-                        'coursework': [],
-                        'honors': []
-                    }]
-                },
-                'skills': {
-                    'technical': [],
-                    'languages': [{
-                        'language': '',
-                        'proficiency': ''
-                    }],
-                    'certifications': [{
-                        'name': '',
-                        'issuer': '',
-                        'date': '',
-                        'expirationDate': '',
-                        'credentialId': ''
-                    }],
-                    'softSkills': []
-                },
-                'projects': [{
-                    'name': '',
-                    'description': '',
-                    'technologies': [],
-                    'url': '',
-                    'startDate': '',
-                    'endDate': ''
-                }],
-                'publications': [{
-                    'title': '',
-                    'publication': '',
-                    'date': '',
-                    'url': ''
-                }],
-                'awards': [{
-                    'name': '',
-                    'issuer': '',
-                    'date': '',
-                    'description': ''
-                }],
-                'volunteer': [{
-                    'organization': '',
-                    'role': '',
-                    'startDate': '',
-                    'endDate': '',
-                    'description': ''
-                }]
-            }
-        }
+    def __init__(self, pack_dir: str = None, check_interval: float = CHECK_INTERVAL):
+        """
+        Args:
+            pack_dir: Template pack directory (defaults to templates/packs)
+            check_interval: Seconds between checks of pack files for changes
+        """
+        self.packs = TemplatePackStore(pack_dir, check_interval)
         
-        self.industry_specific = {
-            'software_engineering': {
-                'skills': {
-                    'technical': [
-                        'Programming Languages (Python, JavaScript, Java, etc.)',
-                        'Frameworks (React, Node.js, Django, etc.)',
-                        'Databases (SQL, MongoDB, PostgreSQL)',
-                        'Cloud Platforms (AWS, Azure, GCP)',
-                        'DevOps (Docker, Kubernetes, CI/CD)',
-                        'Version Control (Git, GitHub)',
-                        'Testing Frameworks',
-                        'Agile Methodologies'
-                    ]
-                },
-                'projects': [{
-                    'name': 'Project Name',
-                    'description': 'Brief description of the project',
-                    'technologies': ['Technology 1', 'Technology 2'],
-                    'url': 'https://github.com/username/project',
-                    'startDate': 'YYYY-MM-DD',
-                    'endDate': 'YYYY-MM-DD'
-                }]
-            },
-            'marketing': {
-                'skills': {
-                    'technical': [
-                        'Google Analytics',
-                        'Google Ads',
-                        'Facebook Ads Manager',
-                        'HubSpot',
-                        'Salesforce',
-                        'Mailchimp',
-                        'Adobe Creative Suite',
-                        'Canva',
-                        'SEO/SEM',
-                        'Social Media Management'
-                    ]
-                },
-                'certifications': [{
-                    'name': 'Google Analytics Certified',
-                    'issuer': 'Google',
-                    'date': 'YYYY-MM-DD',
-                    'credentialId': ''
-                }]
-            },
-            'finance': {
-                'skills': {
-                    'technical': [
-                        'Financial Modeling',
-                        'Excel/VBA',
-                        'Bloomberg Terminal',
-                        'SAP',
-                        'QuickBooks',
-                        'Financial Analysis',
-                        'Risk Management',
-                        'Portfolio Management'
-                    ]
-                },
-                'certifications': [{
-                    'name': 'CFA (Chartered Financial Analyst)',
-                    'issuer': 'CFA Institute',
-                    'date': 'YYYY-MM-DD',
-                    'credentialId': ''
-                }]
-            },
-            'healthcare': {
-                'skills': {
-                    'technical': [
-                        'Electronic Health Records (EHR)',
-                        'HIPAA Compliance',
-                        'Medical Terminology',
-                        'Patient Care',
-                        'Clinical Documentation',
-                        'Medical Software Systems'
-                    ]
-                },
-                'certifications': [{
-                    'name': 'BLS (Basic Life Support)',
-                    'issuer': 'American Heart Association',
-                    'date': 'YYYY-MM-DD',
-                    'expirationDate': 'YYYY-MM-DD'
-                }]
-            },
-            'education': {
-                'skills': {
-                    'technical': [
-                        'Learning Management Systems (LMS)',
-                        'Educational Technology',
-                        'Curriculum Development',
-                        'Assessment Design',
-                        'Classroom Management',
-                        'Online Teaching Platforms'
-                    ]
-                },
-                'certifications': [{
-                    'name': 'Teaching License',
-                    'issuer': 'State Department of Education',
-                    'date': 'YYYY-MM-DD',
-                    'expirationDate': 'YYYY-MM-DD'
-                }]
-            }
-        }
+        # Base templates and industry customizations load per entry on first use
+        self.base_templates = TemplatePack(self.packs, 'templateTypes')
+        self.industry_specific = TemplatePack(self.packs, 'industries')
+        
+        # Fully merged templates keyed by (template_type, industry, include_examples),
+        # each frozen into a callable that builds an independent copy and stored
+        # with the pack stamps it was built from
+        self._template_cache = {}
 
     def generate_template(self, template_type: str = 'standard', 
                          industry: str = None, 
@@ -279,15 +53,43 @@ class ProfileTemplateGenerator:
         Returns:
             Dictionary containing the generated template
         """
-        if template_type not in self.base_templates:
-            raise ValueError(f"Unknown template type: {template_type}")
+        key = (template_type, industry, include_examples)
+        stamp = (self.base_templates.stamp(template_type),
+                 self.industry_specific.stamp(industry) if industry else None)
+        cached = self._template_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            if template_type not in self.base_templates:
+                raise ValueError(f"Unknown template type: {template_type}")
+            thaw = self._freeze(self._build_template(template_type, industry, include_examples))
+            cached = self._template_cache[key] = (stamp, thaw)
+        
+        template = cached[1]()
+        template['metadata']['createdDate'] = datetime.now().isoformat()
+        return template
+
+    def clear_cache(self):
+        """Forget cached templates after changing base_templates or industry_specific"""
+        self._template_cache.clear()
+
+    @staticmethod
+    def _freeze(template: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+        """
+        Return a callable producing fresh copies of a template
         
+        The template is snapshotted with marshal once; every call decodes a
+        new, fully independent copy, several times faster than deepcopy.
+        """
+        return partial(marshal.loads, marshal.dumps(template))
+
+    def _build_template(self, template_type: str, industry: str,
+                        include_examples: bool) -> Dict[str, Any]:
+        """Merge a template from scratch; createdDate is left for the caller"""
         # Start with base template
         template = json.loads(json.dumps(self.base_templates[template_type]))
         
         # Add industry-specific fields
         if industry and industry in self.industry_specific:
-            industry_data = self.industry_specific[industry]
+            industry_data = json.loads(json.dumps(self.industry_specific[industry]))
             template = self._merge_templates(template, industry_data)
         
         # Add examples if requested
@@ -299,7 +101,7 @@ class ProfileTemplateGenerator:
             'templateType': template_type,
             'industry': industry,
             'version': '1.0.0',
-            'createdDate': datetime.now().isoformat(),
+            'createdDate': '',
             'description': f'{template_type.title()} profile template' + 
                           (f' for {industry}' if industry else '')
         }
@@ -315,14 +117,56 @@ class ProfileTemplateGenerator:
                 result[key] = self._merge_templates(result[key], value)
             elif key in result and isinstance(result[key], list) and isinstance(value, list):
                 # For lists, append unique items
-                for item in value:
-                    if item not in result[key]:
-                        result[key].append(item)
+                result[key] = self._merge_lists(result[key], value)
             else:
                 result[key] = value
         
         return result
 
+    @classmethod
+    def _merge_lists(cls, base: List[Any], addition: List[Any]) -> List[Any]:
+        """
+        Append the items of addition not already in base, in first-seen order
+        
+        Items are deduplicated through canonical hashable keys, so merging
+        large lists of dicts takes linear time instead of a scan per item.
+        
+        Returns:
+            base, extended in place
+        """
+        if not addition:
+            return base
+        
+        seen = set()
+        for item in base:
+            try:
+                seen.add(cls._merge_key(item))
+            except TypeError:
+                pass
+        
+        for item in addition:
+            try:
+                key = cls._merge_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+            except TypeError:
+                # Unhashable leaves fall back to an equality scan
+                if item in base:
+                    continue
+            base.append(item)
+        
+        return base
+
+    @classmethod
+    def _merge_key(cls, item: Any) -> Any:
+        """Hashable key that is equal for list items comparing equal"""
+        if isinstance(item, dict):
+            return dict, frozenset((key, cls._merge_key(value)) for key, value in item.items())
+        if isinstance(item, list):
+            return list, tuple(cls._merge_key(value) for value in item)
+        return item
+
     def _add_examples(self, template: Dict[str, Any], industry: str = None) -> Dict[str, Any]:
         """Add example data to template fields"""
         examples = template.copy()
@@ -383,58 +227,155 @@ class ProfileTemplateGenerator:
     def generate_multiple_templates(self, industries: List[str], 
                                   template_types: List[str] = None) -> Dict[str, Dict[str, Any]]:
         """Generate multiple templates for different industries"""
+        return dict(self.iter_templates(industries, template_types))
+
+    def iter_templates(self, industries: List[str], template_types: List[str] = None,
+                       include_examples: bool = False) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield ("industry_type", template) for each combination, one at a time"""
         if template_types is None:
             template_types = ['standard']
         
-        templates = {}
-        
         for industry in industries:
             for template_type in template_types:
-                key = f"{industry}_{template_type}"
-                templates[key] = self.generate_template(
+                yield f"{industry}_{template_type}", self.generate_template(
                     template_type=template_type,
                     industry=industry,
-                    include_examples=False
+                    include_examples=include_examples
                 )
+
+    def write_templates(self, industries: List[str], template_types: List[str] = None,
+                        output_dir: str = None, include_examples: bool = False,
+                        workers: int = None, chunk_size: int = 4) -> Iterator[Dict[str, Any]]:
+        """
+        Generate and save every industry/type combination as template_<name>.json
+        
+        Templates are built and written by a pool of worker processes, each file
+        atomically, and only a small result per file comes back, so memory stays
+        flat however large the matrix grows. Workers load the packs from disk;
+        entries assigned in memory are only seen when running with one worker.
+        
+        Args:
+            industries: Industries to generate
+            template_types: Template types to generate (default: standard)
+            output_dir: Directory receiving the files (default: current directory)
+            include_examples: Whether to include example data
+            workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Templates dispatched to a worker at a time
+            
+        Returns:
+            Iterator of {'name', 'file', 'seconds', 'error'} dicts, in completion order
+        """
+        if template_types is None:
+            template_types = ['standard']
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        tasks = []
+        for industry in industries:
+            for template_type in template_types:
+                filename = f"template_{industry}_{template_type}.json"
+                if output_dir:
+                    filename = os.path.join(output_dir, filename)
+                tasks.append((industry, template_type, include_examples, filename))
+        if not tasks:
+            return
         
-        return templates
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            for task in tasks:
+                yield self._write_template_task(task)
+            return
+        
+        initargs = (self.packs.pack_dir, self.packs.check_interval)
+        with multiprocessing.Pool(processes=workers, initializer=_init_template_worker,
+                                  initargs=initargs) as pool:
+            for result in pool.imap_unordered(_write_template, tasks, chunksize=chunk_size):
+                yield result
+
+    def _write_template_task(self, task: tuple) -> Dict[str, Any]:
+        """Generate and save one template, capturing timing and any failure"""
+        industry, template_type, include_examples, filename = task
+        start = time.perf_counter()
+        try:
+            # Each combination is written once, so skip the template cache
+            if template_type not in self.base_templates:
+                raise ValueError(f"Unknown template type: {template_type}")
+            template = self._build_template(template_type, industry, include_examples)
+            template['metadata']['createdDate'] = datetime.now().isoformat()
+            self.save_template(template, filename)
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        
+        return {
+            'name': f"{industry}_{template_type}",
+            'file': filename,
+            'seconds': round(time.perf_counter() - start, 6),
+            'error': error
+        }
 
     def save_template(self, template: Dict[str, Any], filename: str):
-        """Save template to JSON file"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(template, f, indent=2, ensure_ascii=False)
+        """Save template to JSON file, replacing any existing file atomically"""
+        temp_file = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(template, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, filename)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
 
     def list_available_options(self) -> Dict[str, List[str]]:
-        """List all available template types and industries"""
+        """List all available template types and industries (reads only the pack manifest)"""
         return {
-            'template_types': list(self.base_templates.keys()),
-            'industries': list(self.industry_specific.keys())
+            'template_types': list(self.base_templates),
+            'industries': list(self.industry_specific)
         }
 
 
+# Per-worker generator, reused for every template a process writes
+_worker_state = threading.local()
+
+
+def _init_template_worker(pack_dir: str, check_interval: float):
+    """Create the per-worker template generator"""
+    _worker_state.generator = ProfileTemplateGenerator(pack_dir, check_interval)
+
+
+def _write_template(task: tuple) -> Dict[str, Any]:
+    """Generate and save one template in a worker"""
+    return _worker_state.generator._write_template_task(task)
+
+
 def main():
     """Command-line interface for the template generator"""
     parser = argparse.ArgumentParser(description='Generate job profile templates')
-    parser.add_argument('--type', '-t', choices=['minimal', 'standard', 'comprehensive'],
-                       default='standard', help='Template type')
+    parser.add_argument('--type', '-t', default='standard',
+                       help='Template type (see --list)')
     parser.add_argument('--industry', '-i', 
-                       choices=['software_engineering', 'marketing', 'finance', 'healthcare', 'education'],
-                       help='Industry-specific customizations')
+                       help='Industry-specific customizations (see --list)')
     parser.add_argument('--examples', '-e', action='store_true',
                        help='Include example data')
     parser.add_argument('--output', '-o', default='profile_template.json',
                        help='Output filename')
     parser.add_argument('--list', '-l', action='store_true',
                        help='List available options')
-    parser.add_argument('--batch', '-b', action='store_true',
-                       help='Generate templates for all industries')
+    parser.add_argument('--batch', '--all', '-b', action='store_true',
+                       help='Generate templates for all industries and types')
+    parser.add_argument('--output-dir', '-d',
+                       help='Directory for --batch templates (default: current directory)')
+    parser.add_argument('--workers', '-w', type=int,
+                       help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--packs', 
+                       help='Template pack directory (default: templates/packs)')
     
     args = parser.parse_args()
     
-    generator = ProfileTemplateGenerator()
+    generator = ProfileTemplateGenerator(args.packs)
+    options = generator.list_available_options()
     
     if args.list:
-        options = generator.list_available_options()
         print("Available template types:")
         for template_type in options['template_types']:
             print(f"  - {template_type}")
@@ -444,17 +385,30 @@ def main():
         return
     
     if args.batch:
-        # Generate templates for all industries and types
-        templates = generator.generate_multiple_templates(
-            industries=list(generator.industry_specific.keys()),
-            template_types=['minimal', 'standard', 'comprehensive']
-        )
+        # Generate templates for all industries and types, saving each as it completes
+        failed = 0
+        for result in generator.write_templates(
+            industries=options['industries'],
+            template_types=options['template_types'],
+            output_dir=args.output_dir,
+            include_examples=args.examples,
+            workers=args.workers
+        ):
+            if result['error']:
+                failed += 1
+                print(f"❌ {result['file']}: {result['error']}")
+            else:
+                print(f"Generated: {result['file']}")
         
-        for name, template in templates.items():
-            filename = f"template_{name}.json"
-            generator.save_template(template, filename)
-            print(f"Generated: {filename}")
+        if failed:
+            sys.exit(1)
     else:
+        # Only a single template uses --type/--industry, so only it checks them
+        if args.type not in options['template_types']:
+            parser.error(f"unknown template type '{args.type}' (choose from {', '.join(options['template_types'])})")
+        if args.industry and args.industry not in options['industries']:
+            parser.error(f"unknown industry '{args.industry}' (choose from {', '.join(options['industries'])})")
+        
         # Generate single template
         template = generator.generate_template(
             template_type=args.type,
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Job Autofill System - Template Packs
+Lazily loaded, on-disk template data for the template generator
+"""
+
+import json
+import os
+import time
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Packs shipped next to the other JSON templates
+DEFAULT_PACK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'templates', 'packs')
+
+MANIFEST_NAME = 'manifest.json'
+
+# Seconds a file's stamp is trusted before it is checked on disk again
+CHECK_INTERVAL = 1.0
+
+# Parsed pack files kept in memory, least recently used dropped first
+MAX_CACHED_PACKS = 64
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) identifying a file version, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class TemplatePackStore:
+    """
+    Directory of template packs described by a small manifest
+    
+    The manifest maps each section ('templateTypes', 'industries') to pack
+    files relative to the pack directory. Nothing is read until needed, and
+    the manifest and every pack are re-read only when their mtime or size
+    changes. Files are checked at most once per check_interval seconds, and
+    only the most recently used packs stay parsed in memory.
+    """
+
+    def __init__(self, pack_dir: str = None, check_interval: float = CHECK_INTERVAL):
+        self.pack_dir = os.path.abspath(pack_dir or DEFAULT_PACK_DIR)
+        self.manifest_file = os.path.join(self.pack_dir, MANIFEST_NAME)
+        self.check_interval = check_interval
+        self._manifest = None
+        self._manifest_stamp = None
+        self._paths = {}
+        self._packs = {}
+        self._stamps = {}
+
+    def stamp(self, path: str) -> Optional[Tuple[int, int]]:
+        """Return the file stamp of path, re-checking the disk once per check_interval"""
+        now = time.monotonic()
+        checked = self._stamps.get(path)
+        if checked is not None and now - checked[0] < self.check_interval:
+            return checked[1]
+        
+        stamp = file_stamp(path)
+        self._stamps[path] = (now, stamp)
+        return stamp
+
+    def manifest(self) -> Dict[str, Any]:
+        """Return the manifest, reloading it if the file changed"""
+        stamp = self.stamp(self.manifest_file)
+        if stamp is None:
+            raise FileNotFoundError(f"Template pack manifest not found: {self.manifest_file}")
+        
+        if stamp != self._manifest_stamp:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                self._manifest = json.load(f)
+            self._manifest_stamp = stamp
+            self._paths = {}
+        return self._manifest
+
+    def names(self, section: str) -> List[str]:
+        """List the pack names of a manifest section"""
+        return list(self.manifest().get(section, {}))
+
+    def path(self, section: str, name: str) -> Optional[str]:
+        """Return the pack file for a name, or None if the manifest does not list it"""
+        manifest = self.manifest()
+        paths = self._paths.get(section)
+        if paths is None:
+            paths = self._paths[section] = {
+                entry: os.path.join(self.pack_dir, relative)
+                for entry, relative in manifest.get(section, {}).items()
+            }
+        return paths.get(name)
+
+    def load(self, path: str) -> Tuple[Tuple[int, int], Any]:
+        """
+        Load a pack file, reusing the parsed data while the file is unchanged
+        
+        Returns:
+            (stamp, data) where stamp changes whenever the file does
+        """
+        stamp = self.stamp(path)
+        if stamp is None:
+            raise FileNotFoundError(f"Template pack not found: {path}")
+        
+        cached = self._packs.pop(path, None)
+        if cached is None or cached[0] != stamp:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = (stamp, json.load(f))
+        
+        # Re-insert so dict order tracks recency
+        self._packs[path] = cached
+        if len(self._packs) > MAX_CACHED_PACKS:
+            del self._packs[next(iter(self._packs))]
+        return cached
+
+
+class TemplatePack(MutableMapping):
+    """
+    Dict-like view of one manifest section, loading each entry on first use
+    
+    Keys come from the manifest alone. Assigned entries are kept in memory
+    and shadow the files on disk; deleting an entry hides it for this view.
+    """
+
+    def __init__(self, store: TemplatePackStore, section: str):
+        self.store = store
+        self.section = section
+        self._overrides = {}
+        self._hidden = set()
+        self._generation = 0
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._overrides:
+            return self._overrides[name]
+        path = None if name in self._hidden else self.store.path(self.section, name)
+        if path is None:
+            raise KeyError(name)
+        return self.store.load(path)[1]
+
+    def __setitem__(self, name: str, value: Any):
+        self._overrides[name] = value
+        self._hidden.discard(name)
+        self._generation += 1
+
+    def __delitem__(self, name: str):
+        if name not in self:
+            raise KeyError(name)
+        self._overrides.pop(name, None)
+        self._hidden.add(name)
+        self._generation += 1
+
+    def __contains__(self, name: object) -> bool:
+        if name in self._overrides:
+            return True
+        return name not in self._hidden and self.store.path(self.section, name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        names = [name for name in self.store.names(self.section) if name not in self._hidden]
+        names.extend(name for name in self._overrides if name not in names)
+        return iter(names)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def stamp(self, name: str) -> Any:
+        """
+        Return a value that changes whenever the entry for name does
+        
+        Covers edits to the pack file and assignments through this view, but
+        not in-place changes to the returned data.
+        """
+        if name in self._overrides:
+            return self._generation
+        path = None if name in self._hidden else self.store.path(self.section, name)
+        if path is None:
+            return self._generation, None
+        return self._generation, self.store.stamp(path)